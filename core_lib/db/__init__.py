@@ -0,0 +1,7 @@
+from .engine import EngineSettings, build_engine, build_session_factory
+
+__all__ = [
+    "EngineSettings",
+    "build_engine",
+    "build_session_factory",
+]
@@ -1,15 +1,21 @@
 from .project_create_args import ProjectCreateArgs
 from .project_update_args import ProjectUpdateArgs
 from .project import Project
+from .partial_project import PartialProject
+from .project_page import ProjectPage
 from .user import User
 from .user_create_args import UserCreateArgs
 from .user_update_args import UserUpdateArgs
+from .user_with_projects import UserWithProjects
 
 __all__ = [
     "ProjectCreateArgs",
     "ProjectUpdateArgs",
     "Project",
+    "PartialProject",
+    "ProjectPage",
     "User",
     "UserCreateArgs",
     "UserUpdateArgs",
+    "UserWithProjects",
 ]
\ No newline at end of file
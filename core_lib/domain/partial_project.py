@@ -0,0 +1,26 @@
+from typing import Any, Dict, Iterable, Optional
+from pydantic import BaseModel, ConfigDict
+
+class PartialProject(BaseModel):
+    """A Project loaded with only some of its fields; the others are None."""
+
+    id: str
+    repo_url: Optional[str] = None
+    environment_variables: Optional[Dict[str, Any]] = None
+    status: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_row(cls, row: Any, fields: Iterable[str]) -> "PartialProject":
+        """
+        Build a PartialProject from a trusted database row without validating it.
+        :param row: A Row or Project exposing the loaded columns as attributes.
+        :param fields: The fields to copy from the row; they must include the ID.
+        """
+        values = {name: getattr(row, name) for name in fields}
+
+        if "status" in values:
+            values["status"] = getattr(values["status"], "value", values["status"])
+
+        return cls.model_construct(**values)
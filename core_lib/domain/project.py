@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 from pydantic import BaseModel, ConfigDict
 
 class Project(BaseModel):
@@ -10,3 +10,19 @@ class Project(BaseModel):
     status: str
 
     model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "Project":
+        """
+        Build a Project from a trusted database row without validating it.
+        :param row: A Row or ORM instance exposing the Project's columns as attributes,
+            or a mapping of column values keyed by field name.
+        """
+        if isinstance(row, Mapping):
+            values = {name: row[name] for name in cls.model_fields}
+        else:
+            values = {name: getattr(row, name) for name in cls.model_fields}
+
+        values["status"] = getattr(values["status"], "value", values["status"])
+
+        return cls.model_construct(**values)
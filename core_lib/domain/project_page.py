@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from .project import Project
+
+class ProjectPage(BaseModel):
+    '''A page of projects and the cursor for the next one'''
+    items: list[Project]
+    next_cursor: Optional[str] = None
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from pydantic import BaseModel, ConfigDict, EmailStr
 
 class User(BaseModel):
@@ -15,3 +15,11 @@ class User(BaseModel):
     oauth_token_expires_at: Optional[datetime]
 
     model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "User":
+        """
+        Build a User from a trusted database row without validating it.
+        :param row: A Row or ORM instance exposing the User's columns as attributes.
+        """
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
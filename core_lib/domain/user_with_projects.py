@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from .project import Project
+from .user import User
+
+class UserWithProjects(BaseModel):
+    '''A user and their projects, loaded together'''
+    user: User
+    projects: list[Project]
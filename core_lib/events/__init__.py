@@ -1,10 +1,30 @@
 from .created_event import ProjectCreatedEvent
 from .event import Event
+from .raw_event import RawEvent
+from .codec import Codec, EventSerializer, JsonCodec, MsgpackCodec, OrjsonCodec, codec_for, default_codec
+from .compression import CompressionStats, Compressor, decode_message_body, decompress_body
+from .registry import EventRegistry, default_registry
 from .emitter import EventEmitter, RabbitMQFanOutEventEmitter
+from .subscriber import RabbitMQFanOutEventSubscriber
 
 __all__ = [
+    "Codec",
+    "CompressionStats",
+    "Compressor",
     "Event",
     "EventEmitter",
+    "EventRegistry",
+    "EventSerializer",
+    "JsonCodec",
+    "MsgpackCodec",
+    "OrjsonCodec",
     "ProjectCreatedEvent",
     "RabbitMQFanOutEventEmitter",
+    "RabbitMQFanOutEventSubscriber",
+    "RawEvent",
+    "codec_for",
+    "decode_message_body",
+    "decompress_body",
+    "default_codec",
+    "default_registry",
 ]
@@ -0,0 +1,136 @@
+"""Event codecs and the serializer used by the emitters."""
+
+from abc import ABC, abstractmethod
+import json
+from typing import Any, Awaitable, Callable
+from core_lib.events.event import Event
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+class Codec(ABC):
+    """Abstract base class for event payload codecs.
+
+    A codec turns an event's dictionary into message bytes and back, and names
+    the content type and encoding put on the message. Text formats carry their
+    charset in the content type; the content encoding is left for compression.
+    """
+
+    content_type: str
+    content_encoding: str | None = None
+
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        """Encode a payload to bytes."""
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        """Decode bytes back into a payload."""
+
+class JsonCodec(Codec):
+    """Standard library JSON codec."""
+
+    content_type = "application/json; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def encode(self, data: Any) -> bytes:
+        return self._encoder.encode(data).encode()
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+class OrjsonCodec(Codec):
+    """JSON codec backed by orjson."""
+
+    content_type = "application/json; charset=utf-8"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the 'orjson' package")
+
+    def encode(self, data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def decode(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+class MsgpackCodec(Codec):
+    """Binary MessagePack codec."""
+
+    content_type = "application/msgpack"
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("MsgpackCodec requires the 'msgpack' package")
+
+    def encode(self, data: Any) -> bytes:
+        return msgpack.packb(data)
+
+    def decode(self, body: bytes) -> Any:
+        return msgpack.unpackb(body)
+
+def default_codec() -> Codec:
+    """The fastest JSON codec available: orjson when installed, else the standard library."""
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+def codec_for(content_type: str | None) -> Codec:
+    """
+    Pick a codec able to decode a message with the given content type.
+    Messages without a content type are assumed to be JSON; parameters such
+    as the charset are ignored.
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+
+    if media_type == MsgpackCodec.content_type:
+        return MsgpackCodec()
+
+    if media_type in ("", "application/json"):
+        return default_codec()
+
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+class EventSerializer:
+    """Serializes events straight to message bytes.
+
+    The encoder for each event class is resolved once and cached. Events that
+    override Event.to_json keep their custom output when a JSON codec is used.
+    """
+
+    def __init__(self, codec: Codec | None = None) -> None:
+        self.codec = codec or default_codec()
+        self._encoders: dict[type[Event], Callable[[Event], Awaitable[bytes]]] = {}
+
+    async def serialize(self, event: Event) -> bytes:
+        """Encode an event's payload with the serializer's codec."""
+
+        encoder = self._encoders.get(type(event))
+
+        if encoder is None:
+            encoder = self._encoders[type(event)] = self._resolve_encoder(type(event))
+
+        return await encoder(event)
+
+    def _resolve_encoder(self, event_type: type[Event]) -> Callable[[Event], Awaitable[bytes]]:
+        """Choose how events of the given class are encoded."""
+
+        if event_type.to_json is not Event.to_json and self.codec.content_type == JsonCodec.content_type:
+            async def encode_custom_json(event: Event) -> bytes:
+                return (await event.to_json()).encode()
+
+            return encode_custom_json
+
+        encode = self.codec.encode
+
+        async def encode_dict(event: Event) -> bytes:
+            return encode(await event.to_dict())
+
+        return encode_dict
@@ -0,0 +1,90 @@
+"""Message body compression for large events."""
+
+from dataclasses import dataclass
+from typing import Any
+import zlib
+from core_lib.events.codec import codec_for
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+@dataclass
+class CompressionStats:
+    '''Counters for compressed message bodies, in bytes'''
+    messages_compressed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes kept off the wire by compression."""
+        return self.bytes_in - self.bytes_out
+
+class Compressor:
+    """Compresses message bodies at or above a size threshold.
+
+    Uses zstd when the 'zstandard' package is installed and zlib otherwise,
+    unless an algorithm is given. Bodies that do not shrink are sent as is.
+    """
+
+    def __init__(self, threshold: int = 8 * 1024, algorithm: str | None = None, level: int | None = None) -> None:
+        if algorithm is None:
+            algorithm = ZSTD if zstandard is not None else ZLIB
+
+        if algorithm == ZSTD and zstandard is None:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+
+        if algorithm not in (ZLIB, ZSTD):
+            raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+
+        self.threshold = threshold
+        self.algorithm = algorithm
+        self.stats = CompressionStats()
+
+        if algorithm == ZSTD:
+            self._compress = zstandard.ZstdCompressor(level=level if level is not None else 3).compress
+        else:
+            zlib_level = level if level is not None else 6
+            self._compress = lambda body: zlib.compress(body, zlib_level)
+
+    def compress(self, body: bytes) -> tuple[bytes, str | None]:
+        """
+        Compress a body if it is large enough to be worth it.
+        :return: The body to send and its content encoding, or None if left uncompressed.
+        """
+        if len(body) < self.threshold:
+            return body, None
+
+        compressed = self._compress(body)
+
+        if len(compressed) >= len(body):
+            return body, None
+
+        self.stats.messages_compressed += 1
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(compressed)
+
+        return compressed, self.algorithm
+
+def decompress_body(body: bytes, content_encoding: str | None) -> bytes:
+    """Undo the compression named by a message's content encoding."""
+
+    if content_encoding == ZLIB:
+        return zlib.decompress(body)
+
+    if content_encoding == ZSTD:
+        if zstandard is None:
+            raise ImportError("zstd decompression requires the 'zstandard' package")
+
+        return zstandard.ZstdDecompressor().decompress(body)
+
+    return body
+
+def decode_message_body(body: bytes, content_type: str | None, content_encoding: str | None) -> Any:
+    """Decompress and decode a message body published by the fanout emitter."""
+    return codec_for(content_type).decode(decompress_body(body, content_encoding))
@@ -10,11 +10,21 @@ class ProjectCreatedEvent(Event):
     def __init__(self, project_id: str) -> None:
         self._project_id = project_id
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectCreatedEvent":
+        """Rebuild the event from its dictionary form."""
+        return cls(project_id=data["project_id"])
+
     @property
     def event_type(self) -> str:
         """The name of the event."""
         return "project.created"
 
+    @property
+    def project_id(self) -> str:
+        """The ID of the created project."""
+        return self._project_id
+
     async def to_dict(self) -> dict:
         """Convert the event to a dictionary."""
         return {
@@ -1,9 +1,22 @@
 from .event_emitter import EventEmitter
+from .channel_pool import ChannelPool
+from .confirms import ConfirmStats, ConfirmTracker, PublishNotConfirmedError
 from .rabbitmq_fanout_emitter import RabbitMQFanOutEventEmitter
 from .noop import NoopEventEmitter
+from .buffered import BufferedEventEmitter, OverflowPolicy
+from .in_process import InProcessEventEmitter
+from .instrumented import InstrumentedEventEmitter
 
 __all__ = [
+    "BufferedEventEmitter",
+    "ChannelPool",
+    "ConfirmStats",
+    "ConfirmTracker",
     "EventEmitter",
+    "InProcessEventEmitter",
+    "InstrumentedEventEmitter",
     "RabbitMQFanOutEventEmitter",
     "NoopEventEmitter",
+    "OverflowPolicy",
+    "PublishNotConfirmedError",
 ]
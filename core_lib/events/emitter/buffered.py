@@ -0,0 +1,173 @@
+"""Buffered Event Emitter
+Queues events in memory and publishes them in batches from a background task."""
+
+import asyncio
+import enum
+import logging
+from typing import Iterable
+from core_lib.events import Event
+from . import EventEmitter
+
+logger = logging.getLogger(__name__)
+
+class OverflowPolicy(enum.Enum):
+    '''What to do when the buffer is full'''
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+
+async def put_with_policy(queue: asyncio.Queue, item: object, policy: OverflowPolicy) -> int:
+    """
+    Put an item on a bounded queue, applying the overflow policy when it is full.
+    :return: The number of items dropped to make room.
+    :raises asyncio.QueueFull: If the queue is full and the policy is RAISE.
+    """
+    if policy is OverflowPolicy.BLOCK:
+        await queue.put(item)
+        return 0
+
+    return put_nowait_with_policy(queue, item, policy)
+
+def put_nowait_with_policy(queue: asyncio.Queue, item: object, policy: OverflowPolicy) -> int:
+    """
+    Put an item on a bounded queue without waiting, applying the overflow policy when it is full.
+    :return: The number of items dropped to make room.
+    :raises asyncio.QueueFull: If the queue is full and the policy is BLOCK or RAISE.
+    """
+    dropped = 0
+
+    if policy is OverflowPolicy.DROP_OLDEST:
+        while queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            dropped += 1
+
+    queue.put_nowait(item)
+    return dropped
+
+class BufferedEventEmitter(EventEmitter):
+    """Event emitter that hands events to a wrapped emitter in the background.
+
+    emit() only enqueues the event. A background task drains the queue and
+    forwards events to the wrapped emitter's emit_many once batch_size events
+    are waiting or linger seconds have passed since the first one arrived.
+    """
+
+    def __init__(
+        self,
+        emitter: EventEmitter,
+        max_size: int = 10_000,
+        batch_size: int = 100,
+        linger: float = 0.05,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        self.emitter = emitter
+        self.batch_size = batch_size
+        self.linger = linger
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_size)
+        self._wakeup = asyncio.Event()
+        self._flush_waiters = 0
+        self._needed = batch_size
+        self._worker: asyncio.Task | None = None
+        self._closed = False
+
+    async def emit(self, event: Event) -> None:
+        """Queue an event for publishing.
+
+        Raises:
+            asyncio.QueueFull: If the buffer is full and the policy is RAISE.
+            RuntimeError: If the emitter has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("BufferedEventEmitter is closed")
+
+        self._ensure_worker()
+
+        self.dropped += await put_with_policy(self._queue, event, self.overflow_policy)
+
+        if self._queue.qsize() >= self._needed:
+            self._wakeup.set()
+
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Queue several events for publishing."""
+        for event in events:
+            await self.emit(event)
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been handed to the wrapped emitter."""
+
+        self._flush_waiters += 1
+        self._wakeup.set()
+
+        try:
+            await self._queue.join()
+        finally:
+            self._flush_waiters -= 1
+
+    async def close(self) -> None:
+        """Stop accepting events, flush the buffer and stop the background task."""
+
+        self._closed = True
+        await self.flush()
+
+        if self._worker is not None:
+            self._worker.cancel()
+
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+            self._worker = None
+
+    def _ensure_worker(self) -> None:
+        """Start the background task on first use."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until cancelled."""
+
+        while True:
+            batch = await self._next_batch()
+
+            try:
+                await self.emitter.emit_many(batch)
+            except Exception:
+                logger.exception("Failed to emit a batch of %d buffered events", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> list[Event]:
+        """Collect events until the batch is full, the linger expires or a flush is requested."""
+
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.linger
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+
+            if remaining <= 0 or self._flush_waiters:
+                break
+
+            self._needed = self.batch_size - len(batch)
+            self._wakeup.clear()
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+        self._needed = self.batch_size
+        return batch
@@ -0,0 +1,81 @@
+"""Channel Pool
+A small bounded pool of AMQP channels shared by the RabbitMQ emitters."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+import aio_pika
+
+class ChannelPool:
+    """Bounded pool of reusable channels on a single RabbitMQ connection.
+
+    Channels are opened lazily, handed out one borrower at a time and put back
+    once the borrower is done with them. Channels that were closed by the broker
+    are discarded and replaced with fresh ones on the next acquire.
+    """
+
+    def __init__(
+        self,
+        connection: aio_pika.RobustConnection,
+        max_size: int = 8,
+        on_discard: Callable[[aio_pika.abc.AbstractChannel], None] | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.connection = connection
+        self.max_size = max_size
+        self.on_discard = on_discard
+
+        self._idle: list[aio_pika.abc.AbstractChannel] = []
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aio_pika.abc.AbstractChannel]:
+        """Borrow a live channel from the pool for the duration of the block."""
+
+        async with self._semaphore:
+            channel = await self._take()
+
+            try:
+                yield channel
+            finally:
+                self._give_back(channel)
+
+    async def close(self) -> None:
+        """Close every idle channel held by the pool."""
+
+        idle, self._idle = self._idle, []
+
+        for channel in idle:
+            self._discard(channel)
+
+            if not channel.is_closed:
+                await channel.close()
+
+    async def _take(self) -> aio_pika.abc.AbstractChannel:
+        """Pop a live idle channel, or open a new one."""
+
+        while self._idle:
+            channel = self._idle.pop()
+
+            if not channel.is_closed:
+                return channel
+
+            self._discard(channel)
+
+        return await self.connection.channel()
+
+    def _give_back(self, channel: aio_pika.abc.AbstractChannel) -> None:
+        """Return a channel to the idle list unless it died while borrowed."""
+
+        if channel.is_closed:
+            self._discard(channel)
+        else:
+            self._idle.append(channel)
+
+    def _discard(self, channel: aio_pika.abc.AbstractChannel) -> None:
+        """Forget a channel and notify the owner."""
+
+        if self.on_discard is not None:
+            self.on_discard(channel)
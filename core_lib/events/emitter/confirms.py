@@ -0,0 +1,120 @@
+"""Publisher Confirms
+Tracks a bounded window of publishes waiting for broker confirmation."""
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from core_lib.events import Event
+
+NackCallback = Callable[[Event, BaseException], Awaitable[Any] | Any]
+
+@dataclass
+class ConfirmStats:
+    '''Publisher confirm counters and latencies, in seconds'''
+    confirmed: int = 0
+    nacked: int = 0
+    timed_out: int = 0
+    in_flight: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean time between publish and confirm for confirmed messages."""
+        return self.total_latency / self.confirmed if self.confirmed else 0.0
+
+class PublishNotConfirmedError(Exception):
+    """Raised when published events were nacked or not confirmed in time."""
+
+    def __init__(self, failures: list[tuple[Event, BaseException]]) -> None:
+        super().__init__(f"{len(failures)} event(s) were not confirmed by the broker")
+        self.failures = failures
+
+class ConfirmTracker:
+    """Keeps up to `window` publishes awaiting confirmation at once.
+
+    track() schedules a publish and returns as soon as there is room in the
+    window, so callers only block when the broker falls behind. Failed
+    publishes are passed to on_nack when given; otherwise they are collected
+    and raised as a PublishNotConfirmedError from the next track() or wait().
+    """
+
+    def __init__(
+        self,
+        window: int = 256,
+        timeout: float | None = None,
+        on_nack: NackCallback | None = None,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.window = window
+        self.timeout = timeout
+        self.on_nack = on_nack
+        self.stats = ConfirmStats()
+
+        self._semaphore = asyncio.Semaphore(window)
+        self._pending: set[asyncio.Task] = set()
+        self._failures: list[tuple[Event, BaseException]] = []
+
+    async def track(self, event: Event, publish: Callable[[], Awaitable[Any]]) -> None:
+        """Start a publish once there is room in the window."""
+
+        self._raise_failures()
+        await self._semaphore.acquire()
+
+        self.stats.in_flight += 1
+        task = asyncio.get_running_loop().create_task(self._confirm(event, publish))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def wait(self) -> None:
+        """Wait for every in-flight publish to be confirmed or failed."""
+
+        while self._pending:
+            await asyncio.gather(*self._pending)
+
+        self._raise_failures()
+
+    async def _confirm(self, event: Event, publish: Callable[[], Awaitable[Any]]) -> None:
+        """Run one publish and record its outcome."""
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        try:
+            await asyncio.wait_for(publish(), self.timeout)
+        except asyncio.TimeoutError as e:
+            self.stats.timed_out += 1
+            await self._fail(event, e)
+        except Exception as e:
+            self.stats.nacked += 1
+            await self._fail(event, e)
+        else:
+            latency = loop.time() - started
+            self.stats.confirmed += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+        finally:
+            self.stats.in_flight -= 1
+            self._semaphore.release()
+
+    async def _fail(self, event: Event, error: BaseException) -> None:
+        """Hand a failed publish to the callback, or keep it for the caller."""
+
+        if self.on_nack is None:
+            self._failures.append((event, error))
+            return
+
+        result = self.on_nack(event, error)
+
+        if inspect.isawaitable(result):
+            await result
+
+    def _raise_failures(self) -> None:
+        """Raise collected failures, if any."""
+
+        if self._failures:
+            failures, self._failures = self._failures, []
+            raise PublishNotConfirmedError(failures)
@@ -2,6 +2,7 @@
 This module defines an abstract base class for event emitters.'''
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 from core_lib.events import Event
 
 class EventEmitter(ABC):
@@ -20,3 +21,15 @@ class EventEmitter(ABC):
             *args: Positional arguments to pass to the listeners.
             **kwargs: Keyword arguments to pass to the listeners.
         """
+
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit several events.
+
+        The default implementation emits them one at a time, in order.
+        Implementations that can pipeline publishes should override it.
+
+        Args:
+            events (Iterable[Event]): The events to emit.
+        """
+        for event in events:
+            await self.emit(event)
@@ -0,0 +1,169 @@
+"""In-Process Event Emitter
+Delivers events to subscribers living in the same process."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable
+from core_lib.events import Event
+from . import EventEmitter
+from .buffered import OverflowPolicy, put_nowait_with_policy, put_with_policy
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Event], Awaitable[None]]
+
+class _Subscription:
+    """A handler with its own bounded queue and worker task."""
+
+    def __init__(self, handler: EventHandler, max_queue_size: int, overflow_policy: OverflowPolicy) -> None:
+        self.handler = handler
+        self.overflow_policy = overflow_policy
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self.worker: asyncio.Task | None = None
+
+    def offer(self, event: Event) -> bool:
+        """
+        Queue an event for the handler without waiting, starting the worker on first use.
+        :return: False if the queue is full and the policy is BLOCK, so put() must wait for room.
+        """
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.get_running_loop().create_task(self._run())
+
+        if self.overflow_policy is OverflowPolicy.BLOCK and self.queue.full():
+            return False
+
+        self.dropped += put_nowait_with_policy(self.queue, event, self.overflow_policy)
+        return True
+
+    async def put(self, event: Event) -> None:
+        """Queue an event for the handler, waiting for room under the BLOCK policy."""
+        if not self.offer(event):
+            self.dropped += await put_with_policy(self.queue, event, self.overflow_policy)
+
+    async def _run(self) -> None:
+        """Feed queued events to the handler until cancelled."""
+        while True:
+            event = await self.queue.get()
+
+            try:
+                await self.handler(event)
+            except Exception:
+                logger.exception("In-process handler failed for %s", event.event_type)
+            finally:
+                self.queue.task_done()
+
+class InProcessEventEmitter(EventEmitter):
+    """Event emitter that dispatches events to in-process subscribers.
+
+    Event objects are handed to handlers as is, without serialization. Every
+    subscriber has its own bounded queue and worker, so a slow handler only
+    backs up its own queue. Full queues drop their oldest event by default;
+    with the BLOCK policy the emitter waits for room, but only after every
+    other subscriber has been given the event. A full RAISE subscriber makes
+    emit raise QueueFull, after every other subscriber and the tee got the event.
+    When tee is given, every event is also forwarded to that emitter, e.g. to
+    keep publishing to RabbitMQ.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        tee: EventEmitter | None = None,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.tee = tee
+
+        self._subscriptions: dict[str, list[_Subscription]] = {}
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        max_queue_size: int | None = None,
+        overflow_policy: OverflowPolicy | None = None,
+    ) -> None:
+        """Register a handler for an event type."""
+        self._subscriptions.setdefault(event_type, []).append(_Subscription(
+            handler,
+            max_queue_size if max_queue_size is not None else self.max_queue_size,
+            overflow_policy or self.overflow_policy,
+        ))
+
+    async def emit(self, event: Event) -> None:
+        """Queue an event for every subscriber of its type."""
+
+        overflow = await self._deliver(event)
+
+        if self.tee is not None:
+            await self.tee.emit(event)
+
+        if overflow is not None:
+            raise overflow
+
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Queue several events for their subscribers."""
+
+        events = list(events)
+        overflows = [await self._deliver(event) for event in events]
+
+        if self.tee is not None:
+            await self.tee.emit_many(events)
+
+        for overflow in overflows:
+            if overflow is not None:
+                raise overflow
+
+    @property
+    def dropped(self) -> int:
+        """Events dropped by subscribers with the DROP_OLDEST policy."""
+        return sum(s.dropped for subscriptions in self._subscriptions.values() for s in subscriptions)
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been handled."""
+        await asyncio.gather(*(s.queue.join() for s in self._all_subscriptions()))
+
+    async def close(self) -> None:
+        """Handle queued events and stop the subscriber workers."""
+
+        await self.flush()
+
+        for subscription in self._all_subscriptions():
+            if subscription.worker is not None:
+                subscription.worker.cancel()
+
+                try:
+                    await subscription.worker
+                except asyncio.CancelledError:
+                    pass
+
+                subscription.worker = None
+
+    def _all_subscriptions(self) -> list[_Subscription]:
+        """Every subscription, across event types."""
+        return [s for subscriptions in self._subscriptions.values() for s in subscriptions]
+
+    async def _deliver(self, event: Event) -> asyncio.QueueFull | None:
+        """
+        Queue an event for each of its subscribers without waiting on any other.
+        Subscribers with room get the event at once; only then does the emitter
+        wait for the full queues of BLOCK subscribers, all at the same time.
+        :return: The overflow of a full RAISE subscriber, for the caller to raise
+            once every other subscriber and the tee have the event.
+        """
+        blocked = []
+        overflow = None
+
+        for subscription in self._subscriptions.get(event.event_type, ()):
+            try:
+                if not subscription.offer(event):
+                    blocked.append(subscription)
+            except asyncio.QueueFull as e:
+                overflow = overflow or e
+
+        if blocked:
+            await asyncio.gather(*(subscription.put(event) for subscription in blocked))
+
+        return overflow
@@ -0,0 +1,71 @@
+"""Instrumented Event Emitter
+Records publish latencies of a wrapped emitter in a MetricsRegistry."""
+
+import time
+from typing import Iterable
+from core_lib.events import Event
+from core_lib.metrics import MetricsRegistry, default_registry
+from . import EventEmitter
+
+class InstrumentedEventEmitter(EventEmitter):
+    """Event emitter that times the publishes of a wrapped emitter.
+
+    emit() latencies are recorded per event type; emit_many() records the
+    latency of the whole batch and counts its events per type. Events go
+    straight through when the registry is disabled.
+    """
+
+    def __init__(self, emitter: EventEmitter, registry: MetricsRegistry = default_registry) -> None:
+        self.emitter = emitter
+        self.registry = registry
+
+    async def emit(self, event: Event) -> None:
+        """Emit an event through the wrapped emitter and record how long it took.
+
+        Args:
+            event (Event): The event to emit.
+        """
+        if not self.registry.enabled:
+            await self.emitter.emit(event)
+            return
+
+        labels = {"event_type": event.event_type}
+        started = time.perf_counter()
+
+        try:
+            await self.emitter.emit(event)
+        except Exception:
+            self.registry.counter("event_emit_errors_total", labels, "Event publishes that raised.").inc()
+            raise
+        finally:
+            self.registry.histogram(
+                "event_emit_duration_seconds", labels, "Time spent publishing single events."
+            ).observe(time.perf_counter() - started)
+
+        self.registry.counter("events_emitted_total", labels, "Events published.").inc()
+
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit several events through the wrapped emitter and record how long the batch took.
+
+        Args:
+            events (Iterable[Event]): The events to emit.
+        """
+        if not self.registry.enabled:
+            await self.emitter.emit_many(events)
+            return
+
+        events = list(events)
+        started = time.perf_counter()
+
+        try:
+            await self.emitter.emit_many(events)
+        except Exception:
+            self.registry.counter("event_emit_batch_errors_total", description="Event batch publishes that raised.").inc()
+            raise
+        finally:
+            self.registry.histogram(
+                "event_emit_batch_duration_seconds", description="Time spent publishing batches of events."
+            ).observe(time.perf_counter() - started)
+
+        for event in events:
+            self.registry.counter("events_emitted_total", {"event_type": event.event_type}, "Events published.").inc()
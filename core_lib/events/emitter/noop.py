@@ -1,3 +1,4 @@
+from typing import Iterable
 from core_lib.events import Event
 from . import EventEmitter
 
@@ -16,6 +17,14 @@ class NoopEventEmitter(EventEmitter):
         """
         self.events.append(event)
 
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit several events.
+
+        Args:
+            events (Iterable[Event]): The events to emit.
+        """
+        self.events.extend(events)
+
     async def get_events(self) -> list[Event]:
         """Get the emitted events.
 
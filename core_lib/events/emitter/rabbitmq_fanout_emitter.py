@@ -1,34 +1,159 @@
 """RabbitMQ Fanout Event Emitter"""
 
+import asyncio
+from typing import Iterable
 import aio_pika
-from core_lib.events import Event
+from core_lib.events import Codec, Compressor, Event, EventSerializer
 from . import EventEmitter
+from .channel_pool import ChannelPool
+from .confirms import ConfirmStats, ConfirmTracker, NackCallback
 
 class RabbitMQFanOutEventEmitter(EventEmitter):
     """RabbitMQ implementation of the EventEmitter interface.
 
     This class provides methods for emitting events to RabbitMQ queues.
+    Channels are borrowed from a bounded ChannelPool instead of being opened
+    per event, and declared exchanges are cached per channel. emit_many
+    pipelines up to publish_concurrency publishes per exchange. Message bodies
+    are encoded with the given codec, orjson or the standard library JSON codec
+    by default. With a Compressor, bodies above its threshold are compressed
+    and the content encoding names the algorithm.
+
+    Passing confirm_window enables confirm mode: emit() returns once the publish
+    is in flight and up to confirm_window publishes await broker confirmation
+    concurrently. Nacked or timed out publishes go to on_nack, or are raised as
+    PublishNotConfirmedError from a later emit() or wait_for_confirms().
+
+    In confirm mode a channel goes back to the pool while its publishes still
+    await confirmation, so later emits may publish on it too. This is safe:
+    the AMQP client writes each message's frames under the channel lock and
+    matches confirms by delivery tag, so publishes on one channel never
+    interleave. The pool bounds the channels in use, confirm_window bounds the
+    publishes in flight across them, and close() waits for those confirms
+    before closing the channels.
     """
-    def __init__(self, connection: aio_pika.RobustConnection) -> None:
+    def __init__(
+        self,
+        connection: aio_pika.RobustConnection,
+        pool_size: int = 8,
+        publish_concurrency: int = 64,
+        confirm_window: int | None = None,
+        confirm_timeout: float | None = None,
+        on_nack: NackCallback | None = None,
+        codec: Codec | None = None,
+        compressor: Compressor | None = None,
+    ) -> None:
         self.connection = connection
-        self.exchange_cache = {}
+        self.serializer = EventSerializer(codec)
+        self.compressor = compressor
+        self.publish_concurrency = publish_concurrency
+        self.confirms = (
+            ConfirmTracker(confirm_window, timeout=confirm_timeout, on_nack=on_nack)
+            if confirm_window is not None else None
+        )
+        self.exchange_cache: dict[aio_pika.abc.AbstractChannel, dict[str, aio_pika.abc.AbstractExchange]] = {}
+        self.channel_pool = ChannelPool(connection, max_size=pool_size, on_discard=self._forget_channel)
 
     async def emit(self, event: Event) -> None:
         """Emit an event to RabbitMQ."""
 
-        channel = await self.connection.channel()
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._get_exchange(channel, event.event_type)
+            await self._publish(exchange, event)
+
+    async def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit several events, pipelining the publishes per exchange."""
+
+        groups: dict[str, list[Event]] = {}
+
+        for event in events:
+            groups.setdefault(event.event_type, []).append(event)
+
+        await asyncio.gather(*(
+            self._publish_group(event_type, group) for event_type, group in groups.items()
+        ))
+
+    async def wait_for_confirms(self) -> None:
+        """Wait for in-flight publishes to be confirmed when confirm mode is on."""
+        if self.confirms is not None:
+            await self.confirms.wait()
+
+    @property
+    def confirm_stats(self) -> ConfirmStats | None:
+        """Confirm counters and latencies, or None outside confirm mode."""
+        return self.confirms.stats if self.confirms is not None else None
+
+    async def close(self) -> None:
+        """Wait for outstanding confirms and close the pooled channels."""
+        try:
+            await self.wait_for_confirms()
+        finally:
+            await self.channel_pool.close()
+
+    async def _publish_group(self, event_type: str, events: list[Event]) -> None:
+        """Publish events sharing an exchange on one pooled channel."""
+
+        semaphore = asyncio.Semaphore(self.publish_concurrency)
+
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._get_exchange(channel, event_type)
+
+            if self.confirms is not None:
+                for event in events:
+                    await self._publish(exchange, event)
+                return
 
-        if event.event_type not in self.exchange_cache:
-            exchange = await channel.declare_exchange(
-                event.event_type,
+            async def publish(event: Event) -> None:
+                async with semaphore:
+                    await self._publish(exchange, event)
+
+            await asyncio.gather(*(publish(event) for event in events))
+
+    async def _publish(self, exchange: aio_pika.abc.AbstractExchange, event: Event) -> None:
+        """
+        Publish an event, or hand it to the confirm window in confirm mode.
+        The tracked publish may outlive the caller's lease on the exchange's channel.
+        """
+
+        message = await self._build_message(event)
+
+        if self.confirms is None:
+            await exchange.publish(message, routing_key="")
+            return
+
+        await self.confirms.track(event, lambda: exchange.publish(message, routing_key=""))
+
+    async def _build_message(self, event: Event) -> aio_pika.Message:
+        """Serialize an event into an AMQP message."""
+        body = await self.serializer.serialize(event)
+        content_encoding = self.serializer.codec.content_encoding
+
+        if self.compressor is not None:
+            body, compressed_with = self.compressor.compress(body)
+            content_encoding = compressed_with or content_encoding
+
+        return aio_pika.Message(
+            body=body,
+            content_type=self.serializer.codec.content_type,
+            content_encoding=content_encoding,
+        )
+
+    async def _get_exchange(
+        self, channel: aio_pika.abc.AbstractChannel, event_type: str
+    ) -> aio_pika.abc.AbstractExchange:
+        """Declare the fanout exchange on the channel, or reuse the cached one."""
+
+        exchanges = self.exchange_cache.setdefault(channel, {})
+
+        if event_type not in exchanges:
+            exchanges[event_type] = await channel.declare_exchange(
+                event_type,
                 aio_pika.ExchangeType.FANOUT,
                 durable=True
             )
-            self.exchange_cache[event.event_type] = exchange
-        else:
-            exchange = self.exchange_cache[event.event_type]
 
-        await exchange.publish(
-            aio_pika.Message(body=(await event.to_json()).encode()),
-            routing_key=""
-        )
+        return exchanges[event_type]
+
+    def _forget_channel(self, channel: aio_pika.abc.AbstractChannel) -> None:
+        """Drop the exchanges declared on a channel that left the pool."""
+        self.exchange_cache.pop(channel, None)
@@ -0,0 +1,23 @@
+"""RawEvent.py"""
+
+from typing import Any
+from core_lib.events.event import Event
+
+class RawEvent(Event):
+    """Event carrying an already-serialized payload.
+
+    Used to re-publish events whose concrete type is not needed, such as rows
+    read back from the outbox table.
+    """
+    def __init__(self, event_type: str, payload: dict[str, Any]) -> None:
+        self._event_type = event_type
+        self._payload = payload
+
+    @property
+    def event_type(self) -> str:
+        """The name of the event."""
+        return self._event_type
+
+    async def to_dict(self) -> dict:
+        """Convert the event to a dictionary."""
+        return self._payload
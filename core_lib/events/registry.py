@@ -0,0 +1,33 @@
+"""Maps event types to the classes that rebuild them from payloads."""
+
+from typing import Any, Callable
+from core_lib.events.created_event import ProjectCreatedEvent
+from core_lib.events.event import Event
+from core_lib.events.raw_event import RawEvent
+
+EventFactory = Callable[[dict[str, Any]], Event]
+
+class EventRegistry:
+    """Registry of event factories keyed by event type.
+
+    Payloads of unregistered types are wrapped in a RawEvent.
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[str, EventFactory] = {}
+
+    def register(self, event_type: str, factory: EventFactory) -> None:
+        """Register the factory that rebuilds events of a type from their payload."""
+        self._factories[event_type] = factory
+
+    def create(self, event_type: str, payload: dict[str, Any]) -> Event:
+        """Rebuild a typed event from its payload."""
+        factory = self._factories.get(event_type)
+
+        if factory is None:
+            return RawEvent(event_type, payload)
+
+        return factory(payload)
+
+default_registry = EventRegistry()
+default_registry.register("project.created", ProjectCreatedEvent.from_dict)
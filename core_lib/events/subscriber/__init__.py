@@ -0,0 +1,6 @@
+from .rabbitmq_fanout_subscriber import EventHandler, RabbitMQFanOutEventSubscriber
+
+__all__ = [
+    "EventHandler",
+    "RabbitMQFanOutEventSubscriber",
+]
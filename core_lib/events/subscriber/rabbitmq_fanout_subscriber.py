@@ -0,0 +1,181 @@
+"""RabbitMQ Fanout Event Subscriber"""
+
+import asyncio
+from collections import deque
+import logging
+from typing import Awaitable, Callable
+import aio_pika
+from aio_pika.abc import AbstractIncomingMessage
+from core_lib.events import Event, decode_message_body
+from core_lib.events.registry import EventRegistry, default_registry
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Event], Awaitable[None]]
+
+class _AckBatcher:
+    """Acknowledges processed messages in batches with multiple=True.
+
+    Messages can finish out of order, so only the longest prefix of settled
+    deliveries is acknowledged, up to its last successful message.
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = batch_size
+        self._delivered: deque[int] = deque()
+        self._settled: dict[int, AbstractIncomingMessage | None] = {}
+
+    def track(self, message: AbstractIncomingMessage) -> None:
+        """Remember a delivery in arrival order."""
+        self._delivered.append(message.delivery_tag)
+
+    async def settle(self, message: AbstractIncomingMessage, success: bool) -> None:
+        """Mark a delivery as done; failed deliveries were already nacked."""
+        self._settled[message.delivery_tag] = message if success else None
+
+        if len(self._settled) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Acknowledge the settled prefix of deliveries."""
+        last_acked = None
+
+        while self._delivered and self._delivered[0] in self._settled:
+            message = self._settled.pop(self._delivered.popleft())
+
+            if message is not None:
+                last_acked = message
+
+        if last_acked is not None:
+            await last_acked.ack(multiple=True)
+
+class RabbitMQFanOutEventSubscriber:
+    """Consumes events published by RabbitMQFanOutEventEmitter.
+
+    A single queue, exclusive to this subscriber unless queue_name is given,
+    is bound to the fanout exchange of every subscribed event type. Messages
+    are decoded back into typed events through the registry and passed to the
+    handlers of their type. At most `concurrency` messages are handled at once.
+    Successful messages are acknowledged in batches. Messages whose handlers
+    raise are nacked, and requeued if requeue_on_error is set.
+    """
+
+    def __init__(
+        self,
+        connection: aio_pika.RobustConnection,
+        queue_name: str | None = None,
+        prefetch_count: int = 100,
+        concurrency: int = 16,
+        ack_batch_size: int = 50,
+        ack_interval: float = 0.2,
+        requeue_on_error: bool = False,
+        registry: EventRegistry | None = None,
+    ) -> None:
+        self.connection = connection
+        self.queue_name = queue_name
+        self.prefetch_count = prefetch_count
+        self.ack_interval = ack_interval
+        self.requeue_on_error = requeue_on_error
+        self.registry = registry or default_registry
+
+        self.channel: aio_pika.abc.AbstractChannel | None = None
+        self.queue: aio_pika.abc.AbstractQueue | None = None
+
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._acks = _AckBatcher(min(ack_batch_size, prefetch_count))
+        self._consumer_tag: str | None = None
+        self._ack_task: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """Register a handler for an event type. Must be called before start()."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    async def start(self) -> None:
+        """Declare and bind the queue and start consuming."""
+
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+
+        self.queue = await self.channel.declare_queue(
+            self.queue_name or "",
+            exclusive=self.queue_name is None,
+            durable=self.queue_name is not None,
+        )
+
+        for event_type in self._handlers:
+            exchange = await self.channel.declare_exchange(
+                event_type,
+                aio_pika.ExchangeType.FANOUT,
+                durable=True
+            )
+            await self.queue.bind(exchange)
+
+        self._ack_task = asyncio.get_running_loop().create_task(self._flush_acks_periodically())
+        self._consumer_tag = await self.queue.consume(self._on_message)
+
+    async def stop(self) -> None:
+        """Stop consuming, finish in-flight messages, flush acks and close the channel."""
+
+        if self.queue is not None and self._consumer_tag is not None:
+            await self.queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        if self._ack_task is not None:
+            self._ack_task.cancel()
+
+            try:
+                await self._ack_task
+            except asyncio.CancelledError:
+                pass
+
+            self._ack_task = None
+
+        await self._acks.flush()
+
+        if self.channel is not None and not self.channel.is_closed:
+            await self.channel.close()
+
+    def decode(self, message: AbstractIncomingMessage) -> Event:
+        """Rebuild the typed event carried by a message."""
+        payload = decode_message_body(message.body, message.content_type, message.content_encoding)
+        return self.registry.create(message.exchange, payload)
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        """Consumer callback: handle the message within the concurrency limit."""
+
+        self._acks.track(message)
+        task = asyncio.current_task()
+        self._in_flight.add(task)
+
+        try:
+            async with self._semaphore:
+                await self._handle(message)
+        finally:
+            self._in_flight.discard(task)
+
+    async def _handle(self, message: AbstractIncomingMessage) -> None:
+        """Dispatch a message to its handlers and settle it."""
+
+        try:
+            event = self.decode(message)
+
+            for handler in self._handlers.get(event.event_type, []):
+                await handler(event)
+        except Exception:
+            logger.exception("Failed to handle message from exchange %s", message.exchange)
+            await message.nack(requeue=self.requeue_on_error)
+            await self._acks.settle(message, success=False)
+        else:
+            await self._acks.settle(message, success=True)
+
+    async def _flush_acks_periodically(self) -> None:
+        """Flush pending acks every ack_interval seconds."""
+
+        while True:
+            await asyncio.sleep(self.ack_interval)
+            await self._acks.flush()
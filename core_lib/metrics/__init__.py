@@ -0,0 +1,16 @@
+from .registry import COUNT_BUCKETS, DEFAULT_BUCKETS, Counter, Histogram, MetricsRegistry, default_registry
+from .queries import QueryCount, count_queries, instrument_engine
+from .prometheus import to_prometheus_text
+
+__all__ = [
+    "COUNT_BUCKETS",
+    "Counter",
+    "count_queries",
+    "DEFAULT_BUCKETS",
+    "default_registry",
+    "Histogram",
+    "instrument_engine",
+    "MetricsRegistry",
+    "QueryCount",
+    "to_prometheus_text",
+]
@@ -0,0 +1,43 @@
+"""Prometheus text exposition of a MetricsRegistry."""
+
+from core_lib.metrics.registry import Counter, Histogram, Labels, MetricsRegistry, default_registry
+
+def _format_labels(labels: Labels, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    """Render label pairs as {name="value",...}, or nothing when there are none."""
+    pairs = (*labels, *extra)
+
+    if not pairs:
+        return ""
+
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in pairs
+    )
+
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+def _format_bound(bound: float) -> str:
+    """Render a bucket bound the way Prometheus clients do."""
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+def to_prometheus_text(registry: MetricsRegistry = default_registry) -> str:
+    """Render every metric in the registry in the Prometheus text exposition format."""
+    lines = []
+
+    for name, kind, description, metrics in registry.collect():
+        if description:
+            lines.append(f"# HELP {name} {description}")
+
+        lines.append(f"# TYPE {name} {kind}")
+
+        for labels, metric in metrics.items():
+            if isinstance(metric, Counter):
+                lines.append(f"{name}{_format_labels(labels)} {metric.value}")
+            elif isinstance(metric, Histogram):
+                for bound, count in metric.cumulative_counts():
+                    lines.append(f"{name}_bucket{_format_labels(labels, (('le', _format_bound(bound)),))} {count}")
+
+                lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+
+    return "\n".join(lines) + "\n" if lines else ""
@@ -0,0 +1,91 @@
+"""SQLAlchemy engine hooks that time queries and count them per call."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import time
+from typing import Iterator
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from core_lib.metrics.registry import MetricsRegistry, default_registry
+
+logger = logging.getLogger(__name__)
+
+class QueryCount:
+    '''Number of queries run while a count_queries() block was active'''
+
+    def __init__(self) -> None:
+        self.value = 0
+
+_active_counts: ContextVar[tuple[QueryCount, ...]] = ContextVar("core_lib_query_counts", default=())
+
+@contextmanager
+def count_queries(count: QueryCount | None = None) -> Iterator[QueryCount]:
+    """
+    Count the queries run on instrumented engines inside the block, from the current context.
+    Blocks may be nested; every active block counts each query.
+    :param count: A count to add to, so several blocks can share one total.
+    """
+    count = count or QueryCount()
+    token = _active_counts.set((*_active_counts.get(), count))
+
+    try:
+        yield count
+    finally:
+        _active_counts.reset(token)
+
+def _redacted_parameters(parameters) -> str:
+    """Describe bound parameters without their values."""
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (list, tuple, dict)):
+        return f"[{len(parameters)} parameter set(s) redacted]"
+
+    return f"[{len(parameters or ())} parameter(s) redacted]"
+
+def instrument_engine(
+    engine: AsyncEngine,
+    registry: MetricsRegistry = default_registry,
+    slow_query_threshold: float | None = 0.5,
+) -> None:
+    """
+    Time every query run on an engine and count it towards active count_queries() blocks.
+    Queries slower than slow_query_threshold seconds are logged with their parameters redacted.
+    :param engine: The engine to instrument.
+    :param registry: Where query latencies are recorded.
+    :param slow_query_threshold: The slow query log threshold in seconds, or None to log nothing.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not registry.enabled:
+            return
+
+        conn.info.setdefault("core_lib_query_started", []).append(time.perf_counter())
+
+        for count in _active_counts.get():
+            count.value += 1
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("core_lib_query_started")
+
+        if not started:
+            return
+
+        elapsed = time.perf_counter() - started.pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+
+        registry.histogram(
+            "db_query_duration_seconds", {"operation": operation}, "Time spent running database queries."
+        ).observe(elapsed)
+
+        if slow_query_threshold is not None and elapsed >= slow_query_threshold:
+            registry.counter("db_slow_queries_total", {"operation": operation}, "Queries over the slow query threshold.").inc()
+            logger.warning("Slow query took %.3fs: %s %s", elapsed, statement, _redacted_parameters(parameters))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+
+        if connection is not None and connection.info.get("core_lib_query_started"):
+            connection.info["core_lib_query_started"].pop()
@@ -0,0 +1,100 @@
+"""In-process counters and histograms."""
+
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+Labels = tuple[tuple[str, str], ...]
+
+class Counter:
+    """A value that only goes up."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to the counter."""
+        self.value += amount
+
+class Histogram:
+    """Counts observations into fixed buckets and keeps their sum."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """The number of observations at or below each bucket bound, ending with +Inf."""
+        counts = []
+        total = 0
+
+        for bound, count in zip((*self.buckets, float("inf")), self.bucket_counts):
+            total += count
+            counts.append((bound, total))
+
+        return counts
+
+class MetricsRegistry:
+    """Holds named metrics, each keyed by its label values.
+
+    Instrumentation checks `enabled` before measuring anything, so a disabled
+    registry costs one attribute lookup per instrumented call.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+        self._kinds: dict[str, tuple[str, str]] = {}
+        self._metrics: dict[str, dict[Labels, Counter | Histogram]] = {}
+
+    def counter(self, name: str, labels: dict[str, str] | None = None, description: str = "") -> Counter:
+        """Get or create the counter with the given name and labels."""
+        return self._get(name, "counter", description, labels, Counter)
+
+    def histogram(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+        description: str = "",
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create the histogram with the given name and labels."""
+        return self._get(name, "histogram", description, labels, lambda: Histogram(buckets))
+
+    def collect(self) -> Iterator[tuple[str, str, str, dict[Labels, Counter | Histogram]]]:
+        """Yield the name, kind, description and labelled metrics of every family."""
+        for name, (kind, description) in self._kinds.items():
+            yield name, kind, description, dict(self._metrics[name])
+
+    def clear(self) -> None:
+        """Drop every metric."""
+        self._kinds.clear()
+        self._metrics.clear()
+
+    def _get(self, name: str, kind: str, description: str, labels: dict[str, str] | None, factory):
+        """Look up a metric, creating it and its family on first use."""
+        registered = self._kinds.setdefault(name, (kind, description))
+
+        if registered[0] != kind:
+            raise ValueError(f"Metric {name} is already registered as a {registered[0]}")
+
+        family = self._metrics.setdefault(name, {})
+        key = tuple(sorted(labels.items())) if labels else ()
+        metric = family.get(key)
+
+        if metric is None:
+            metric = family[key] = factory()
+
+        return metric
+
+default_registry = MetricsRegistry()
@@ -1,8 +1,12 @@
+from .outbox import OutboxORM
 from .project import ProjectORM, StatusORM
+from .types import UUIDString
 from .user import UserORM
 
 __all__ = [
+    "OutboxORM",
     "ProjectORM",
     "StatusORM",
     "UserORM",
+    "UUIDString",
 ]
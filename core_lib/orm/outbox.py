@@ -0,0 +1,18 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, func
+
+from core_lib.orm.base import Base
+
+class OutboxORM(Base):
+    '''Transactional Outbox Model'''
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_outbox_delivered_at_id", "delivered_at", "id"),
+    )
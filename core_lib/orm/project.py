@@ -1,9 +1,10 @@
 import enum
 import uuid
-from sqlalchemy import JSON, Column, Enum, ForeignKey, String
+from sqlalchemy import JSON, Column, Enum, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from core_lib.orm.base import Base
+from core_lib.orm.types import UUIDString
 
 class StatusORM(enum.Enum):
     '''Project Status Enum'''
@@ -16,11 +17,16 @@ class ProjectORM(Base):
     '''Project Model'''
     __tablename__ = "projects"
 
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     repo_url = Column(String, nullable=False)
     environment_variables = Column(JSON, nullable=True)
     status = Column(Enum(StatusORM), default=StatusORM.BUILDING, nullable=False)
 
-    user_id = Column(String, ForeignKey("users.id"))
+    user_id = Column(UUIDString, ForeignKey("users.id"))
 
     owner = relationship("UserORM", back_populates="projects")
+
+    __table_args__ = (
+        Index("ix_projects_user_id_id", "user_id", "id"),
+        Index("ix_projects_status_user_id", "status", "user_id"),
+    )
@@ -0,0 +1,37 @@
+import uuid
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+
+class UUIDString(TypeDecorator):
+    '''UUID column exposed to Python as a string.
+
+    Stored as a native UUID on Postgres and as 16 raw bytes elsewhere.
+    Binding a value that is not a valid UUID raises ValueError.
+    '''
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+
+        if isinstance(value, uuid.UUID):
+            return str(value)
+
+        return str(uuid.UUID(bytes=bytes(value)))
@@ -1,14 +1,15 @@
 import uuid
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, func
 from sqlalchemy.orm import relationship
 
 from core_lib.orm.base import Base
+from core_lib.orm.types import UUIDString
 
 class UserORM(Base):
     '''User Model'''
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     username = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, nullable=True)
     oauth_provider = Column(String, nullable=False)
@@ -17,6 +18,6 @@ class UserORM(Base):
     encrypted_refresh_token = Column(String, nullable=True)
     oauth_token_expires_at = Column(DateTime, nullable=True)
 
-    created_at = Column(DateTime, nullable=False, server_default="CURRENT_TIMESTAMP")
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
 
     projects = relationship("ProjectORM", back_populates="owner", cascade="all, delete-orphan")
@@ -0,0 +1,7 @@
+from .enqueue import enqueue_event
+from .relay import OutboxRelay
+
+__all__ = [
+    "enqueue_event",
+    "OutboxRelay",
+]
@@ -0,0 +1,18 @@
+"""Helpers for writing events to the transactional outbox."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from core_lib.events import Event
+from core_lib.orm import OutboxORM
+
+async def enqueue_event(session: AsyncSession, event: Event) -> OutboxORM:
+    """
+    Add an event to the outbox as part of the session's current transaction.
+    The event is only published by the OutboxRelay once the transaction commits.
+    :param session: The session whose transaction the event joins.
+    :param event: The event to enqueue.
+    :return: The pending outbox row.
+    """
+    row = OutboxORM(event_type=event.event_type, payload=await event.to_dict())
+    session.add(row)
+
+    return row
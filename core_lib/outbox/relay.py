@@ -0,0 +1,105 @@
+"""OutboxRelay.py
+Publishes events written to the outbox table through an EventEmitter."""
+
+import asyncio
+import logging
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from core_lib.events import RawEvent
+from core_lib.events.emitter import EventEmitter
+from core_lib.orm import OutboxORM
+
+logger = logging.getLogger(__name__)
+
+SKIP_LOCKED_DIALECTS = {"postgresql", "mysql", "mariadb", "oracle"}
+
+class OutboxRelay:
+    """
+    Polls the outbox table for undelivered events, publishes them in batches
+    and marks the published rows as delivered in a single update.
+    On databases that support it, rows are claimed with FOR UPDATE SKIP LOCKED
+    so several relays can run side by side.
+    A batch that fails to publish is rolled back and retried; run() keeps
+    going, backing off exponentially up to max_backoff seconds between failures.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        emitter: EventEmitter,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_backoff: float = 30.0,
+    ):
+        self.session_factory = session_factory
+        self.emitter = emitter
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+
+        self._stopped = asyncio.Event()
+
+    async def relay_once(self) -> int:
+        """
+        Publish one batch of undelivered events.
+        :return: The number of events published.
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                statement = (
+                    select(OutboxORM.id, OutboxORM.event_type, OutboxORM.payload)
+                    .where(OutboxORM.delivered_at.is_(None))
+                    .order_by(OutboxORM.id)
+                    .limit(self.batch_size)
+                )
+
+                if session.get_bind().dialect.name in SKIP_LOCKED_DIALECTS:
+                    statement = statement.with_for_update(skip_locked=True)
+
+                rows = (await session.execute(statement)).all()
+
+                if not rows:
+                    return 0
+
+                await self.emitter.emit_many(RawEvent(row.event_type, row.payload) for row in rows)
+
+                await session.execute(
+                    update(OutboxORM)
+                    .where(OutboxORM.id.in_([row.id for row in rows]))
+                    .values(delivered_at=func.now())
+                )
+
+        return len(rows)
+
+    async def run(self) -> None:
+        """
+        Relay events until stop() is called, sleeping when the outbox is drained.
+        Failed batches are logged and retried after a growing delay.
+        """
+        self._stopped.clear()
+        failures = 0
+
+        while not self._stopped.is_set():
+            try:
+                relayed = await self.relay_once()
+            except Exception:
+                failures += 1
+                delay = min(self.poll_interval * 2 ** (failures - 1), self.max_backoff)
+                logger.exception("Failed to relay outbox events, retrying in %.1fs", delay)
+            else:
+                failures = 0
+                delay = self.poll_interval if relayed < self.batch_size else None
+
+            if delay is not None:
+                await self._sleep(delay)
+
+    async def _sleep(self, delay: float) -> None:
+        """Wait for the delay, waking early if stop() is called."""
+        try:
+            await asyncio.wait_for(self._stopped.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def stop(self) -> None:
+        """Ask a running relay to exit after its current batch."""
+        self._stopped.set()
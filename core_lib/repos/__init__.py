@@ -1,9 +1,13 @@
 from .project import ProjectRepository, SQLAlchemyProjectRepository
 from .user import UserRepository, SQLAlchemyUserRepository
+from .replica import ReplicaRouter
+from .unit_of_work import UnitOfWork
 
 __all__ = [
     "ProjectRepository",
+    "ReplicaRouter",
     "SQLAlchemyProjectRepository",
     "UserRepository",
     "SQLAlchemyUserRepository",
+    "UnitOfWork",
 ]
@@ -0,0 +1,146 @@
+"""In-memory caching primitives used by the cached repositories."""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+MISSING = object()
+
+@dataclass
+class CacheStats:
+    '''Cache hit, miss and eviction counters'''
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries expire after a time to live.
+    A cached None records a miss and lives for negative_ttl instead of ttl.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Incremented on every invalidation, so loaders can detect writes that raced them."""
+        return self._version
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key.
+        :return: The cached value, which may be None for a cached miss, or MISSING.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+
+        if value is None:
+            self.stats.negative_hits += 1
+        else:
+            self.stats.hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: Any, version: int | None = None) -> None:
+        """
+        Cache a value, or a miss when value is None.
+        :param version: The cache version read before loading the value; the value
+            is dropped if an invalidation happened since.
+        """
+        if version is not None and version != self._version:
+            return
+
+        ttl = self.negative_ttl if value is None else self.ttl
+
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (self.clock() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key."""
+        self._version += 1
+        self.stats.invalidations += 1
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key matching the predicate."""
+        self._version += 1
+        self.stats.invalidations += 1
+
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every key."""
+        self._version += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SingleFlight:
+    """
+    Coalesces concurrent loads of the same key into a single call.
+    The call runs in its own task, so cancelling one caller, even the one that
+    started it, only cancels that caller's wait.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Run load() for the key, or wait for the call already in flight."""
+        call = self._calls.get(key)
+
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(load())
+            call.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(call)
+
+    def _finish(self, key: Hashable, call: asyncio.Task) -> None:
+        """Forget a finished call, retrieving its exception in case no caller is left to."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        if not call.cancelled():
+            call.exception()
@@ -0,0 +1,23 @@
+"""Dialect-specific statement helpers shared by the SQLAlchemy repositories."""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def upsert_insert(session: AsyncSession, orm: type):
+    """
+    Build an INSERT for the session's dialect that supports ON CONFLICT.
+    :param session: The session the statement will run on.
+    :param orm: The mapped class to insert into.
+    :raises NotImplementedError: If the dialect has no ON CONFLICT support.
+    """
+    dialect = session.get_bind().dialect.name
+
+    if dialect not in UPSERT_INSERTS:
+        raise NotImplementedError(f"Upserts are not supported on the {dialect} dialect")
+
+    return UPSERT_INSERTS[dialect](orm)
@@ -0,0 +1,22 @@
+"""Validation of the UUID IDs the SQLAlchemy repositories look rows up by."""
+
+import uuid
+from typing import Iterable
+
+def is_valid_id(value: object) -> bool:
+    """
+    Whether a value is an ID in the canonical form the repositories hand out:
+    a lower-case, hyphenated UUID string. Results are keyed by that form, so
+    any other spelling of a UUID is treated like a malformed ID and matches nothing.
+    """
+    if not isinstance(value, str):
+        return False
+
+    try:
+        return str(uuid.UUID(value)) == value
+    except ValueError:
+        return False
+
+def valid_ids(values: Iterable[str]) -> list[str]:
+    """The distinct canonical IDs, in order, dropping malformed and non-canonical ones."""
+    return [value for value in dict.fromkeys(values) if is_valid_id(value)]
@@ -0,0 +1,113 @@
+"""Metrics recorded around repository calls by the instrumented repositories."""
+
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+from pydantic import BaseModel
+from core_lib.domain import ProjectPage, UserWithProjects
+from core_lib.metrics import COUNT_BUCKETS, MetricsRegistry, QueryCount, count_queries, default_registry
+
+def row_count(result: Any) -> int | None:
+    """The number of domain objects a repository call returned, or None for writes that return flags."""
+    if result is None:
+        return 0
+
+    if isinstance(result, bool):
+        return None
+
+    if isinstance(result, ProjectPage):
+        return len(result.items)
+
+    if isinstance(result, UserWithProjects):
+        return 1 + len(result.projects)
+
+    if isinstance(result, BaseModel):
+        return 1
+
+    if isinstance(result, (list, dict)):
+        return len(result)
+
+    return None
+
+class RepositoryMetrics:
+    """
+    Records the latency, query count, rows returned and errors of each call
+    made through it, labelled with the repository and method names.
+    Calls go straight through when the registry is disabled.
+    """
+
+    def __init__(self, repository: str, registry: MetricsRegistry = default_registry):
+        self.repository = repository
+        self.registry = registry
+
+    async def call(self, method: str, function: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run one repository call and record its metrics."""
+        if not self.registry.enabled:
+            return await function(*args)
+
+        started = time.perf_counter()
+
+        with count_queries() as queries:
+            try:
+                result = await function(*args)
+            except Exception:
+                self._record(method, started, queries, None, failed=True)
+                raise
+
+        self._record(method, started, queries, row_count(result))
+
+        return result
+
+    async def stream(self, method: str, iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """
+        Pass a streamed result through, recording metrics once the stream ends or is closed.
+        Only queries run while the wrapped iterator is advanced are counted, not
+        those the consumer runs between items.
+        """
+        if not self.registry.enabled:
+            async for item in iterator:
+                yield item
+
+            return
+
+        started = time.perf_counter()
+        queries = QueryCount()
+        rows = 0
+        failed = False
+
+        try:
+            while True:
+                with count_queries(queries):
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+
+                rows += 1
+                yield item
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
+            self._record(method, started, queries, rows, failed)
+
+    def _record(self, method: str, started: float, queries: QueryCount, rows: int | None, failed: bool = False) -> None:
+        """Record the metrics of one finished call."""
+        labels = {"repository": self.repository, "method": method}
+
+        self.registry.histogram(
+            "repository_call_duration_seconds", labels, "Time spent in repository calls."
+        ).observe(time.perf_counter() - started)
+        self.registry.histogram(
+            "repository_queries_per_call", labels, "Database queries run per repository call.", COUNT_BUCKETS
+        ).observe(queries.value)
+
+        if rows is not None:
+            self.registry.histogram(
+                "repository_rows_returned", labels, "Domain objects returned per repository call.", COUNT_BUCKETS
+            ).observe(rows)
+
+        if failed:
+            self.registry.counter("repository_errors_total", labels, "Repository calls that raised.").inc()
@@ -0,0 +1,65 @@
+"""Request-scoped batching of repository lookups."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+class BatchLoader:
+    """
+    Collects keys requested in the same event-loop tick and loads them with a
+    single batch call. Results are memoized for the loader's lifetime, so a
+    loader should be created per request.
+    """
+
+    def __init__(self, load_many: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]):
+        self.load_many = load_many
+
+        self._memo: dict[Hashable, asyncio.Future] = {}
+        self._pending: list[Hashable] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """Load a key, batched with every other key requested in the same tick."""
+        future = self._memo.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._memo[key] = loop.create_future()
+
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+
+            self._pending.append(key)
+
+        return await asyncio.shield(future)
+
+    def clear(self, key: Hashable | None = None) -> None:
+        """Forget a memoized key, or every key."""
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+    def _dispatch(self) -> None:
+        """Start loading the keys collected during this tick."""
+        keys, self._pending = self._pending, []
+        futures = {key: self._memo[key] for key in keys}
+
+        task = asyncio.get_running_loop().create_task(self._load_batch(futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, futures: dict[Hashable, asyncio.Future]) -> None:
+        """Run the batch call and resolve each waiting future."""
+        try:
+            results = await self.load_many(list(futures))
+        except Exception as e:
+            for key, future in futures.items():
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+
+                future.set_exception(e)
+                future.exception()
+            return
+
+        for key, future in futures.items():
+            future.set_result(results.get(key))
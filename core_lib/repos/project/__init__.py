@@ -1,8 +1,16 @@
 from .project_repository import ProjectRepository
 from .sql_alchemy import SQLAlchemyProjectRepository
 from .noop import NoopProjectRepository
+from .cached import CachedProjectRepository
+from .batching import BatchingProjectRepository
+from .in_memory import InMemoryProjectRepository
+from .instrumented import InstrumentedProjectRepository
 
 __all__ = [
+    "BatchingProjectRepository",
+    "CachedProjectRepository",
+    "InMemoryProjectRepository",
+    "InstrumentedProjectRepository",
     "ProjectRepository",
     "SQLAlchemyProjectRepository",
     "NoopProjectRepository",
@@ -0,0 +1,116 @@
+"""Coalesces concurrent ProjectRepository.get calls into batched lookups."""
+
+import asyncio
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
+from core_lib.repos.loader import BatchLoader
+from . import ProjectRepository
+
+class BatchingProjectRepository(ProjectRepository):
+    """
+    Wraps a ProjectRepository so that get() calls made in the same event-loop
+    tick are deduplicated and served by one get_many() per owning user on the
+    wrapped repository. Results are memoized, so create one instance per request.
+    """
+
+    def __init__(self, repo: ProjectRepository):
+        self.repo = repo
+        self.loader = BatchLoader(self._load_many)
+
+    async def get(self, user_id: str, project_id: str) -> Project | None:
+        """Retrieve a project repository by its ID, batched with concurrent lookups."""
+        return await self.loader.load((user_id, project_id))
+
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories through the same batches as get()."""
+        ids = list(dict.fromkeys(project_ids))
+        projects = await asyncio.gather(*(self.loader.load((user_id, project_id)) for project_id in ids))
+
+        return {project_id: project for project_id, project in zip(ids, projects) if project is not None}
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
+        """Retrieve all project repositories for a user."""
+        return await self.repo.get_all(user_id, fields)
+
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of a user's project repositories."""
+        return await self.repo.list_page(user_id, after_id, limit, status)
+
+    async def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user."""
+        async for project in self.repo.iter_all(user_id, batch_size, fields):
+            yield project
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status."""
+        return await self.repo.list_by_status(status, limit, fields)
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status."""
+        return await self.repo.count_by_status(user_id)
+
+    async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
+        """Create a new project repository."""
+        project = await self.repo.create(user_id, project_create_args)
+
+        if project is not None:
+            self.loader.clear((user_id, project.id))
+
+        return project
+
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories."""
+        projects = await self.repo.create_many(user_id, project_create_args)
+
+        for project in projects:
+            self.loader.clear((user_id, project.id))
+
+        return projects
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """Create or update several project repositories."""
+        projects = list(projects)
+
+        try:
+            return await self.repo.upsert_many(user_id, projects)
+        finally:
+            for project in projects:
+                self.loader.clear((user_id, project.id))
+
+    async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
+        """Update an existing project repository."""
+        try:
+            return await self.repo.update(user_id, project_id, project_update_args)
+        finally:
+            self.loader.clear((user_id, project_id))
+
+    async def delete(self, user_id: str, project_id: str) -> bool:
+        """Delete a project repository by its ID."""
+        try:
+            return await self.repo.delete(user_id, project_id)
+        finally:
+            self.loader.clear((user_id, project_id))
+
+    async def _load_many(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], Project]:
+        """
+        Load a batch of (user_id, project_id) keys with one get_many per user.
+        The calls run one after another, since the wrapped repository may hold a single session.
+        """
+        by_user: dict[str, list[str]] = {}
+
+        for user_id, project_id in keys:
+            by_user.setdefault(user_id, []).append(project_id)
+
+        loaded = {}
+
+        for user_id, project_ids in by_user.items():
+            for project_id, project in (await self.repo.get_many(user_id, project_ids)).items():
+                loaded[(user_id, project_id)] = project
+
+        return loaded
@@ -0,0 +1,152 @@
+"""Read-through cache in front of any ProjectRepository."""
+
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
+from core_lib.events import Event
+from core_lib.repos.cache import MISSING, CacheStats, SingleFlight, TTLCache
+from . import ProjectRepository
+
+class CachedProjectRepository(ProjectRepository):
+    """
+    Caches single project lookups from a wrapped ProjectRepository.
+    Entries are keyed by (user_id, project_id). Misses are cached for the
+    cache's negative TTL, concurrent misses for the same key are coalesced,
+    and writes made through this repository invalidate the affected entries.
+    Listing methods are passed straight through.
+    """
+
+    def __init__(self, repo: ProjectRepository, cache: TTLCache | None = None):
+        self.repo = repo
+        self.cache = cache or TTLCache()
+        self._single_flight = SingleFlight()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters."""
+        return self.cache.stats
+
+    async def get(self, user_id: str, project_id: str) -> Project | None:
+        """Retrieve a project repository by its ID, from the cache when possible."""
+        key = (user_id, project_id)
+        project = self.cache.get(key)
+
+        if project is not MISSING:
+            return project
+
+        return await self._single_flight.do(key, lambda: self._load(user_id, project_id))
+
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories, loading only the uncached ones."""
+        projects = {}
+        missing = []
+
+        for project_id in dict.fromkeys(project_ids):
+            project = self.cache.get((user_id, project_id))
+
+            if project is MISSING:
+                missing.append(project_id)
+            elif project is not None:
+                projects[project_id] = project
+
+        if missing:
+            version = self.cache.version
+            loaded = await self.repo.get_many(user_id, missing)
+
+            for project_id in missing:
+                self.cache.set((user_id, project_id), loaded.get(project_id), version)
+
+            projects.update(loaded)
+
+        return projects
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
+        """Retrieve all project repositories for a user."""
+        return await self.repo.get_all(user_id, fields)
+
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of a user's project repositories."""
+        return await self.repo.list_page(user_id, after_id, limit, status)
+
+    async def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user."""
+        async for project in self.repo.iter_all(user_id, batch_size, fields):
+            yield project
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status."""
+        return await self.repo.list_by_status(status, limit, fields)
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status."""
+        return await self.repo.count_by_status(user_id)
+
+    async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
+        """Create a new project repository and cache it."""
+        project = await self.repo.create(user_id, project_create_args)
+
+        if project is not None:
+            self.cache.set((user_id, project.id), project)
+
+        return project
+
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories and cache them."""
+        projects = await self.repo.create_many(user_id, project_create_args)
+
+        for project in projects:
+            self.cache.set((user_id, project.id), project)
+
+        return projects
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """Create or update several project repositories and refresh their cache entries."""
+        projects = list(projects)
+
+        try:
+            upserted = await self.repo.upsert_many(user_id, projects)
+        finally:
+            for project in projects:
+                self.cache.invalidate((user_id, project.id))
+
+        for project in upserted:
+            self.cache.set((user_id, project.id), project)
+
+        return upserted
+
+    async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
+        """Update an existing project repository and drop its cache entry."""
+        try:
+            return await self.repo.update(user_id, project_id, project_update_args)
+        finally:
+            self.cache.invalidate((user_id, project_id))
+
+    async def delete(self, user_id: str, project_id: str) -> bool:
+        """Delete a project repository and drop its cache entry."""
+        try:
+            return await self.repo.delete(user_id, project_id)
+        finally:
+            self.cache.invalidate((user_id, project_id))
+
+    async def on_event(self, event: Event) -> None:
+        """
+        Invalidate the project repository named by an incoming event's project_id, if any.
+        Meant to be registered as a subscriber handler.
+        """
+        project_id = (await event.to_dict()).get("project_id")
+
+        if project_id is not None:
+            self.cache.invalidate_where(lambda key: key[1] == project_id)
+
+    async def _load(self, user_id: str, project_id: str) -> Project | None:
+        """Load a project repository from the wrapped repository and cache the result."""
+        version = self.cache.version
+        project = await self.repo.get(user_id, project_id)
+        self.cache.set((user_id, project_id), project, version)
+
+        return project
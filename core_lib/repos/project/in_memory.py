@@ -0,0 +1,214 @@
+"""In-memory ProjectRepository with hash indexes, for tests and benchmarks."""
+
+import asyncio
+from collections import Counter
+import uuid
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
+from core_lib.orm import StatusORM
+from . import ProjectRepository
+
+class InMemoryProjectRepository(ProjectRepository):
+    """
+    Keeps project repositories in process memory with the same semantics as
+    the SQLAlchemy repository. Projects are indexed by ID, by owning user and
+    by status, so lookups never scan the whole store. Writes are serialized
+    with an asyncio.Lock. Returned models are shared with the store and must
+    not be mutated.
+    """
+
+    def __init__(self):
+        self._projects: dict[str, Project] = {}
+        self._owners: dict[str, str] = {}
+        self._by_user: dict[str, dict[str, None]] = {}
+        self._by_status: dict[str, dict[str, None]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, user_id: str, project_id: str) -> Project | None:
+        """Retrieve a project repository by its ID."""
+        if self._owners.get(project_id) != user_id:
+            return None
+
+        return self._projects[project_id]
+
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories of a user by their IDs."""
+        return {
+            project_id: self._projects[project_id]
+            for project_id in dict.fromkeys(project_ids)
+            if self._owners.get(project_id) == user_id
+        }
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
+        """Retrieve all project repositories for a user."""
+        names = self._field_names(fields)
+
+        return [self._select(self._projects[project_id], names) for project_id in self._by_user.get(user_id, ())]
+
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of a user's project repositories, ordered by ID."""
+        if limit < 1:
+            raise ValueError(f"Page limit must be at least 1, got {limit}")
+
+        ids = self._by_user.get(user_id, {})
+
+        if status is not None:
+            ids = ids.keys() & self._by_status.get(StatusORM(status).value, {}).keys()
+
+        ids = sorted(project_id for project_id in ids if after_id is None or project_id > after_id)
+        items = [self._projects[project_id] for project_id in ids[:limit]]
+        next_cursor = items[-1].id if len(ids) > limit else None
+
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    async def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user, ordered by ID."""
+        names = self._field_names(fields)
+
+        for project_id in sorted(self._by_user.get(user_id, ())):
+            project = self._projects.get(project_id)
+
+            if project is not None:
+                yield self._select(project, names)
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status, ordered by owning user."""
+        names = self._field_names(fields)
+        ids = sorted(self._by_status.get(StatusORM(status).value, ()), key=self._owners.__getitem__)
+
+        return [self._select(self._projects[project_id], names) for project_id in ids[:limit]]
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status."""
+        return dict(Counter(self._projects[project_id].status for project_id in self._by_user.get(user_id, ())))
+
+    async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
+        """Create a new project repository."""
+        [project] = await self.create_many(user_id, [project_create_args])
+
+        return project
+
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories."""
+        projects = [
+            Project(
+                id=str(uuid.uuid4()),
+                repo_url=args.repo_url,
+                environment_variables=args.environment_variables,
+                status=StatusORM.BUILDING.value,
+            )
+            for args in project_create_args
+        ]
+
+        async with self._lock:
+            for project in projects:
+                self._put(user_id, project)
+
+        return projects
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """Create or update several project repositories by ID, skipping those owned by another user."""
+        projects = [
+            project.model_copy(update={
+                "id": project.id or str(uuid.uuid4()),
+                "status": StatusORM(project.status).value,
+            })
+            for project in projects
+        ]
+        projects = list({project.id: project for project in projects}.values())
+        upserted = []
+
+        async with self._lock:
+            for project in projects:
+                if self._owners.get(project.id, user_id) != user_id:
+                    continue
+
+                self._put(user_id, project)
+                upserted.append(project)
+
+        return upserted
+
+    async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
+        """Update an existing project repository."""
+        values = project_update_args.model_dump(mode="json", exclude_unset=True)
+
+        async with self._lock:
+            if self._owners.get(project_id) != user_id:
+                return False
+
+            self._put(user_id, self._projects[project_id].model_copy(update=values))
+
+        return True
+
+    async def delete(self, user_id: str, project_id: str) -> bool:
+        """Delete a project repository by its ID."""
+
+        async with self._lock:
+            if self._owners.get(project_id) != user_id:
+                return False
+
+            self._remove(project_id)
+
+        return True
+
+    async def delete_all(self, user_id: str) -> int:
+        """
+        Delete every project repository of a user.
+        :return: The number of project repositories deleted.
+        """
+
+        async with self._lock:
+            ids = list(self._by_user.get(user_id, ()))
+
+            for project_id in ids:
+                self._remove(project_id)
+
+        return len(ids)
+
+    def _put(self, user_id: str, project: Project) -> None:
+        """Store a project and update the indexes."""
+        previous = self._projects.get(project.id)
+
+        if previous is not None:
+            self._by_status[previous.status].pop(project.id, None)
+
+        self._projects[project.id] = project
+        self._owners[project.id] = user_id
+        self._by_user.setdefault(user_id, {})[project.id] = None
+        self._by_status.setdefault(project.status, {})[project.id] = None
+
+    def _remove(self, project_id: str) -> None:
+        """Drop a project and its index entries."""
+        project = self._projects.pop(project_id)
+        user_id = self._owners.pop(project_id)
+
+        self._by_user[user_id].pop(project_id, None)
+        self._by_status[project.status].pop(project_id, None)
+
+    @staticmethod
+    def _field_names(fields: Iterable[str] | None) -> list[str] | None:
+        """
+        The Project fields to return, with the ID always included, or None for all of them.
+        :raises ValueError: If a field is not a Project field.
+        """
+        if fields is None:
+            return None
+
+        names = list(dict.fromkeys(["id", *fields]))
+
+        for name in names:
+            if name not in Project.model_fields:
+                raise ValueError(f"Unknown project field: {name}")
+
+        return names
+
+    @staticmethod
+    def _select(project: Project, names: list[str] | None) -> Project | PartialProject:
+        """A PartialProject of the given fields, or the project itself."""
+        return project if names is None else PartialProject.from_row(project, names)
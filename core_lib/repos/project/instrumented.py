@@ -0,0 +1,72 @@
+"""Records metrics for the calls made to any ProjectRepository."""
+
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
+from core_lib.metrics import MetricsRegistry, default_registry
+from core_lib.repos.instrumentation import RepositoryMetrics
+from . import ProjectRepository
+
+class InstrumentedProjectRepository(ProjectRepository):
+    """
+    Wraps a ProjectRepository and records the latency, query count, rows
+    returned and errors of every call in a MetricsRegistry. Query counts need
+    the engine to be instrumented with core_lib.metrics.instrument_engine.
+    """
+
+    def __init__(self, repo: ProjectRepository, registry: MetricsRegistry = default_registry, name: str = "project"):
+        self.repo = repo
+        self.metrics = RepositoryMetrics(name, registry)
+
+    async def get(self, user_id: str, project_id: str) -> Project | None:
+        """Retrieve a project repository by its ID."""
+        return await self.metrics.call("get", self.repo.get, user_id, project_id)
+
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories by their IDs."""
+        return await self.metrics.call("get_many", self.repo.get_many, user_id, project_ids)
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
+        """Retrieve all project repositories for a user."""
+        return await self.metrics.call("get_all", self.repo.get_all, user_id, fields)
+
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of a user's project repositories."""
+        return await self.metrics.call("list_page", self.repo.list_page, user_id, after_id, limit, status)
+
+    def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user; closing the stream closes the wrapped one."""
+        return self.metrics.stream("iter_all", self.repo.iter_all(user_id, batch_size, fields))
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status."""
+        return await self.metrics.call("list_by_status", self.repo.list_by_status, status, limit, fields)
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status."""
+        return await self.metrics.call("count_by_status", self.repo.count_by_status, user_id)
+
+    async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
+        """Create a new project repository."""
+        return await self.metrics.call("create", self.repo.create, user_id, project_create_args)
+
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories."""
+        return await self.metrics.call("create_many", self.repo.create_many, user_id, project_create_args)
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """Create or update several project repositories."""
+        return await self.metrics.call("upsert_many", self.repo.upsert_many, user_id, projects)
+
+    async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
+        """Update an existing project repository."""
+        return await self.metrics.call("update", self.repo.update, user_id, project_id, project_update_args)
+
+    async def delete(self, user_id: str, project_id: str) -> bool:
+        """Delete a project repository by its ID."""
+        return await self.metrics.call("delete", self.repo.delete, user_id, project_id)
@@ -1,4 +1,5 @@
-from core_lib.domain import Project, ProjectCreateArgs, ProjectUpdateArgs
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
 from . import ProjectRepository
 
 class NoopProjectRepository(ProjectRepository):
@@ -12,38 +13,89 @@ class NoopProjectRepository(ProjectRepository):
         return Project(
             id=project_id,
             repo_url="test_repo_url",
-            env={"test_env": "test_value"},
+            environment_variables={"test_env": "test_value"},
             status="testing",
         )
 
-    async def get_all(self, user_id: str) -> list[Project]:
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories by their IDs."""
+        return {
+            project_id: Project(
+                id=project_id,
+                repo_url="test_repo_url",
+                environment_variables={"test_env": "test_value"},
+                status="testing",
+            )
+            for project_id in project_ids
+        }
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
         """Retrieve all project repositories for a user."""
         return [
             Project(
                 id="1",
                 repo_url="test_repo_url_1",
-                env={"test_env": "test_value_1"},
+                environment_variables={"test_env": "test_value_1"},
                 status="testing",
             ),
             Project(
                 id="2",
                 repo_url="test_repo_url_2",
-                env={"test_env": "test_value_2"},
+                environment_variables={"test_env": "test_value_2"},
                 status="testing",
             ),
         ]
 
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of project repositories for a user."""
+        return ProjectPage(items=list((await self.get_many(user_id, ["1", "2"])).values())[:limit])
+
+    async def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user."""
+        for project in (await self.get_many(user_id, ["1", "2"])).values():
+            yield project
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status."""
+        return []
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status."""
+        return {"testing": 2}
+
     async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
         """Create a new project repository."""
         new_project = Project(
             id="1",
             repo_url=project_create_args.repo_url,
-            env=project_create_args.env,
+            environment_variables=project_create_args.environment_variables,
             status="testing",
         )
 
         return new_project
 
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories."""
+        return [
+            Project(
+                id=str(i),
+                repo_url=args.repo_url,
+                environment_variables=args.environment_variables,
+                status="testing",
+            )
+            for i, args in enumerate(project_create_args, start=1)
+        ]
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """Create or update several project repositories."""
+        return list(projects)
+
     async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
         """Update an existing project repository."""
         return True
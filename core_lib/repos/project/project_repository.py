@@ -1,6 +1,7 @@
 """Defines the ProjectRepo interface for managing project repositories."""
 from abc import ABC, abstractmethod
-from core_lib.domain import Project, ProjectCreateArgs, ProjectUpdateArgs
+from typing import AsyncIterator, Iterable
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
 
 class ProjectRepository(ABC):
     """
@@ -18,11 +19,67 @@ class ProjectRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all(self, user_id: str) -> list[Project]:
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """
+        Retrieve several project repositories of a user by their IDs.
+        :param user_id: The ID of the user owning the project repositories.
+        :param project_ids: The IDs of the project repositories to retrieve.
+        :return: The found project repositories keyed by ID; missing IDs are omitted.
+        """
+
+    @abstractmethod
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
         """
         Retrieve all project repositories for a user.
         :param user_id: The ID of the user whose project repositories to retrieve.
-        :return: A list of project repository objects.
+        :param fields: Only load these Project fields, plus the ID; None loads them all.
+        :return: A list of project repository objects, or of PartialProjects when fields is given.
+        """
+
+    @abstractmethod
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """
+        Retrieve one page of a user's project repositories, ordered by ID.
+        :param user_id: The ID of the user whose project repositories to retrieve.
+        :param after_id: The cursor returned with the previous page, or None for the first page.
+        :param limit: The maximum number of project repositories on the page, at least 1.
+        :param status: Only return project repositories with this status.
+        :return: The page, with the cursor for the next page if there is one.
+        :raises ValueError: If limit is less than 1.
+        """
+
+    @abstractmethod
+    def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """
+        Stream all project repositories for a user without loading them all at once.
+        :param user_id: The ID of the user whose project repositories to retrieve.
+        :param batch_size: How many rows to fetch from the database at a time.
+        :param fields: Only load these Project fields, plus the ID; None loads them all.
+        :return: An async iterator of project repository objects, or of PartialProjects when fields is given.
+        """
+
+    @abstractmethod
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """
+        Retrieve project repositories in a given status, across all users.
+        :param status: The status to look for, e.g. "building".
+        :param limit: The maximum number of project repositories to return.
+        :param fields: Only load these Project fields, plus the ID; None loads them all.
+        :return: A list of project repository objects, or of PartialProjects when fields is given.
+        """
+
+    @abstractmethod
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """
+        Count a user's project repositories per status.
+        :param user_id: The ID of the user whose project repositories to count.
+        :return: The number of project repositories keyed by status; statuses with none are omitted.
         """
 
     @abstractmethod
@@ -34,6 +91,26 @@ class ProjectRepository(ABC):
         :return: The created project repository object.
         """
 
+    @abstractmethod
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """
+        Create several project repositories in a single transaction.
+        :param user_id: The ID of the user creating the project repositories.
+        :param project_create_args: The project repositories to create.
+        :return: The created project repositories, in the order of the arguments.
+        """
+
+    @abstractmethod
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """
+        Create or update several project repositories by ID.
+        Existing project repositories owned by another user are left untouched and not returned.
+        When an ID is repeated, the last project given for it is written.
+        :param user_id: The ID of the user owning the project repositories.
+        :param projects: The project repositories to write.
+        :return: The created or updated project repositories.
+        """
+
     @abstractmethod
     async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
         """
@@ -1,104 +1,420 @@
 """SQLAlchemyProjectRepo.py
 SQLAlchemy implementation of the ProjectRepository interface for managing project repositories."""
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from core_lib.domain import Project, ProjectCreateArgs, ProjectUpdateArgs
-from core_lib.orm import ProjectORM
+import uuid
+from typing import AsyncContextManager, AsyncIterator, Iterable
+from sqlalchemy import Row, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectPage, ProjectUpdateArgs
+from core_lib.events import ProjectCreatedEvent
+from core_lib.orm import ProjectORM, StatusORM
+from core_lib.outbox import enqueue_event
+from core_lib.repos.dialect import upsert_insert
+from core_lib.repos.ids import is_valid_id, valid_ids
+from core_lib.repos.replica import ReplicaRouter
+from core_lib.repos.session import SessionSource, use_session
 from . import ProjectRepository
 
+PROJECT_COLUMNS = {name: getattr(ProjectORM, name) for name in Project.model_fields}
+
+def project_columns(fields: Iterable[str] | None = None) -> list:
+    """
+    Columns to select for the given Project fields, or for every field when None.
+    The ID is always selected.
+    :raises ValueError: If a field is not a Project field.
+    """
+    if fields is None:
+        return list(PROJECT_COLUMNS.values())
+
+    names = dict.fromkeys(["id", *fields])
+
+    for name in names:
+        if name not in PROJECT_COLUMNS:
+            raise ValueError(f"Unknown project field: {name}")
+
+    return [PROJECT_COLUMNS[name] for name in names]
+
+def project_from_row(row: Row, fields: Iterable[str] | None = None) -> Project | PartialProject:
+    """A Project built from the row, or a PartialProject of the given fields when they are set."""
+    return Project.from_row(row) if fields is None else PartialProject.from_row(row, fields)
+
 class SQLAlchemyProjectRepository(ProjectRepository):
     """
     SQLAlchemy implementation of the ProjectRepository interface for managing project repositories.
     This class provides methods for creating, deleting, and checking the status of repositories
     using SQLAlchemy ORM.
+    Read paths select only the columns of the Project model rather than ORM entities.
+    Given an async_sessionmaker instead of a session, every operation runs in
+    its own short-lived session, so one repository can serve concurrent tasks.
+    With auto_commit off, writes are flushed but left for the caller to commit,
+    so it needs a session rather than a session factory;
+    UnitOfWork builds repositories this way.
+    Given a ReplicaRouter, read methods run on the read replica it manages.
+    Malformed IDs, and UUIDs not in canonical lower-case form, match nothing,
+    so lookups by them return not found.
+    When use_outbox is set, create() writes a ProjectCreatedEvent to the outbox
+    in the same transaction as the project row.
     """
 
-    def __init__(self, db_session: AsyncSession):
+    in_chunk_size = 500
+    insert_chunk_size = 500
+    stream_batch_size = 1000
+
+    def __init__(
+        self,
+        db_session: SessionSource,
+        use_outbox: bool = False,
+        auto_commit: bool = True,
+        replica: ReplicaRouter | None = None,
+    ):
+        if not auto_commit and isinstance(db_session, async_sessionmaker):
+            raise ValueError("auto_commit=False needs a session; per-operation sessions would discard the writes")
+
         self.db_session = db_session
+        self.use_outbox = use_outbox
+        self.auto_commit = auto_commit
+        self.replica = replica
 
-    async def _get_orm(self, user_id: str, project_id: str) -> ProjectORM | None:
-        """Retrieve a project repository by its ID."""
+    def _session(self) -> AsyncContextManager[AsyncSession]:
+        """The session for one operation: the shared session, or a new one from the session factory."""
+        return use_session(self.db_session)
+
+    def _read_session(self) -> AsyncContextManager[AsyncSession]:
+        """The session for one read: on the replica when one is configured and usable."""
+        if self.replica is None:
+            return self._session()
+
+        return self.replica.session(self.db_session)
+
+    async def _commit(self, session: AsyncSession) -> None:
+        """Commit a write, or only flush it when the transaction belongs to a unit of work."""
+        if self.auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+
+        if self.replica is not None:
+            self.replica.record_write()
 
-        try:
-            result = await self.db_session.execute(
-                select(ProjectORM).filter_by(id=project_id, user_id=user_id)
-            )
+    async def _rollback(self, session: AsyncSession) -> None:
+        """Roll back after an error, unless the transaction belongs to a unit of work."""
+        if self.auto_commit:
+            await session.rollback()
 
-            return result.scalars().first()
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+    async def _get_row(self, user_id: str, project_id: str, columns: list | None = None) -> Row | None:
+        """Retrieve the columns of a project repository by its ID."""
+        if not (is_valid_id(user_id) and is_valid_id(project_id)):
+            return None
+
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(*(columns or project_columns())).filter_by(id=project_id, user_id=user_id)
+                )
+
+                return result.first()
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
     async def get(self, user_id: str, project_id: str) -> Project | None:
         """Retrieve a project repository by its ID."""
-        project_orm = await self._get_orm(user_id, project_id)
+        row = await self._get_row(user_id, project_id)
 
-        if project_orm:
-            return Project.model_validate(project_orm, from_attributes=True)
+        if row:
+            return Project.from_row(row)
 
         return None
 
-    async def get_all(self, user_id: str) -> list[Project]:
-        """Retrieve all project repositories for a user."""
+    async def get_many(self, user_id: str, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Retrieve several project repositories of a user, one IN query per chunk of IDs."""
+        if not is_valid_id(user_id):
+            return {}
+
+        ids = valid_ids(project_ids)
+        projects = {}
+
+        async with self._read_session() as session:
+            try:
+                for start in range(0, len(ids), self.in_chunk_size):
+                    result = await session.execute(
+                        select(*project_columns())
+                        .filter_by(user_id=user_id)
+                        .where(ProjectORM.id.in_(ids[start:start + self.in_chunk_size]))
+                    )
+
+                    for row in result.all():
+                        projects[row.id] = Project.from_row(row)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return projects
+
+    async def get_all(self, user_id: str, fields: Iterable[str] | None = None) -> list[Project] | list[PartialProject]:
+        """Retrieve all project repositories for a user, optionally only some of their fields."""
+        columns = project_columns(fields)
+        names = None if fields is None else [column.key for column in columns]
+
+        if not is_valid_id(user_id):
+            return []
+
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(*columns).filter_by(user_id=user_id)
+                )
+
+                return [project_from_row(row, names) for row in result.all()]
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+    async def list_page(
+        self, user_id: str, after_id: str | None = None, limit: int = 100, status: str | None = None
+    ) -> ProjectPage:
+        """Retrieve one page of a user's project repositories using keyset pagination on ID."""
+        if limit < 1:
+            raise ValueError(f"Page limit must be at least 1, got {limit}")
+
+        if not is_valid_id(user_id) or (after_id is not None and not is_valid_id(after_id)):
+            return ProjectPage(items=[])
+
+        statement = select(*project_columns()).filter_by(user_id=user_id)
+
+        if after_id is not None:
+            statement = statement.where(ProjectORM.id > after_id)
+
+        if status is not None:
+            statement = statement.filter_by(status=StatusORM(status))
 
-        try:
-            result = await self.db_session.execute(
-                select(ProjectORM).filter_by(user_id=user_id)
-            )
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(statement.order_by(ProjectORM.id).limit(limit + 1))
+                rows = result.all()
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
-            return [Project.model_validate(project, from_attributes=True) for project in result.scalars().all()]
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        items = [Project.from_row(row) for row in rows[:limit]]
+        next_cursor = items[-1].id if len(rows) > limit else None
+
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    async def iter_all(
+        self, user_id: str, batch_size: int | None = None, fields: Iterable[str] | None = None
+    ) -> AsyncIterator[Project] | AsyncIterator[PartialProject]:
+        """Stream all project repositories for a user, fetching batch_size rows at a time."""
+        batch_size = batch_size or self.stream_batch_size
+        columns = project_columns(fields)
+        names = None if fields is None else [column.key for column in columns]
+
+        if not is_valid_id(user_id):
+            return
+
+        async with self._read_session() as session:
+            try:
+                result = await session.stream(
+                    select(*columns)
+                    .filter_by(user_id=user_id)
+                    .order_by(ProjectORM.id)
+                    .execution_options(yield_per=batch_size)
+                )
+
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield project_from_row(row, names)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+    async def list_by_status(
+        self, status: str, limit: int = 100, fields: Iterable[str] | None = None
+    ) -> list[Project] | list[PartialProject]:
+        """Retrieve project repositories in a given status, served by the (status, user_id) index."""
+        columns = project_columns(fields)
+        names = None if fields is None else [column.key for column in columns]
+
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(*columns)
+                    .filter_by(status=StatusORM(status))
+                    .order_by(ProjectORM.user_id)
+                    .limit(limit)
+                )
+
+                return [project_from_row(row, names) for row in result.all()]
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+    async def count_by_status(self, user_id: str) -> dict[str, int]:
+        """Count a user's project repositories per status with a single GROUP BY."""
+        if not is_valid_id(user_id):
+            return {}
+
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(ProjectORM.status, func.count())
+                    .filter_by(user_id=user_id)
+                    .group_by(ProjectORM.status)
+                )
+
+                return {status.value: count for status, count in result.all()}
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
     async def create(self, user_id: str, project_create_args: ProjectCreateArgs) -> Project | None:
         """Create a new project repository."""
         project = ProjectORM(
             repo_url=project_create_args.repo_url,
-            environment_variables=project_create_args.environment_variables
+            environment_variables=project_create_args.environment_variables,
+            user_id=user_id,
         )
 
-        try:
-            self.db_session.add(project)
-            await self.db_session.commit()
-            await self.db_session.refresh(project)
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        async with self._session() as session:
+            try:
+                session.add(project)
+
+                if self.use_outbox:
+                    await session.flush()
+                    await enqueue_event(session, ProjectCreatedEvent(project.id))
+
+                await self._commit(session)
+                await session.refresh(project)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        if self.replica is None:
+            return await self.get(user_id, project.id)
+
+        with self.replica.primary():
+            return await self.get(user_id, project.id)
 
-        return await self.get(user_id, project.id)
+    async def create_many(self, user_id: str, project_create_args: Iterable[ProjectCreateArgs]) -> list[Project]:
+        """Create several project repositories with one multi-row INSERT ... RETURNING per chunk."""
+        rows = [
+            {
+                "repo_url": args.repo_url,
+                "environment_variables": args.environment_variables,
+                "user_id": user_id,
+            }
+            for args in project_create_args
+        ]
+        projects = []
+
+        async with self._session() as session:
+            try:
+                for start in range(0, len(rows), self.insert_chunk_size):
+                    result = await session.scalars(
+                        insert(ProjectORM).returning(ProjectORM, sort_by_parameter_order=True),
+                        rows[start:start + self.insert_chunk_size],
+                    )
+
+                    projects.extend(Project.from_row(project) for project in result.all())
+
+                if self.use_outbox:
+                    for project in projects:
+                        await enqueue_event(session, ProjectCreatedEvent(project.id))
+
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return projects
+
+    async def upsert_many(self, user_id: str, projects: Iterable[Project]) -> list[Project]:
+        """
+        Create or update several project repositories by ID with INSERT ... ON CONFLICT ... RETURNING.
+        When an ID is repeated, the last project given for it is written.
+        """
+        rows = [
+            {
+                "id": project.id or str(uuid.uuid4()),
+                "repo_url": project.repo_url,
+                "environment_variables": project.environment_variables,
+                "status": StatusORM(project.status),
+                "user_id": user_id,
+            }
+            for project in projects
+        ]
+        # ON CONFLICT DO UPDATE cannot touch a row twice in one statement, so the last row per ID wins.
+        rows = list({row["id"]: row for row in rows}.values())
+        upserted = []
+
+        async with self._session() as session:
+            try:
+                for start in range(0, len(rows), self.insert_chunk_size):
+                    statement = upsert_insert(session, ProjectORM).values(rows[start:start + self.insert_chunk_size])
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[ProjectORM.id],
+                        set_={
+                            "repo_url": statement.excluded.repo_url,
+                            "environment_variables": statement.excluded.environment_variables,
+                            "status": statement.excluded.status,
+                        },
+                        where=ProjectORM.user_id == statement.excluded.user_id,
+                    )
+
+                    result = await session.scalars(
+                        statement.returning(ProjectORM),
+                        execution_options={"populate_existing": True},
+                    )
+
+                    upserted.extend(Project.from_row(project) for project in result.all())
+
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return upserted
 
     async def update(self, user_id: str, project_id: str, project_update_args: ProjectUpdateArgs) -> bool:
-        """Update an existing project repository."""
-        existing_project = await self._get_orm(user_id, project_id)
+        """Update an existing project repository with a single UPDATE statement."""
+        values = project_update_args.model_dump(mode="json", exclude_unset=True)
 
-        if not existing_project:
+        if not (is_valid_id(user_id) and is_valid_id(project_id)):
             return False
 
-        for key, value in project_update_args.model_dump(mode="json", exclude_unset=True).items():
-            setattr(existing_project, key, value)
+        if not values:
+            return await self._get_row(user_id, project_id, project_columns([])) is not None
 
-        try:
-            await self.db_session.commit()
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        async with self._session() as session:
+            try:
+                result = await session.execute(
+                    update(ProjectORM)
+                    .filter_by(id=project_id, user_id=user_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
-        return True
+        return result.rowcount > 0
 
     async def delete(self, user_id: str, project_id: str) -> bool:
-        """Delete a project repository by its ID."""
-        project = await self._get_orm(user_id, project_id)
-
-        if not project:
+        """Delete a project repository by its ID with a single DELETE statement."""
+        if not (is_valid_id(user_id) and is_valid_id(project_id)):
             return False
-        
-        try:
-            await self.db_session.delete(project)
-            await self.db_session.commit()
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
-
-        return True
+
+        async with self._session() as session:
+            try:
+                result = await session.execute(
+                    delete(ProjectORM)
+                    .filter_by(id=project_id, user_id=user_id)
+                    .execution_options(synchronize_session=False)
+                )
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return result.rowcount > 0
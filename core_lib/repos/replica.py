@@ -0,0 +1,156 @@
+"""Routes repository reads to a read replica."""
+
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+import time
+from typing import AsyncIterator, Callable, Hashable, Iterator
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from core_lib.repos.session import SessionSource, use_session
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RoutingStats:
+    '''Counts of reads served by the replica and the primary'''
+    replica_reads: int = 0
+    primary_reads: int = 0
+    fallbacks: int = 0
+
+class ReplicaRouter:
+    """
+    Sends repository reads to a replica instead of the primary.
+
+    Share one router between the repositories of a service. After a write,
+    reads by the same caller stay on the primary for read_your_writes
+    seconds, so a caller sees its own writes despite replication lag.
+    Requests run in separate tasks, so wrap each one in caller() with a key
+    identifying who made it, such as a user or session ID; the pin then
+    follows that key across requests. Without a caller key, the pin only
+    covers the asyncio context that wrote. When a replica session cannot
+    connect, the read falls back to the primary and the replica is skipped
+    for retry_after seconds.
+    """
+
+    max_pins = 10_000
+
+    def __init__(
+        self,
+        replica: AsyncEngine | async_sessionmaker[AsyncSession],
+        read_your_writes: float = 0.0,
+        retry_after: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if isinstance(replica, AsyncEngine):
+            replica = async_sessionmaker(replica, expire_on_commit=False)
+
+        self.session_factory = replica
+        self.read_your_writes = read_your_writes
+        self.retry_after = retry_after
+        self.clock = clock
+        self.stats = RoutingStats()
+
+        self._pinned_until: ContextVar[float] = ContextVar(f"replica_pinned_until_{id(self)}", default=0.0)
+        self._caller: ContextVar[Hashable | None] = ContextVar(f"replica_caller_{id(self)}", default=None)
+        self._pins: dict[Hashable, float] = {}
+        self._forced: ContextVar[bool] = ContextVar(f"replica_forced_{id(self)}", default=False)
+        self._down_until = 0.0
+
+    def record_write(self) -> None:
+        """Pin the current caller, or the current context, to the primary for the read-your-writes window."""
+        if self.read_your_writes <= 0:
+            return
+
+        pinned_until = self.clock() + self.read_your_writes
+        key = self._caller.get()
+
+        if key is None:
+            self._pinned_until.set(pinned_until)
+            return
+
+        if len(self._pins) >= self.max_pins:
+            self._drop_expired_pins()
+
+        self._pins[key] = pinned_until
+
+    @contextmanager
+    def caller(self, key: Hashable) -> Iterator[None]:
+        """
+        Attribute the reads and writes made inside the block to a caller, so
+        read-your-writes pins carry over to that caller's later requests.
+        :param key: Identifies the caller, e.g. a user or session ID.
+        """
+        token = self._caller.set(key)
+
+        try:
+            yield
+        finally:
+            self._caller.reset(token)
+
+    @contextmanager
+    def primary(self) -> Iterator[None]:
+        """Send every read made inside the block to the primary."""
+        token = self._forced.set(True)
+
+        try:
+            yield
+        finally:
+            self._forced.reset(token)
+
+    def use_replica(self) -> bool:
+        """Whether a read made now, in the current context, may go to the replica."""
+        if self._forced.get():
+            return False
+
+        now = self.clock()
+        key = self._caller.get()
+        pinned_until = self._pinned_until.get() if key is None else self._pins.get(key, 0.0)
+
+        return now >= pinned_until and now >= self._down_until
+
+    @asynccontextmanager
+    async def session(self, primary: SessionSource) -> AsyncIterator[AsyncSession]:
+        """
+        Yield the session to run one read in.
+        :param primary: The repository's own session or session factory, used when the replica is not.
+        """
+        replica_session = await self._connect() if self.use_replica() else None
+
+        if replica_session is None:
+            self.stats.primary_reads += 1
+
+            async with use_session(primary) as session:
+                yield session
+
+            return
+
+        self.stats.replica_reads += 1
+
+        async with replica_session:
+            yield replica_session
+
+    def _drop_expired_pins(self) -> None:
+        """Forget the callers whose read-your-writes window has passed."""
+        now = self.clock()
+
+        for key in [key for key, pinned_until in self._pins.items() if pinned_until <= now]:
+            del self._pins[key]
+
+    async def _connect(self) -> AsyncSession | None:
+        """Open a replica session with a live connection, or None if the replica is unavailable."""
+        session = self.session_factory()
+
+        try:
+            await session.connection()
+        except (DBAPIError, OSError):
+            await session.close()
+            logger.warning("Read replica unavailable, reading from the primary", exc_info=True)
+
+            self.stats.fallbacks += 1
+            self._down_until = self.clock() + self.retry_after
+
+            return None
+
+        return session
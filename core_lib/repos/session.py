@@ -0,0 +1,22 @@
+"""Session handling shared by the SQLAlchemy repositories."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+SessionSource = AsyncSession | async_sessionmaker[AsyncSession]
+
+@asynccontextmanager
+async def use_session(source: SessionSource) -> AsyncIterator[AsyncSession]:
+    """
+    Yield the session to run one repository operation in.
+    A session is used as is and left open; a session factory opens a new
+    session that is closed when the operation ends.
+    :param source: A session, or a factory of short-lived sessions.
+    """
+    if not isinstance(source, async_sessionmaker):
+        yield source
+        return
+
+    async with source() as session:
+        yield session
@@ -0,0 +1,53 @@
+"""Groups writes across repositories into a single transaction."""
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from core_lib.repos.project import SQLAlchemyProjectRepository
+from core_lib.repos.user import SQLAlchemyUserRepository
+
+class UnitOfWork:
+    """
+    Async context manager giving user and project repositories that share one
+    session. Their writes are flushed but not committed; the transaction is
+    committed once when the block exits, or rolled back if it raises.
+
+        async with UnitOfWork(session_factory) as uow:
+            user = await uow.users.create(user_create_args)
+            await uow.projects.create_many(user.id, project_create_args)
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], use_outbox: bool = False):
+        self.session_factory = session_factory
+        self.use_outbox = use_outbox
+
+        self.session: AsyncSession | None = None
+        self.users: SQLAlchemyUserRepository | None = None
+        self.projects: SQLAlchemyProjectRepository | None = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self.session is not None:
+            raise RuntimeError("UnitOfWork is already in use")
+
+        self.session = self.session_factory()
+        self.users = SQLAlchemyUserRepository(self.session, auto_commit=False)
+        self.projects = SQLAlchemyProjectRepository(self.session, use_outbox=self.use_outbox, auto_commit=False)
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        session, self.session = self.session, None
+
+        try:
+            if exc_type is None:
+                await session.commit()
+            else:
+                await session.rollback()
+        finally:
+            await session.close()
+
+    async def commit(self) -> None:
+        """Commit the writes made so far and start a new transaction."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Discard the writes made since the last commit."""
+        await self.session.rollback()
@@ -1,9 +1,17 @@
 from .user_repo import UserRepository
 from .sql_alchemy import SQLAlchemyUserRepository
 from .noop import NoopUserRepository
+from .cached import CachedUserRepository
+from .batching import BatchingUserRepository
+from .in_memory import InMemoryUserRepository
+from .instrumented import InstrumentedUserRepository
 
 __all__ = [
+    "BatchingUserRepository",
+    "CachedUserRepository",
+    "InMemoryUserRepository",
+    "InstrumentedUserRepository",
     "UserRepository",
     "SQLAlchemyUserRepository",
     "NoopUserRepository",
-]
\ No newline at end of file
+]
@@ -0,0 +1,74 @@
+"""Coalesces concurrent UserRepository.get calls into batched lookups."""
+
+import asyncio
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
+from core_lib.repos.loader import BatchLoader
+from . import UserRepository
+
+class BatchingUserRepository(UserRepository):
+    """
+    Wraps a UserRepository so that get() calls made in the same event-loop
+    tick are deduplicated and served by a single get_many() on the wrapped
+    repository. Results are memoized, so create one instance per request.
+    """
+
+    def __init__(self, repo: UserRepository):
+        self.repo = repo
+        self.loader = BatchLoader(repo.get_many)
+
+    async def get(self, user_id: str) -> User | None:
+        """Retrieve a User by its ID, batched with concurrent lookups."""
+        return await self.loader.load(user_id)
+
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users through the same batches as get()."""
+        ids = list(dict.fromkeys(user_ids))
+        users = await asyncio.gather(*(self.loader.load(user_id) for user_id in ids))
+
+        return {user_id: user for user_id, user in zip(ids, users) if user is not None}
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """Retrieve a User together with their projects."""
+        return await self.repo.get_with_projects(user_id, project_limit)
+
+    async def create(self, user_create_args: UserCreateArgs) -> User | None:
+        """Create a new User."""
+        user = await self.repo.create(user_create_args)
+
+        if user is not None:
+            self.loader.clear(user.id)
+
+        return user
+
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create several Users."""
+        users = await self.repo.create_many(user_create_args)
+
+        for user in users:
+            self.loader.clear(user.id)
+
+        return users
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create or update several Users."""
+        users = await self.repo.upsert_many(user_create_args)
+
+        for user in users:
+            self.loader.clear(user.id)
+
+        return users
+
+    async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
+        """Update an existing User."""
+        try:
+            return await self.repo.update(user_id, user_update_args)
+        finally:
+            self.loader.clear(user_id)
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a User by its ID."""
+        try:
+            return await self.repo.delete(user_id)
+        finally:
+            self.loader.clear(user_id)
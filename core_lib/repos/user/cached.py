@@ -0,0 +1,130 @@
+"""Read-through cache in front of any UserRepository."""
+
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
+from core_lib.events import Event
+from core_lib.repos.cache import MISSING, CacheStats, SingleFlight, TTLCache
+from . import UserRepository
+
+class CachedUserRepository(UserRepository):
+    """
+    Caches User lookups from a wrapped UserRepository.
+    Misses are cached for the cache's negative TTL, concurrent misses for the
+    same User are coalesced into one lookup, and writes made through this
+    repository invalidate the affected entries.
+    """
+
+    def __init__(self, repo: UserRepository, cache: TTLCache | None = None):
+        self.repo = repo
+        self.cache = cache or TTLCache()
+        self._single_flight = SingleFlight()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters."""
+        return self.cache.stats
+
+    async def get(self, user_id: str) -> User | None:
+        """Retrieve a User by its ID, from the cache when possible."""
+        user = self.cache.get(user_id)
+
+        if user is not MISSING:
+            return user
+
+        return await self._single_flight.do(user_id, lambda: self._load(user_id))
+
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users, loading only the uncached ones."""
+        users = {}
+        missing = []
+
+        for user_id in dict.fromkeys(user_ids):
+            user = self.cache.get(user_id)
+
+            if user is MISSING:
+                missing.append(user_id)
+            elif user is not None:
+                users[user_id] = user
+
+        if missing:
+            version = self.cache.version
+            loaded = await self.repo.get_many(missing)
+
+            for user_id in missing:
+                self.cache.set(user_id, loaded.get(user_id), version)
+
+            users.update(loaded)
+
+        return users
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """Retrieve a User together with their projects."""
+        return await self.repo.get_with_projects(user_id, project_limit)
+
+    async def create(self, user_create_args: UserCreateArgs) -> User | None:
+        """Create a new User and cache it."""
+        user = await self.repo.create(user_create_args)
+
+        if user is not None:
+            self.cache.set(user.id, user)
+
+        return user
+
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create several Users and cache them."""
+        users = await self.repo.create_many(user_create_args)
+
+        for user in users:
+            self.cache.set(user.id, user)
+
+        return users
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create or update several Users and refresh their cache entries.
+        Users are matched by username, so the IDs a failed call may have
+        written are unknown and the whole cache is dropped instead.
+        """
+        try:
+            users = await self.repo.upsert_many(user_create_args)
+        except BaseException:
+            self.cache.clear()
+            raise
+
+        for user in users:
+            self.cache.invalidate(user.id)
+            self.cache.set(user.id, user)
+
+        return users
+
+    async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
+        """Update an existing User and drop its cache entry."""
+        try:
+            return await self.repo.update(user_id, user_update_args)
+        finally:
+            self.cache.invalidate(user_id)
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a User and drop its cache entry."""
+        try:
+            return await self.repo.delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
+
+    async def on_event(self, event: Event) -> None:
+        """
+        Invalidate the User named by an incoming event's user_id, if any.
+        Meant to be registered as a subscriber handler.
+        """
+        user_id = (await event.to_dict()).get("user_id")
+
+        if user_id is not None:
+            self.cache.invalidate(user_id)
+
+    async def _load(self, user_id: str) -> User | None:
+        """Load a User from the wrapped repository and cache the result."""
+        version = self.cache.version
+        user = await self.repo.get(user_id)
+        self.cache.set(user_id, user, version)
+
+        return user
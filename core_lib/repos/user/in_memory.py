@@ -0,0 +1,183 @@
+"""In-memory UserRepository with hash indexes, for tests and benchmarks."""
+
+import asyncio
+import uuid
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
+from core_lib.repos.project.in_memory import InMemoryProjectRepository
+from . import UserRepository
+
+UPSERT_FIELDS = (
+    "email",
+    "oauth_provider",
+    "encrypted_oauth_token",
+    "encrypted_refresh_token",
+    "oauth_token_expires_at",
+)
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Keeps Users in process memory with the same semantics as the SQLAlchemy
+    repository. Users are indexed by ID, username and email; usernames and
+    emails are unique, and a write that would break that raises ValueError
+    without changing anything. Writes are serialized with an asyncio.Lock.
+    Returned models are shared with the store and must not be mutated.
+    When given a project repository, get_with_projects reads from it and
+    delete removes the User's projects too.
+    """
+
+    def __init__(self, projects: InMemoryProjectRepository | None = None):
+        self.projects = projects or InMemoryProjectRepository()
+
+        self._users: dict[str, User] = {}
+        self._by_username: dict[str, str] = {}
+        self._by_email: dict[str, str] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, user_id: str) -> User | None:
+        """Retrieve a User by its ID."""
+        return self._users.get(user_id)
+
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users by their IDs."""
+        return {user_id: self._users[user_id] for user_id in dict.fromkeys(user_ids) if user_id in self._users}
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """Retrieve a User together with their projects, ordered by ID."""
+        user = self._users.get(user_id)
+
+        if user is None:
+            return None
+
+        projects = [project async for project in self.projects.iter_all(user_id)]
+
+        return UserWithProjects(user=user, projects=projects[:project_limit])
+
+    async def create(self, user_create_args: UserCreateArgs) -> User | None:
+        """Create a new User."""
+        [user] = await self.create_many([user_create_args])
+
+        return user
+
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create several Users, all or none of them.
+        :raises ValueError: If a username or email is already taken.
+        """
+        users = [self._new_user(args) for args in user_create_args]
+
+        async with self._lock:
+            self._check_unique(users)
+
+            for user in users:
+                self._put(user)
+
+        return users
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create several Users, updating the existing User with the same username instead.
+        :raises ValueError: If an email is already taken by another User.
+        """
+        user_create_args = list({args.username: args for args in user_create_args}.values())
+
+        async with self._lock:
+            users = []
+
+            for args in user_create_args:
+                user = self._new_user(args)
+                existing_id = self._by_username.get(user.username)
+
+                if existing_id is not None:
+                    user = self._users[existing_id].model_copy(
+                        update={field: getattr(user, field) for field in UPSERT_FIELDS}
+                    )
+
+                users.append(user)
+
+            self._check_unique(users)
+
+            for user in users:
+                self._put(user)
+
+        return users
+
+    async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
+        """
+        Update an existing User.
+        :raises ValueError: If the new username or email is already taken.
+        """
+        values = user_update_args.model_dump(exclude_unset=True)
+
+        async with self._lock:
+            user = self._users.get(user_id)
+
+            if user is None:
+                return False
+
+            user = User.model_validate({**user.model_dump(), **values})
+            self._check_unique([user])
+            self._put(user)
+
+        return True
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a User by its ID, together with their projects."""
+
+        async with self._lock:
+            user = self._users.pop(user_id, None)
+
+            if user is None:
+                return False
+
+            self._by_username.pop(user.username, None)
+
+            if user.email is not None:
+                self._by_email.pop(user.email, None)
+
+        await self.projects.delete_all(user_id)
+
+        return True
+
+    @staticmethod
+    def _new_user(user_create_args: UserCreateArgs) -> User:
+        """A new User with a fresh ID."""
+        return User.model_validate({"id": str(uuid.uuid4()), **user_create_args.model_dump()})
+
+    def _check_unique(self, users: list[User]) -> None:
+        """
+        Check that storing the Users would keep usernames and emails unique.
+        :raises ValueError: If a username or email belongs to another User.
+        """
+        usernames: dict[str, str] = {}
+        emails: dict[str, str] = {}
+
+        for user in users:
+            if self._by_username.get(user.username, user.id) != user.id or usernames.get(user.username, user.id) != user.id:
+                raise ValueError(f"Username already taken: {user.username}")
+
+            usernames[user.username] = user.id
+
+            if user.email is None:
+                continue
+
+            if self._by_email.get(user.email, user.id) != user.id or emails.get(user.email, user.id) != user.id:
+                raise ValueError(f"Email already taken: {user.email}")
+
+            emails[user.email] = user.id
+
+    def _put(self, user: User) -> None:
+        """Store a User and update the indexes."""
+        previous = self._users.get(user.id)
+
+        if previous is not None:
+            self._by_username.pop(previous.username, None)
+
+            if previous.email is not None:
+                self._by_email.pop(previous.email, None)
+
+        self._users[user.id] = user
+        self._by_username[user.username] = user.id
+
+        if user.email is not None:
+            self._by_email[user.email] = user.id
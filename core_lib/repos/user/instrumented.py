@@ -0,0 +1,50 @@
+"""Records metrics for the calls made to any UserRepository."""
+
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
+from core_lib.metrics import MetricsRegistry, default_registry
+from core_lib.repos.instrumentation import RepositoryMetrics
+from . import UserRepository
+
+class InstrumentedUserRepository(UserRepository):
+    """
+    Wraps a UserRepository and records the latency, query count, rows
+    returned and errors of every call in a MetricsRegistry. Query counts need
+    the engine to be instrumented with core_lib.metrics.instrument_engine.
+    """
+
+    def __init__(self, repo: UserRepository, registry: MetricsRegistry = default_registry, name: str = "user"):
+        self.repo = repo
+        self.metrics = RepositoryMetrics(name, registry)
+
+    async def get(self, user_id: str) -> User | None:
+        """Retrieve a User by its ID."""
+        return await self.metrics.call("get", self.repo.get, user_id)
+
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users by their IDs."""
+        return await self.metrics.call("get_many", self.repo.get_many, user_ids)
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """Retrieve a User together with their projects."""
+        return await self.metrics.call("get_with_projects", self.repo.get_with_projects, user_id, project_limit)
+
+    async def create(self, user_create_args: UserCreateArgs) -> User | None:
+        """Create a new User."""
+        return await self.metrics.call("create", self.repo.create, user_create_args)
+
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create several Users."""
+        return await self.metrics.call("create_many", self.repo.create_many, user_create_args)
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create or update several Users."""
+        return await self.metrics.call("upsert_many", self.repo.upsert_many, user_create_args)
+
+    async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
+        """Update an existing User."""
+        return await self.metrics.call("update", self.repo.update, user_id, user_update_args)
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a User by its ID."""
+        return await self.metrics.call("delete", self.repo.delete, user_id)
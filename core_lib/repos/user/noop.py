@@ -1,7 +1,8 @@
 """Noop User Repository for testing purposes."""
 
 import datetime
-from core_lib.domain import User, UserCreateArgs, UserUpdateArgs
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
 from . import UserRepository
 
 class NoopUserRepository(UserRepository):
@@ -21,6 +22,14 @@ class NoopUserRepository(UserRepository):
             oauth_token_expires_at=datetime.datetime.now() + datetime.timedelta(hours=1),
         )
 
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users by their IDs."""
+        return {user_id: await self.get(user_id) for user_id in user_ids}
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """Retrieve a User together with their projects."""
+        return UserWithProjects(user=await self.get(user_id), projects=[])
+
     async def create(self, user_create_args: UserCreateArgs) -> User | None:
         """Create a new User."""
         return User(
@@ -33,6 +42,14 @@ class NoopUserRepository(UserRepository):
                 oauth_token_expires_at=datetime.datetime.now() + datetime.timedelta(hours=1),
             )
 
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create several Users."""
+        return [await self.create(args) for args in user_create_args]
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create or update several Users."""
+        return await self.create_many(user_create_args)
+
     async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
         """Update an existing User."""
         return True
@@ -1,94 +1,294 @@
 """Defines the UserRepo interface for managing User repositories."""
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from core_lib.orm import UserORM
-from core_lib.domain import User, UserCreateArgs, UserUpdateArgs
+import uuid
+from typing import AsyncContextManager, Iterable
+from sqlalchemy import Row, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from core_lib.orm import ProjectORM, UserORM
+from core_lib.domain import Project, User, UserCreateArgs, UserUpdateArgs, UserWithProjects
+from core_lib.repos.dialect import upsert_insert
+from core_lib.repos.ids import is_valid_id, valid_ids
+from core_lib.repos.replica import ReplicaRouter
+from core_lib.repos.session import SessionSource, use_session
+from core_lib.repos.project.sql_alchemy import PROJECT_COLUMNS
 from . import UserRepository
 
+UPSERT_COLUMNS = (
+    "email",
+    "oauth_provider",
+    "encrypted_oauth_token",
+    "encrypted_refresh_token",
+    "oauth_token_expires_at",
+)
+
+USER_COLUMNS = tuple(getattr(UserORM, name) for name in User.model_fields)
+
 class SQLAlchemyUserRepository(UserRepository):
     """
     Abstract base class for User repository management.
     This class defines the interface for managing User repositories, including
     creating, retrieving, updating, and deleting User repositories.
+    Malformed IDs, and UUIDs not in canonical lower-case form, match nothing,
+    so lookups by them return not found.
+    Given an async_sessionmaker instead of a session, every operation runs in
+    its own short-lived session, so one repository can serve concurrent tasks.
+    With auto_commit off, writes are flushed but left for the caller to commit,
+    so it needs a session rather than a session factory;
+    UnitOfWork builds repositories this way.
+    Given a ReplicaRouter, read methods run on the read replica it manages.
     """
 
-    def __init__(self, db_session: AsyncSession):
+    in_chunk_size = 500
+    insert_chunk_size = 500
+
+    def __init__(self, db_session: SessionSource, auto_commit: bool = True, replica: ReplicaRouter | None = None):
+        if not auto_commit and isinstance(db_session, async_sessionmaker):
+            raise ValueError("auto_commit=False needs a session; per-operation sessions would discard the writes")
+
         self.db_session = db_session
+        self.auto_commit = auto_commit
+        self.replica = replica
+
+    def _session(self) -> AsyncContextManager[AsyncSession]:
+        """The session for one operation: the shared session, or a new one from the session factory."""
+        return use_session(self.db_session)
+
+    def _read_session(self) -> AsyncContextManager[AsyncSession]:
+        """The session for one read: on the replica when one is configured and usable."""
+        if self.replica is None:
+            return self._session()
+
+        return self.replica.session(self.db_session)
+
+    async def _commit(self, session: AsyncSession) -> None:
+        """Commit a write, or only flush it when the transaction belongs to a unit of work."""
+        if self.auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+
+        if self.replica is not None:
+            self.replica.record_write()
 
-    async def _get_orm(self, user_id: str) -> UserORM | None:
-        """Retrieve a project repository by its ID."""
+    async def _rollback(self, session: AsyncSession) -> None:
+        """Roll back after an error, unless the transaction belongs to a unit of work."""
+        if self.auto_commit:
+            await session.rollback()
 
-        try:
-            result = await self.db_session.execute(
-                select(UserORM).filter_by(id=user_id)
-            )
+    async def _get_row(self, user_id: str) -> Row | None:
+        """Retrieve the columns of a User by its ID."""
+        if not is_valid_id(user_id):
+            return None
 
-            return result.scalars().first()
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(*USER_COLUMNS).filter_by(id=user_id)
+                )
+
+                return result.first()
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
     async def get(self, user_id: str) -> User | None:
         """Retrieve a User by its ID."""
-        user_orm = await self._get_orm(user_id)
+        row = await self._get_row(user_id)
 
-        if user_orm:
-            return User.model_validate(user_orm, from_attributes=True)
+        if row:
+            return User.from_row(row)
 
         return None
 
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Retrieve several Users by their IDs, one IN query per chunk of IDs."""
+        ids = valid_ids(user_ids)
+        users = {}
+
+        async with self._read_session() as session:
+            try:
+                for start in range(0, len(ids), self.in_chunk_size):
+                    result = await session.execute(
+                        select(*USER_COLUMNS).where(UserORM.id.in_(ids[start:start + self.in_chunk_size]))
+                    )
+
+                    for row in result.all():
+                        users[row.id] = User.from_row(row)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return users
+
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """
+        Retrieve a User together with their projects in one query.
+        The projects are ordered and limited in a subquery that is outer joined
+        to the User row, so a User without projects is still found.
+        """
+        if not is_valid_id(user_id):
+            return None
+
+        projects = (
+            select(*PROJECT_COLUMNS.values(), ProjectORM.user_id)
+            .filter_by(user_id=user_id)
+            .order_by(ProjectORM.id)
+            .limit(project_limit)
+            .subquery()
+        )
+        project_labels = {name: f"project_{name}" for name in PROJECT_COLUMNS}
+
+        async with self._read_session() as session:
+            try:
+                result = await session.execute(
+                    select(*USER_COLUMNS, *(projects.c[name].label(label) for name, label in project_labels.items()))
+                    .outerjoin(projects, projects.c.user_id == UserORM.id)
+                    .filter(UserORM.id == user_id)
+                    .order_by(projects.c.id)
+                )
+                rows = result.all()
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        if not rows:
+            return None
+
+        return UserWithProjects(
+            user=User.from_row(rows[0]),
+            projects=[
+                Project.from_row({name: row._mapping[label] for name, label in project_labels.items()})
+                for row in rows
+                if row._mapping[project_labels["id"]] is not None
+            ],
+        )
+
     async def create(self, user_create_args: UserCreateArgs) -> User | None:
         """Create a new User."""
-        user = UserORM(
-            username=user_create_args.username,
-            email=user_create_args.email,
-
-            oauth_provider=user_create_args.oauth_provider,
-            encrypted_oauth_token=user_create_args.encrypted_oauth_token,
-            encrypted_refresh_token=user_create_args.encrypted_refresh_token,
-            oauth_token_expires_at=user_create_args.oauth_token_expires_at,
-        )
+        user = UserORM(**self._create_values(user_create_args))
+
+        async with self._session() as session:
+            try:
+                session.add(user)
+                await self._commit(session)
+                await session.refresh(user)
+
+                return User.from_row(user)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """Create several Users with one multi-row INSERT ... RETURNING per chunk."""
+        rows = [self._create_values(args) for args in user_create_args]
+        users = []
+
+        async with self._session() as session:
+            try:
+                for start in range(0, len(rows), self.insert_chunk_size):
+                    result = await session.scalars(
+                        insert(UserORM).returning(UserORM, sort_by_parameter_order=True),
+                        rows[start:start + self.insert_chunk_size],
+                    )
+
+                    users.extend(User.from_row(user_orm) for user_orm in result.all())
 
-        try:
-            self.db_session.add(user)
-            await self.db_session.commit()
-            await self.db_session.refresh(user)
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
-            return User.model_validate(user, from_attributes=True)
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        return users
+
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create or update several Users by username with INSERT ... ON CONFLICT ... RETURNING.
+        When a username is repeated, the last arguments given for it are written.
+        """
+        rows = [{"id": str(uuid.uuid4()), **self._create_values(args)} for args in user_create_args]
+        # ON CONFLICT DO UPDATE cannot touch a row twice in one statement, so the last row per username wins.
+        rows = list({row["username"]: row for row in rows}.values())
+        users = []
+
+        async with self._session() as session:
+            try:
+                for start in range(0, len(rows), self.insert_chunk_size):
+                    statement = upsert_insert(session, UserORM).values(rows[start:start + self.insert_chunk_size])
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[UserORM.username],
+                        set_={column: statement.excluded[column] for column in UPSERT_COLUMNS},
+                    )
+
+                    result = await session.scalars(
+                        statement.returning(UserORM),
+                        execution_options={"populate_existing": True},
+                    )
+
+                    users.extend(User.from_row(user_orm) for user_orm in result.all())
+
+                await self._commit(session)
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+        return users
 
     async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
-        """Update an existing User."""
-        user_orm = await self._get_orm(user_id)
+        """Update an existing User with a single UPDATE statement."""
+        values = user_update_args.model_dump(mode="json", exclude_unset=True)
 
-        if not user_orm:
+        if not is_valid_id(user_id):
             return False
 
-        for key, value in user_update_args.model_dump(mode="json", exclude_unset=True).items():
-            setattr(user_orm, key, value)
-
-        try:
-            await self.db_session.commit()
-            await self.db_session.refresh(user_orm)
-            return True
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        async with self._session() as session:
+            try:
+                result = await session.execute(
+                    update(UserORM)
+                    .filter_by(id=user_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                await self._commit(session)
+                return result.rowcount > 0
+            except Exception as e:
+                await self._rollback(session)
+                raise e
 
     async def delete(self, user_id: str) -> bool:
-        """Delete a User by its ID."""
-        user_orm = await self._get_orm(user_id)
-
-        if not user_orm:
+        """
+        Delete a User by its ID.
+        The User's projects are deleted first in the same transaction, matching
+        the ORM delete-orphan cascade that a bulk DELETE would bypass.
+        """
+        if not is_valid_id(user_id):
             return False
 
-        try:
-            await self.db_session.delete(user_orm)
-            await self.db_session.commit()
-            return True
-        except Exception as e:
-            await self.db_session.rollback()
-            raise e
+        async with self._session() as session:
+            try:
+                await session.execute(
+                    delete(ProjectORM)
+                    .filter_by(user_id=user_id)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(
+                    delete(UserORM)
+                    .filter_by(id=user_id)
+                    .execution_options(synchronize_session=False)
+                )
+                await self._commit(session)
+                return result.rowcount > 0
+            except Exception as e:
+                await self._rollback(session)
+                raise e
+
+    @staticmethod
+    def _create_values(user_create_args: UserCreateArgs) -> dict:
+        """Column values for a new User row."""
+        return {
+            "username": user_create_args.username,
+            "email": user_create_args.email,
+            "oauth_provider": user_create_args.oauth_provider,
+            "encrypted_oauth_token": user_create_args.encrypted_oauth_token,
+            "encrypted_refresh_token": user_create_args.encrypted_refresh_token,
+            "oauth_token_expires_at": user_create_args.oauth_token_expires_at,
+        }
@@ -1,6 +1,7 @@
 """Defines the UserRepo interface for managing User repositories."""
 from abc import ABC, abstractmethod
-from core_lib.domain import User, UserCreateArgs, UserUpdateArgs
+from typing import Iterable
+from core_lib.domain import User, UserCreateArgs, UserUpdateArgs, UserWithProjects
 
 class UserRepository(ABC):
     """
@@ -17,6 +18,23 @@ class UserRepository(ABC):
         :return: The User object.
         """
 
+    @abstractmethod
+    async def get_many(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """
+        Retrieve several Users by their IDs.
+        :param user_ids: The IDs of the Users to retrieve.
+        :return: The found Users keyed by ID; missing IDs are omitted.
+        """
+
+    @abstractmethod
+    async def get_with_projects(self, user_id: str, project_limit: int | None = None) -> UserWithProjects | None:
+        """
+        Retrieve a User together with their projects in a single round trip.
+        :param user_id: The ID of the User to retrieve.
+        :param project_limit: The maximum number of projects to load, ordered by ID; None loads them all.
+        :return: The User and their projects, or None if the User does not exist.
+        """
+
     @abstractmethod
     async def create(self, user_create_args: UserCreateArgs) -> User | None:
         """
@@ -24,6 +42,21 @@ class UserRepository(ABC):
         :return: The created User repository object.
         """
 
+    @abstractmethod
+    async def create_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create several Users in a single transaction.
+        :return: The created Users, in the order of the arguments.
+        """
+
+    @abstractmethod
+    async def upsert_many(self, user_create_args: Iterable[UserCreateArgs]) -> list[User]:
+        """
+        Create several Users, updating the existing User with the same username instead.
+        When a username is repeated, the last arguments given for it are written.
+        :return: The created or updated Users.
+        """
+
     @abstractmethod
     async def update(self, user_id: str, user_update_args: UserUpdateArgs) -> bool:
         """
@@ -0,0 +1,18 @@
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from core_lib.orm.base import Base
+
+@pytest_asyncio.fixture
+async def sqlite_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'core_lib.db'}")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def session_factory(sqlite_engine):
+    return async_sessionmaker(sqlite_engine, expire_on_commit=False)
@@ -0,0 +1,33 @@
+from core_lib.domain import Project, ProjectCreateArgs, User, UserCreateArgs
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_user_args(i, email=None):
+    return UserCreateArgs(
+        username=f"user_{i}",
+        email=email or f"user_{i}@example.com",
+        oauth_provider="test_provider",
+        encrypted_oauth_token="encrypted_token",
+    )
+
+def make_project_args(i):
+    return ProjectCreateArgs(repo_url=f"repo_{i}", environment_variables={"i": i})
+
+def make_user(user_id):
+    return User(
+        id=user_id,
+        username=f"user_{user_id}",
+        email=None,
+        oauth_provider="test_provider",
+        encrypted_oauth_token="encrypted_token",
+        encrypted_refresh_token=None,
+        oauth_token_expires_at=None,
+    )
+
+def make_project(project_id):
+    return Project(id=project_id, repo_url="a", environment_variables={}, status="building")
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from core_lib.repos.project import BatchingProjectRepository, ProjectRepository
+from core_lib.repos.user import BatchingUserRepository, UserRepository
+from factories import make_project, make_user
+
+@pytest.mark.asyncio
+async def test_concurrent_user_gets_are_batched_and_deduped(mocker):
+    inner = mocker.AsyncMock(spec=UserRepository)
+    inner.get_many.side_effect = lambda ids: {user_id: make_user(user_id) for user_id in ids if user_id != "missing"}
+    repo = BatchingUserRepository(inner)
+
+    users = await asyncio.gather(repo.get("1"), repo.get("2"), repo.get("1"), repo.get("missing"))
+
+    inner.get_many.assert_awaited_once_with(["1", "2", "missing"])
+    assert [user.id if user else None for user in users] == ["1", "2", "1", None]
+
+@pytest.mark.asyncio
+async def test_results_are_memoized_until_a_write(mocker):
+    inner = mocker.AsyncMock(spec=UserRepository)
+    inner.get_many.side_effect = lambda ids: {user_id: make_user(user_id) for user_id in ids}
+    inner.delete.return_value = True
+    repo = BatchingUserRepository(inner)
+
+    await repo.get("1")
+    await repo.get("1")
+    assert inner.get_many.await_count == 1
+
+    await repo.delete("1")
+    await repo.get("1")
+    assert inner.get_many.await_count == 2
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_not_memoized(mocker):
+    inner = mocker.AsyncMock(spec=UserRepository)
+    inner.get_many.side_effect = [RuntimeError("db down"), {"1": make_user("1")}]
+    repo = BatchingUserRepository(inner)
+
+    with pytest.raises(RuntimeError):
+        await repo.get("1")
+
+    assert (await repo.get("1")).id == "1"
+
+@pytest.mark.asyncio
+async def test_project_gets_are_batched_per_owner(mocker):
+    inner = mocker.AsyncMock(spec=ProjectRepository)
+    inner.get_many.side_effect = lambda user_id, ids: {project_id: make_project(project_id) for project_id in ids}
+    repo = BatchingProjectRepository(inner)
+
+    projects = await asyncio.gather(
+        repo.get("owner", "a"),
+        repo.get("owner", "b"),
+        repo.get("other", "c"),
+    )
+
+    assert [project.id for project in projects] == ["a", "b", "c"]
+    assert sorted(call.args for call in inner.get_many.await_args_list) == [("other", ["c"]), ("owner", ["a", "b"])]
+
+@pytest.mark.asyncio
+async def test_per_owner_lookups_do_not_share_the_session_concurrently(mocker):
+    in_flight = []
+
+    async def get_many(user_id, ids):
+        in_flight.append(user_id)
+        assert len(in_flight) == 1
+        await asyncio.sleep(0)
+        in_flight.remove(user_id)
+        return {project_id: make_project(project_id) for project_id in ids}
+
+    inner = mocker.AsyncMock(spec=ProjectRepository)
+    inner.get_many.side_effect = get_many
+    repo = BatchingProjectRepository(inner)
+
+    projects = await asyncio.gather(repo.get("owner", "a"), repo.get("other", "b"))
+
+    assert [project.id for project in projects] == ["a", "b"]
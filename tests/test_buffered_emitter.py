@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import BufferedEventEmitter, NoopEventEmitter, OverflowPolicy
+
+@pytest.mark.asyncio
+async def test_emit_returns_before_publish_and_flush_delivers():
+    inner = NoopEventEmitter()
+    emitter = BufferedEventEmitter(inner, linger=10)
+    events = [ProjectCreatedEvent(project_id=str(i)) for i in range(5)]
+
+    for event in events:
+        await emitter.emit(event)
+
+    assert await inner.get_events() == []
+
+    await emitter.flush()
+
+    assert await inner.get_events() == events
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_for_linger(mocker):
+    inner = NoopEventEmitter()
+    inner.emit_many = mocker.AsyncMock(wraps=inner.emit_many)
+    emitter = BufferedEventEmitter(inner, batch_size=3, linger=10)
+
+    for i in range(3):
+        await emitter.emit(ProjectCreatedEvent(project_id=str(i)))
+
+    await asyncio.wait_for(emitter._queue.join(), timeout=1)
+
+    inner.emit_many.assert_awaited_once()
+    assert len(await inner.get_events()) == 3
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_linger_sends_partial_batch():
+    inner = NoopEventEmitter()
+    emitter = BufferedEventEmitter(inner, batch_size=100, linger=0.01)
+
+    await emitter.emit(ProjectCreatedEvent(project_id="1"))
+    await asyncio.wait_for(emitter._queue.join(), timeout=1)
+
+    assert len(await inner.get_events()) == 1
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_raise_policy_raises_when_full(mocker):
+    inner = NoopEventEmitter()
+    emitter = BufferedEventEmitter(inner, max_size=1, overflow_policy=OverflowPolicy.RAISE)
+    emitter._ensure_worker = mocker.Mock()
+
+    await emitter.emit(ProjectCreatedEvent(project_id="1"))
+
+    with pytest.raises(asyncio.QueueFull):
+        await emitter.emit(ProjectCreatedEvent(project_id="2"))
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_keeps_newest(mocker):
+    inner = NoopEventEmitter()
+    emitter = BufferedEventEmitter(inner, max_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    emitter._ensure_worker = mocker.Mock()
+    events = [ProjectCreatedEvent(project_id=str(i)) for i in range(3)]
+
+    for event in events:
+        await emitter.emit(event)
+
+    assert emitter.dropped == 1
+    assert [emitter._queue.get_nowait() for _ in range(2)] == events[1:]
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_worker(mocker):
+    inner = NoopEventEmitter()
+    inner.emit_many = mocker.AsyncMock(side_effect=[RuntimeError("broker down"), None])
+    emitter = BufferedEventEmitter(inner, linger=0)
+
+    await emitter.emit(ProjectCreatedEvent(project_id="1"))
+    await emitter.flush()
+    await emitter.emit(ProjectCreatedEvent(project_id="2"))
+    await emitter.flush()
+
+    assert inner.emit_many.await_count == 2
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_close_flushes_and_rejects_new_events():
+    inner = NoopEventEmitter()
+    emitter = BufferedEventEmitter(inner, linger=10)
+
+    await emitter.emit(ProjectCreatedEvent(project_id="1"))
+    await emitter.close()
+
+    assert len(await inner.get_events()) == 1
+
+    with pytest.raises(RuntimeError):
+        await emitter.emit(ProjectCreatedEvent(project_id="2"))
@@ -0,0 +1,58 @@
+import pytest
+from core_lib.domain import ProjectUpdateArgs
+from core_lib.events import ProjectCreatedEvent
+from core_lib.repos.project import CachedProjectRepository, ProjectRepository
+from factories import make_project
+
+@pytest.fixture
+def inner(mocker):
+    return mocker.AsyncMock(spec=ProjectRepository)
+
+@pytest.mark.asyncio
+async def test_get_is_cached_per_owner(inner):
+    inner.get.return_value = make_project("p")
+    repo = CachedProjectRepository(inner)
+
+    await repo.get("owner", "p")
+    await repo.get("owner", "p")
+    await repo.get("other", "p")
+
+    assert inner.get.await_count == 2
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_entry(inner):
+    inner.get.return_value = make_project("p")
+    inner.delete.return_value = True
+    repo = CachedProjectRepository(inner)
+
+    await repo.get("owner", "p")
+    await repo.delete("owner", "p")
+    inner.get.return_value = None
+
+    assert await repo.get("owner", "p") is None
+
+@pytest.mark.asyncio
+async def test_update_invalidates_even_when_inner_raises(inner):
+    inner.get.return_value = make_project("p")
+    inner.update.side_effect = RuntimeError("db down")
+    repo = CachedProjectRepository(inner)
+
+    await repo.get("owner", "p")
+
+    with pytest.raises(RuntimeError):
+        await repo.update("owner", "p", ProjectUpdateArgs(environment_variables={}))
+
+    await repo.get("owner", "p")
+    assert inner.get.await_count == 2
+
+@pytest.mark.asyncio
+async def test_created_event_clears_negative_entry(inner):
+    inner.get.return_value = None
+    repo = CachedProjectRepository(inner)
+
+    assert await repo.get("owner", "p") is None
+
+    inner.get.return_value = make_project("p")
+    await repo.on_event(ProjectCreatedEvent("p"))
+
+    assert (await repo.get("owner", "p")).id == "p"
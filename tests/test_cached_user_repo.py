@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+from core_lib.domain import UserUpdateArgs
+from core_lib.events import RawEvent
+from core_lib.repos.user import CachedUserRepository, UserRepository
+from factories import make_user
+
+@pytest.fixture
+def inner(mocker):
+    return mocker.AsyncMock(spec=UserRepository)
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_cache(inner):
+    inner.get.return_value = make_user("1")
+    repo = CachedUserRepository(inner)
+
+    assert (await repo.get("1")).id == "1"
+    assert (await repo.get("1")).id == "1"
+
+    inner.get.assert_awaited_once_with("1")
+    assert repo.stats.hits == 1
+    assert repo.stats.misses == 1
+
+@pytest.mark.asyncio
+async def test_missing_user_is_negatively_cached(inner):
+    inner.get.return_value = None
+    repo = CachedUserRepository(inner)
+
+    assert await repo.get("1") is None
+    assert await repo.get("1") is None
+
+    inner.get.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced(inner):
+    async def slow_get(user_id):
+        await asyncio.sleep(0)
+        return make_user(user_id)
+
+    inner.get.side_effect = slow_get
+    repo = CachedUserRepository(inner)
+
+    await asyncio.gather(*(repo.get("1") for _ in range(10)))
+
+    inner.get.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_update_invalidates_entry(inner):
+    inner.get.return_value = make_user("1")
+    inner.update.return_value = True
+    repo = CachedUserRepository(inner)
+
+    await repo.get("1")
+    await repo.update("1", UserUpdateArgs(
+        username="renamed",
+        email="renamed@example.com",
+        oauth_provider="test_provider",
+        encrypted_oauth_token="encrypted_token",
+    ))
+    await repo.get("1")
+
+    assert inner.get.await_count == 2
+
+@pytest.mark.asyncio
+async def test_get_many_only_loads_uncached_ids(inner):
+    inner.get.return_value = make_user("1")
+    inner.get_many.return_value = {"2": make_user("2")}
+    repo = CachedUserRepository(inner)
+
+    await repo.get("1")
+    result = await repo.get_many(["1", "2", "3"])
+
+    inner.get_many.assert_awaited_once_with(["2", "3"])
+    assert list(result) == ["1", "2"]
+    assert await repo.get("3") is None
+    inner.get.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_event_hook_invalidates_entry(inner):
+    inner.get.return_value = make_user("1")
+    repo = CachedUserRepository(inner)
+
+    await repo.get("1")
+    await repo.on_event(RawEvent("user.updated", {"user_id": "1"}))
+    await repo.get("1")
+
+    assert inner.get.await_count == 2
+
+@pytest.mark.asyncio
+async def test_failed_upsert_drops_cached_entries(inner):
+    inner.get.return_value = make_user("1")
+    inner.upsert_many.side_effect = RuntimeError("partial write")
+    repo = CachedUserRepository(inner)
+
+    await repo.get("1")
+
+    with pytest.raises(RuntimeError):
+        await repo.upsert_many([])
+
+    await repo.get("1")
+
+    assert inner.get.await_count == 2
@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+import aio_pika
+from core_lib.events.emitter import ChannelPool
+
+def make_connection(mocker):
+    connection = mocker.Mock(spec=aio_pika.RobustConnection)
+
+    async def open_channel():
+        channel = mocker.AsyncMock()
+        channel.is_closed = False
+        return channel
+
+    connection.channel = mocker.AsyncMock(side_effect=open_channel)
+    return connection
+
+@pytest.mark.asyncio
+async def test_acquire_reuses_idle_channel(mocker):
+    connection = make_connection(mocker)
+    pool = ChannelPool(connection, max_size=2)
+
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first is second
+    connection.channel.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_acquire_is_bounded(mocker):
+    connection = make_connection(mocker)
+    pool = ChannelPool(connection, max_size=2)
+    borrowed = []
+    release = asyncio.Event()
+
+    async def borrow():
+        async with pool.acquire() as channel:
+            borrowed.append(channel)
+            await release.wait()
+
+    tasks = [asyncio.create_task(borrow()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert len(borrowed) == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(borrowed) == 3
+    assert connection.channel.await_count == 2
+
+@pytest.mark.asyncio
+async def test_dead_channel_is_discarded(mocker):
+    connection = make_connection(mocker)
+    on_discard = mocker.Mock()
+    pool = ChannelPool(connection, on_discard=on_discard)
+
+    async with pool.acquire() as first:
+        first.is_closed = True
+
+    async with pool.acquire() as second:
+        pass
+
+    assert first is not second
+    on_discard.assert_called_once_with(first)
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_channels(mocker):
+    connection = make_connection(mocker)
+    pool = ChannelPool(connection)
+
+    async with pool.acquire() as channel:
+        pass
+
+    await pool.close()
+
+    channel.close.assert_awaited_once()
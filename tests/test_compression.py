@@ -0,0 +1,43 @@
+import pytest
+from core_lib.events import Compressor, JsonCodec, decode_message_body
+
+def test_small_body_is_left_alone():
+    compressor = Compressor(threshold=1024, algorithm="zlib")
+
+    body, content_encoding = compressor.compress(b"small")
+
+    assert body == b"small"
+    assert content_encoding is None
+    assert compressor.stats.messages_compressed == 0
+
+def test_large_body_is_compressed_and_decodes():
+    compressor = Compressor(threshold=1024, algorithm="zlib")
+    payload = {"logs": "build step ok\n" * 1000}
+    raw = JsonCodec().encode(payload)
+
+    body, content_encoding = compressor.compress(raw)
+
+    assert content_encoding == "zlib"
+    assert len(body) < len(raw)
+    assert compressor.stats.bytes_saved == len(raw) - len(body)
+    assert decode_message_body(body, "application/json", content_encoding) == payload
+
+def test_incompressible_body_is_sent_uncompressed():
+    compressor = Compressor(threshold=16, algorithm="zlib")
+    raw = bytes(range(256))
+
+    assert compressor.compress(raw) == (raw, None)
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    compressor = Compressor(threshold=16, algorithm="zstd")
+    raw = JsonCodec().encode({"env": "x" * 4096})
+
+    body, content_encoding = compressor.compress(raw)
+
+    assert content_encoding == "zstd"
+    assert decode_message_body(body, "application/json", content_encoding) == {"env": "x" * 4096}
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        Compressor(algorithm="lz4")
@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import ConfirmTracker, PublishNotConfirmedError
+
+@pytest.mark.asyncio
+async def test_track_keeps_window_of_publishes_in_flight():
+    tracker = ConfirmTracker(window=2)
+    release = asyncio.Event()
+
+    async def publish():
+        await release.wait()
+
+    await tracker.track(ProjectCreatedEvent("1"), publish)
+    await tracker.track(ProjectCreatedEvent("2"), publish)
+    third = asyncio.create_task(tracker.track(ProjectCreatedEvent("3"), publish))
+    await asyncio.sleep(0)
+
+    assert tracker.stats.in_flight == 2
+    assert not third.done()
+
+    release.set()
+    await third
+    await tracker.wait()
+
+    assert tracker.stats.confirmed == 3
+    assert tracker.stats.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_nack_is_raised_from_wait():
+    tracker = ConfirmTracker()
+    event = ProjectCreatedEvent("1")
+
+    async def publish():
+        raise RuntimeError("nacked")
+
+    await tracker.track(event, publish)
+
+    with pytest.raises(PublishNotConfirmedError) as exc_info:
+        await tracker.wait()
+
+    assert exc_info.value.failures[0][0] is event
+    assert tracker.stats.nacked == 1
+
+@pytest.mark.asyncio
+async def test_timeout_goes_to_callback(mocker):
+    on_nack = mocker.AsyncMock()
+    tracker = ConfirmTracker(timeout=0.01, on_nack=on_nack)
+    event = ProjectCreatedEvent("1")
+
+    async def publish():
+        await asyncio.sleep(1)
+
+    await tracker.track(event, publish)
+    await tracker.wait()
+
+    assert tracker.stats.timed_out == 1
+    on_nack.assert_awaited_once()
+    assert on_nack.await_args.args[0] is event
+    assert isinstance(on_nack.await_args.args[1], asyncio.TimeoutError)
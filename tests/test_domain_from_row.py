@@ -0,0 +1,26 @@
+from datetime import datetime
+from types import SimpleNamespace
+from core_lib.domain import Project, User
+from core_lib.orm import StatusORM
+
+def test_project_from_row_matches_model_validate():
+    row = SimpleNamespace(id="1", repo_url="a", environment_variables={"key": "value"}, status=StatusORM.RUNNING, user_id="2")
+
+    project = Project.from_row(row)
+
+    assert project == Project.model_validate(row, from_attributes=True)
+    assert project.status == "running"
+
+def test_user_from_row_matches_model_validate():
+    row = SimpleNamespace(
+        id="1",
+        username="u",
+        email="u@example.com",
+        oauth_provider="github",
+        encrypted_oauth_token="token",
+        encrypted_refresh_token=None,
+        oauth_token_expires_at=datetime(2030, 1, 1),
+        created_at=datetime(2020, 1, 1),
+    )
+
+    assert User.from_row(row) == User.model_validate(row, from_attributes=True)
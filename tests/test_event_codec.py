@@ -0,0 +1,66 @@
+import json
+import pytest
+from core_lib.events import (
+    Event,
+    EventSerializer,
+    JsonCodec,
+    OrjsonCodec,
+    ProjectCreatedEvent,
+    codec_for,
+)
+
+class CustomJsonEvent(Event):
+    @property
+    def event_type(self) -> str:
+        return "custom"
+
+    async def to_dict(self) -> dict:
+        return {"ignored": True}
+
+    async def to_json(self) -> str:
+        return '{"custom": true}'
+
+def test_json_codec_round_trip():
+    codec = JsonCodec()
+    body = codec.encode({"project_id": "123"})
+
+    assert body == b'{"project_id":"123"}'
+    assert codec.decode(body) == {"project_id": "123"}
+
+def test_orjson_codec_round_trip():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+
+    assert codec.decode(codec.encode({"project_id": "123"})) == {"project_id": "123"}
+
+def test_codec_for_rejects_unknown_content_type():
+    assert codec_for("application/json").content_type == "application/json; charset=utf-8"
+    assert codec_for("Application/JSON; charset=utf-8").content_type == "application/json; charset=utf-8"
+    assert codec_for(None).content_type == "application/json; charset=utf-8"
+
+    with pytest.raises(ValueError):
+        codec_for("text/plain")
+
+@pytest.mark.asyncio
+async def test_serializer_encodes_event_payload():
+    serializer = EventSerializer(JsonCodec())
+
+    body = await serializer.serialize(ProjectCreatedEvent("123"))
+
+    assert json.loads(body) == {"project_id": "123"}
+
+@pytest.mark.asyncio
+async def test_serializer_caches_encoder_per_event_type(mocker):
+    serializer = EventSerializer(JsonCodec())
+    resolve = mocker.spy(serializer, "_resolve_encoder")
+
+    await serializer.serialize(ProjectCreatedEvent("1"))
+    await serializer.serialize(ProjectCreatedEvent("2"))
+
+    resolve.assert_called_once_with(ProjectCreatedEvent)
+
+@pytest.mark.asyncio
+async def test_serializer_keeps_custom_to_json():
+    serializer = EventSerializer(JsonCodec())
+
+    assert await serializer.serialize(CustomJsonEvent()) == b'{"custom": true}'
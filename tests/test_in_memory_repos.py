@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+from core_lib.domain import Project, ProjectUpdateArgs, UserUpdateArgs
+from core_lib.repos.project import InMemoryProjectRepository, NoopProjectRepository
+from core_lib.repos.user import InMemoryUserRepository
+from factories import make_project_args, make_user_args
+
+@pytest.mark.asyncio
+async def test_users_are_indexed_and_unique():
+    repo = InMemoryUserRepository()
+    user = await repo.create(make_user_args(1))
+
+    assert await repo.get(user.id) == user
+    assert await repo.get_many([user.id, "missing"]) == {user.id: user}
+
+    with pytest.raises(ValueError):
+        await repo.create(make_user_args(1, email="other@example.com"))
+
+    with pytest.raises(ValueError):
+        await repo.create_many([make_user_args(2), make_user_args(3, email="user_1@example.com")])
+
+    assert await repo.get_many([]) == {}
+    assert len(repo._users) == 1
+
+@pytest.mark.asyncio
+async def test_user_update_keeps_indexes_in_sync():
+    repo = InMemoryUserRepository()
+    first, second = await repo.create_many([make_user_args(1), make_user_args(2)])
+
+    assert await repo.update(first.id, UserUpdateArgs(**make_user_args(3).model_dump())) is True
+    assert await repo.update("missing", UserUpdateArgs(**make_user_args(4).model_dump())) is False
+
+    with pytest.raises(ValueError):
+        await repo.update(second.id, UserUpdateArgs(**make_user_args(3).model_dump()))
+
+    await repo.create(make_user_args(1))
+    assert (await repo.get(first.id)).username == "user_3"
+
+@pytest.mark.asyncio
+async def test_user_upsert_updates_by_username():
+    repo = InMemoryUserRepository()
+    user = await repo.create(make_user_args(1))
+
+    [updated, created] = await repo.upsert_many([make_user_args(1, email="new@example.com"), make_user_args(2)])
+
+    assert updated.id == user.id
+    assert updated.email == "new@example.com"
+    assert created.id != user.id
+
+@pytest.mark.asyncio
+async def test_user_with_projects_and_cascading_delete():
+    projects = InMemoryProjectRepository()
+    repo = InMemoryUserRepository(projects)
+    user = await repo.create(make_user_args(1))
+    created = await projects.create_many(user.id, [make_project_args(i) for i in range(3)])
+
+    limited = await repo.get_with_projects(user.id, project_limit=2)
+
+    assert limited.user == user
+    assert limited.projects == sorted(created, key=lambda project: project.id)[:2]
+    assert await repo.delete(user.id) is True
+    assert await projects.get_all(user.id) == []
+    assert await repo.get_with_projects(user.id) is None
+
+@pytest.mark.asyncio
+async def test_projects_are_scoped_to_their_owner():
+    repo = InMemoryProjectRepository()
+    mine = await repo.create("owner", make_project_args(1))
+    theirs = await repo.create("other", make_project_args(2))
+
+    assert await repo.get("owner", mine.id) == mine
+    assert await repo.get("owner", theirs.id) is None
+    assert await repo.get_many("owner", [mine.id, theirs.id]) == {mine.id: mine}
+    assert await repo.update("owner", theirs.id, ProjectUpdateArgs(environment_variables={})) is False
+    assert await repo.delete("owner", theirs.id) is False
+
+    upserted = await repo.upsert_many("owner", [theirs.model_copy(update={"repo_url": "stolen"})])
+
+    assert upserted == []
+    assert (await repo.get("other", theirs.id)).repo_url == "repo_2"
+
+@pytest.mark.asyncio
+async def test_project_status_index_follows_updates():
+    repo = InMemoryProjectRepository()
+    created = await repo.create_many("owner", [make_project_args(i) for i in range(3)])
+
+    await repo.upsert_many("owner", [created[0].model_copy(update={"status": "running"})])
+
+    assert await repo.count_by_status("owner") == {"building": 2, "running": 1}
+    assert [project.id for project in await repo.list_by_status("running")] == [created[0].id]
+    assert (await repo.list_page("owner", status="running")).items == await repo.list_by_status("running")
+
+    with pytest.raises(ValueError):
+        await repo.list_by_status("unknown")
+
+@pytest.mark.asyncio
+async def test_project_pages_and_fields():
+    repo = InMemoryProjectRepository()
+    created = sorted(await repo.create_many("owner", [make_project_args(i) for i in range(5)]), key=lambda project: project.id)
+
+    first = await repo.list_page("owner", limit=3)
+    second = await repo.list_page("owner", after_id=first.next_cursor, limit=3)
+    [partial, *_] = await repo.get_all("owner", fields=["status"])
+
+    assert first.items + second.items == created
+    assert second.next_cursor is None
+    assert partial.model_dump(exclude_unset=True) == {"id": partial.id, "status": "building"}
+    assert partial.repo_url is None
+    assert [project async for project in repo.iter_all("owner")] == created
+
+    with pytest.raises(ValueError):
+        await repo.get_all("owner", fields=["user_id"])
+
+    with pytest.raises(ValueError):
+        await repo.list_page("owner", limit=0)
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_keep_usernames_unique():
+    repo = InMemoryUserRepository()
+
+    results = await asyncio.gather(*(repo.create(make_user_args(1)) for _ in range(10)), return_exceptions=True)
+
+    assert sum(isinstance(result, ValueError) for result in results) == 9
+    assert len(repo._by_username) == 1
+
+@pytest.mark.asyncio
+async def test_noop_project_repository_builds_valid_projects():
+    repo = NoopProjectRepository()
+
+    assert isinstance(await repo.get("owner", "1"), Project)
+    assert len(await repo.get_all("owner")) == 2
+    assert (await repo.create("owner", make_project_args(1))).repo_url == "repo_1"
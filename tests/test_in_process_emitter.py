@@ -0,0 +1,162 @@
+import asyncio
+import pytest
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import InProcessEventEmitter, NoopEventEmitter, OverflowPolicy
+
+@pytest.mark.asyncio
+async def test_events_are_passed_to_subscribers_without_copying():
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    emitter = InProcessEventEmitter()
+    emitter.subscribe("project.created", handler)
+    event = ProjectCreatedEvent("1")
+
+    await emitter.emit(event)
+    await emitter.flush()
+
+    assert received[0] is event
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_stall_others():
+    release = asyncio.Event()
+    fast_received = []
+
+    async def slow(event):
+        await release.wait()
+
+    async def fast(event):
+        fast_received.append(event)
+
+    emitter = InProcessEventEmitter(max_queue_size=10)
+    emitter.subscribe("project.created", slow)
+    emitter.subscribe("project.created", fast)
+
+    for i in range(5):
+        await emitter.emit(ProjectCreatedEvent(str(i)))
+
+    await asyncio.sleep(0)
+
+    assert len(fast_received) == 5
+
+    release.set()
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_when_configured():
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+
+    emitter = InProcessEventEmitter()
+    emitter.subscribe("project.created", slow, max_queue_size=1, overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+    for i in range(4):
+        await emitter.emit(ProjectCreatedEvent(str(i)))
+        await asyncio.sleep(0)
+
+    assert emitter.dropped == 2
+
+    release.set()
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_tee_forwards_every_event():
+    tee = NoopEventEmitter()
+    emitter = InProcessEventEmitter(tee=tee)
+    events = [ProjectCreatedEvent(str(i)) for i in range(3)]
+
+    await emitter.emit(events[0])
+    await emitter.emit_many(events[1:])
+
+    assert await tee.get_events() == events
+
+@pytest.mark.asyncio
+async def test_handler_errors_are_isolated():
+    received = []
+
+    async def handler(event):
+        if event.project_id == "bad":
+            raise RuntimeError("boom")
+        received.append(event)
+
+    emitter = InProcessEventEmitter()
+    emitter.subscribe("project.created", handler)
+
+    await emitter.emit(ProjectCreatedEvent("bad"))
+    await emitter.emit(ProjectCreatedEvent("good"))
+    await emitter.flush()
+
+    assert [event.project_id for event in received] == ["good"]
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_stuck_blocking_subscriber_does_not_stall_live_ones():
+    release = asyncio.Event()
+    live_received = []
+
+    async def stuck(event):
+        await release.wait()
+
+    async def live(event):
+        live_received.append(event)
+
+    emitter = InProcessEventEmitter(max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+    emitter.subscribe("project.created", stuck)
+    emitter.subscribe("project.created", live)
+
+    publisher = asyncio.create_task(emitter.emit_many(ProjectCreatedEvent(str(i)) for i in range(4)))
+    await asyncio.sleep(0.01)
+
+    assert not publisher.done()
+    assert len(live_received) == 3
+
+    release.set()
+    await publisher
+    await emitter.close()
+
+    assert len(live_received) == 4
+
+@pytest.mark.asyncio
+async def test_default_policy_never_blocks_the_publisher():
+    release = asyncio.Event()
+
+    async def stuck(event):
+        await release.wait()
+
+    emitter = InProcessEventEmitter(max_queue_size=1)
+    emitter.subscribe("project.created", stuck)
+
+    await asyncio.wait_for(emitter.emit_many(ProjectCreatedEvent(str(i)) for i in range(5)), 1)
+
+    assert emitter.dropped > 0
+
+    release.set()
+    await emitter.close()
+
+@pytest.mark.asyncio
+async def test_full_raise_subscriber_does_not_starve_the_others():
+    received = []
+    tee = NoopEventEmitter()
+    emitter = InProcessEventEmitter(tee=tee)
+
+    async def record(event):
+        received.append(event.project_id)
+
+    emitter.subscribe("project.created", record, max_queue_size=1, overflow_policy=OverflowPolicy.RAISE)
+    emitter.subscribe("project.created", record)
+
+    with pytest.raises(asyncio.QueueFull):
+        await emitter.emit_many([ProjectCreatedEvent("a"), ProjectCreatedEvent("b"), ProjectCreatedEvent("c")])
+
+    await emitter.flush()
+
+    assert received.count("a") == 2
+    assert received.count("b") == received.count("c") == 1
+    assert [event.project_id for event in await tee.get_events()] == ["a", "b", "c"]
+
+    await emitter.close()
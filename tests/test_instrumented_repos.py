@@ -0,0 +1,97 @@
+import asyncio
+import uuid
+import pytest
+from core_lib.domain import ProjectCreateArgs
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import InstrumentedEventEmitter, NoopEventEmitter
+from core_lib.metrics import MetricsRegistry, instrument_engine
+from core_lib.repos.project import InstrumentedProjectRepository, SQLAlchemyProjectRepository
+
+OWNER = str(uuid.uuid4())
+LABELS = {"repository": "project", "method": "get_all"}
+
+@pytest.mark.asyncio
+async def test_repository_calls_record_latency_queries_and_rows(sqlite_engine, session_factory):
+    registry = MetricsRegistry()
+    instrument_engine(sqlite_engine, registry)
+    repo = InstrumentedProjectRepository(SQLAlchemyProjectRepository(session_factory), registry)
+
+    await repo.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(3)])
+    projects = await repo.get_all(OWNER)
+    streamed = [project async for project in repo.iter_all(OWNER)]
+
+    assert len(projects) == len(streamed) == 3
+    assert registry.histogram("repository_call_duration_seconds", LABELS).count == 1
+    assert registry.histogram("repository_queries_per_call", LABELS).sum == 1
+    assert registry.histogram("repository_rows_returned", LABELS).sum == 3
+    assert registry.histogram("repository_rows_returned", {**LABELS, "method": "iter_all"}).sum == 3
+
+@pytest.mark.asyncio
+async def test_repository_errors_are_counted(session_factory):
+    registry = MetricsRegistry()
+    repo = InstrumentedProjectRepository(SQLAlchemyProjectRepository(session_factory), registry)
+
+    with pytest.raises(ValueError):
+        await repo.get_all(OWNER, fields=["unknown"])
+
+    assert registry.counter("repository_errors_total", LABELS).value == 1
+
+@pytest.mark.asyncio
+async def test_disabled_registry_passes_calls_through(session_factory):
+    registry = MetricsRegistry(enabled=False)
+    repo = InstrumentedProjectRepository(SQLAlchemyProjectRepository(session_factory), registry)
+
+    assert await repo.get_all(OWNER) == []
+    assert list(registry.collect()) == []
+
+@pytest.mark.asyncio
+async def test_emitter_publish_latencies_are_recorded():
+    registry = MetricsRegistry()
+    inner = NoopEventEmitter()
+    emitter = InstrumentedEventEmitter(inner, registry)
+
+    await emitter.emit(ProjectCreatedEvent("1"))
+    await emitter.emit_many(ProjectCreatedEvent(str(i)) for i in range(3))
+
+    labels = {"event_type": "project.created"}
+    assert len(inner.events) == 4
+    assert registry.histogram("event_emit_duration_seconds", labels).count == 1
+    assert registry.histogram("event_emit_batch_duration_seconds").count == 1
+    assert registry.counter("events_emitted_total", labels).value == 4
+
+@pytest.mark.asyncio
+async def test_stream_does_not_count_queries_run_by_the_consumer(sqlite_engine, session_factory):
+    registry = MetricsRegistry()
+    instrument_engine(sqlite_engine, registry)
+    inner = SQLAlchemyProjectRepository(session_factory)
+    repo = InstrumentedProjectRepository(inner, registry)
+    await inner.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(3)])
+
+    async for project in repo.iter_all(OWNER):
+        await inner.get(OWNER, project.id)
+
+    labels = {**LABELS, "method": "iter_all"}
+    assert registry.histogram("repository_queries_per_call", labels).sum == 1
+    assert registry.histogram("repository_rows_returned", labels).sum == 3
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_records_its_metrics(sqlite_engine, session_factory):
+    registry = MetricsRegistry()
+    instrument_engine(sqlite_engine, registry)
+    inner = SQLAlchemyProjectRepository(session_factory)
+    repo = InstrumentedProjectRepository(inner, registry)
+    created = await inner.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(3)])
+
+    stream = repo.iter_all(OWNER)
+
+    async for _ in stream:
+        break
+
+    await inner.get(OWNER, created[0].id)
+    await asyncio.create_task(stream.aclose())
+
+    labels = {**LABELS, "method": "iter_all"}
+    assert registry.histogram("repository_rows_returned", labels).sum == 1
+    assert registry.histogram("repository_call_duration_seconds", labels).count == 1
+    assert registry.histogram("repository_queries_per_call", labels).sum == 1
+    assert registry.counter("repository_errors_total", labels).value == 0
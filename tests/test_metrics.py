@@ -0,0 +1,74 @@
+import logging
+import pytest
+from sqlalchemy import text
+from core_lib.metrics import MetricsRegistry, count_queries, instrument_engine, to_prometheus_text
+
+def test_histogram_buckets_are_cumulative_in_prometheus_text():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", {"method": "get"}, "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    registry.counter("calls_total", description="Calls.").inc(3)
+
+    assert to_prometheus_text(registry).splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{method="get",le="0.1"} 2',
+        'latency_seconds_bucket{method="get",le="1.0"} 3',
+        'latency_seconds_bucket{method="get",le="+Inf"} 4',
+        'latency_seconds_sum{method="get"} 2.65',
+        'latency_seconds_count{method="get"} 4',
+        "# HELP calls_total Calls.",
+        "# TYPE calls_total counter",
+        "calls_total 3.0",
+    ]
+
+def test_metric_kind_cannot_change():
+    registry = MetricsRegistry()
+    registry.counter("calls_total")
+
+    with pytest.raises(ValueError):
+        registry.histogram("calls_total")
+
+@pytest.mark.asyncio
+async def test_engine_queries_are_timed_and_counted(sqlite_engine):
+    registry = MetricsRegistry()
+    instrument_engine(sqlite_engine, registry)
+
+    with count_queries() as outer:
+        async with sqlite_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+            with count_queries() as inner:
+                await connection.execute(text("SELECT 2"))
+
+    assert (outer.value, inner.value) == (2, 1)
+    assert registry.histogram("db_query_duration_seconds", {"operation": "SELECT"}).count == 2
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_without_parameters(sqlite_engine, caplog):
+    registry = MetricsRegistry()
+    instrument_engine(sqlite_engine, registry, slow_query_threshold=0.0)
+
+    with caplog.at_level(logging.WARNING, logger="core_lib.metrics.queries"):
+        async with sqlite_engine.connect() as connection:
+            await connection.execute(text("SELECT :secret"), {"secret": "hunter2"})
+
+    assert "SELECT ?" in caplog.text
+    assert "1 parameter(s) redacted" in caplog.text
+    assert "hunter2" not in caplog.text
+    assert registry.counter("db_slow_queries_total", {"operation": "SELECT"}).value == 1
+
+@pytest.mark.asyncio
+async def test_disabled_registry_records_nothing(sqlite_engine):
+    registry = MetricsRegistry(enabled=False)
+    instrument_engine(sqlite_engine, registry)
+
+    with count_queries() as queries:
+        async with sqlite_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    assert queries.value == 0
+    assert list(registry.collect()) == []
@@ -0,0 +1,13 @@
+import pytest
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import NoopEventEmitter
+
+@pytest.mark.asyncio
+async def test_emit_many_records_events_in_order():
+    emitter = NoopEventEmitter()
+    events = [ProjectCreatedEvent(project_id=str(i)) for i in range(3)]
+
+    await emitter.emit(events[0])
+    await emitter.emit_many(events[1:])
+
+    assert await emitter.get_events() == events
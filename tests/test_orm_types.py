@@ -0,0 +1,52 @@
+import uuid
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+from core_lib.domain import ProjectCreateArgs, ProjectUpdateArgs
+from core_lib.orm import UUIDString
+from core_lib.repos.project.sql_alchemy import SQLAlchemyProjectRepository
+from core_lib.repos.user.sql_alchemy import SQLAlchemyUserRepository
+
+def test_uuid_is_bound_as_bytes_on_sqlite_and_native_on_postgres():
+    value = uuid.uuid4()
+    uuid_type = UUIDString()
+
+    assert uuid_type.process_bind_param(str(value), sqlite.dialect()) == value.bytes
+    assert uuid_type.process_bind_param(str(value), postgresql.dialect()) == value
+    assert uuid_type.process_result_value(value.bytes, sqlite.dialect()) == str(value)
+    assert uuid_type.process_result_value(value, postgresql.dialect()) == str(value)
+
+@pytest.mark.asyncio
+async def test_ids_are_stored_as_16_bytes_and_read_back_as_strings(session_factory):
+    owner = str(uuid.uuid4())
+
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        project = await repo.create(owner, ProjectCreateArgs(repo_url="a", environment_variables={}))
+
+        stored = (await session.execute(text("SELECT length(id), length(user_id) FROM projects"))).one()
+
+    assert tuple(stored) == (16, 16)
+    assert str(uuid.UUID(project.id)) == project.id
+
+@pytest.mark.asyncio
+async def test_malformed_id_is_not_found(session_factory):
+    owner = str(uuid.uuid4())
+
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        project = await repo.create(owner, ProjectCreateArgs(repo_url="a", environment_variables={}))
+
+        assert await repo.get(owner, "not-a-uuid") is None
+        assert await repo.get("not-a-uuid", project.id) is None
+        assert await repo.get_many(owner, ["not-a-uuid", project.id]) == {project.id: project}
+        assert await repo.get_all("not-a-uuid") == []
+        assert await repo.update(owner, "not-a-uuid", ProjectUpdateArgs(environment_variables={})) is False
+        assert await repo.delete(owner, "not-a-uuid") is False
+        assert await repo.get(owner, project.id.upper()) is None
+        assert await repo.get_many(owner, [project.id.upper()]) == {}
+
+        users = SQLAlchemyUserRepository(session)
+        assert await users.get("not-a-uuid") is None
+        assert await users.get_with_projects("not-a-uuid") is None
+        assert await users.delete("not-a-uuid") is False
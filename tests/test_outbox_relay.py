@@ -0,0 +1,99 @@
+import asyncio
+import uuid
+import pytest
+from sqlalchemy import select
+from core_lib.domain import ProjectCreateArgs
+from core_lib.events import ProjectCreatedEvent
+from core_lib.events.emitter import NoopEventEmitter
+from core_lib.orm import OutboxORM
+from core_lib.outbox import OutboxRelay, enqueue_event
+from core_lib.repos.project.sql_alchemy import SQLAlchemyProjectRepository
+
+@pytest.mark.asyncio
+async def test_create_enqueues_event_in_same_transaction(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session, use_outbox=True)
+        project = await repo.create(str(uuid.uuid4()), ProjectCreateArgs(repo_url="https://x", environment_variables={}))
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(OutboxORM))).scalars().all()
+
+    assert project is not None
+    assert [(row.event_type, row.payload) for row in rows] == [("project.created", {"project_id": project.id})]
+
+@pytest.mark.asyncio
+async def test_rolled_back_transaction_does_not_enqueue(session_factory):
+    async with session_factory() as session:
+        await enqueue_event(session, ProjectCreatedEvent("1"))
+        await session.rollback()
+
+    emitter = NoopEventEmitter()
+
+    assert await OutboxRelay(session_factory, emitter).relay_once() == 0
+    assert await emitter.get_events() == []
+
+@pytest.mark.asyncio
+async def test_relay_publishes_in_batches_and_marks_delivered(session_factory):
+    async with session_factory() as session:
+        for i in range(5):
+            await enqueue_event(session, ProjectCreatedEvent(str(i)))
+        await session.commit()
+
+    emitter = NoopEventEmitter()
+    relay = OutboxRelay(session_factory, emitter, batch_size=3)
+
+    assert await relay.relay_once() == 3
+    assert await relay.relay_once() == 2
+    assert await relay.relay_once() == 0
+
+    events = await emitter.get_events()
+    assert [event.event_type for event in events] == ["project.created"] * 5
+    assert [await event.to_dict() for event in events] == [{"project_id": str(i)} for i in range(5)]
+
+    async with session_factory() as session:
+        undelivered = await session.execute(select(OutboxORM).where(OutboxORM.delivered_at.is_(None)))
+
+    assert undelivered.scalars().all() == []
+
+@pytest.mark.asyncio
+async def test_failed_publish_leaves_rows_undelivered(session_factory, mocker):
+    async with session_factory() as session:
+        await enqueue_event(session, ProjectCreatedEvent("1"))
+        await session.commit()
+
+    emitter = NoopEventEmitter()
+    emitter.emit_many = mocker.AsyncMock(side_effect=RuntimeError("broker down"))
+
+    with pytest.raises(RuntimeError):
+        await OutboxRelay(session_factory, emitter).relay_once()
+
+    retry_emitter = NoopEventEmitter()
+    assert await OutboxRelay(session_factory, retry_emitter).relay_once() == 1
+
+@pytest.mark.asyncio
+async def test_run_keeps_relaying_after_a_failed_batch(session_factory, mocker):
+    async with session_factory() as session:
+        await enqueue_event(session, ProjectCreatedEvent("1"))
+        await session.commit()
+
+    emitter = NoopEventEmitter()
+    emit_many = emitter.emit_many
+
+    async def flaky_emit_many(events):
+        if emitter.emit_many.await_count == 1:
+            raise RuntimeError("broker down")
+
+        await emit_many(events)
+
+    emitter.emit_many = mocker.AsyncMock(side_effect=flaky_emit_many)
+    relay = OutboxRelay(session_factory, emitter, poll_interval=0.01)
+
+    task = asyncio.create_task(relay.run())
+
+    while emitter.emit_many.await_count < 2:
+        await asyncio.sleep(0.01)
+
+    relay.stop()
+    await task
+
+    assert [await event.to_dict() for event in await emitter.get_events()] == [{"project_id": "1"}]
@@ -1,11 +1,13 @@
+import asyncio
 import pytest
 import aio_pika
-from core_lib.events import RabbitMQFanOutEventEmitter, ProjectCreatedEvent
+from core_lib.events import Compressor, JsonCodec, RabbitMQFanOutEventEmitter, ProjectCreatedEvent, decode_message_body
 
 @pytest.mark.asyncio
 async def test_emit_event_creates_exchange_and_publishes(mocker):
     mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
     mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
     mock_exchange = mocker.AsyncMock()
 
     mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
@@ -27,6 +29,7 @@ async def test_emit_event_creates_exchange_and_publishes(mocker):
 async def test_emit_event_uses_cached_exchange(mocker):
     mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
     mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
     mock_exchange = mocker.AsyncMock()
 
     mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
@@ -44,3 +47,143 @@ async def test_emit_event_uses_cached_exchange(mocker):
 
     mock_channel.declare_exchange.assert_not_awaited()
     mock_exchange.publish.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_emit_reuses_pooled_channel(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection)
+
+    for i in range(5):
+        await emitter.emit(ProjectCreatedEvent(project_id=str(i)))
+
+    mock_connection.channel.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_emit_replaces_dead_channel_and_redeclares_exchange(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    dead_channel = mocker.AsyncMock()
+    dead_channel.is_closed = False
+    fresh_channel = mocker.AsyncMock()
+    fresh_channel.is_closed = False
+
+    mock_connection.channel = mocker.AsyncMock(side_effect=[dead_channel, fresh_channel])
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection)
+    event = ProjectCreatedEvent(project_id="123")
+
+    await emitter.emit(event)
+    dead_channel.is_closed = True
+    await emitter.emit(event)
+
+    assert mock_connection.channel.await_count == 2
+    fresh_channel.declare_exchange.assert_awaited_once()
+    assert dead_channel not in emitter.exchange_cache
+
+@pytest.mark.asyncio
+async def test_emit_many_groups_events_per_exchange(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+    mock_exchange = mocker.AsyncMock()
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+    mock_channel.declare_exchange.return_value = mock_exchange
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection, publish_concurrency=4)
+    events = [ProjectCreatedEvent(project_id=str(i)) for i in range(20)]
+
+    await emitter.emit_many(events)
+
+    mock_channel.declare_exchange.assert_awaited_once()
+    assert mock_exchange.publish.await_count == 20
+
+@pytest.mark.asyncio
+async def test_confirm_mode_tracks_publishes(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+    mock_exchange = mocker.AsyncMock()
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+    mock_channel.declare_exchange.return_value = mock_exchange
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection, confirm_window=8)
+
+    await emitter.emit_many([ProjectCreatedEvent(project_id=str(i)) for i in range(3)])
+    await emitter.wait_for_confirms()
+
+    assert mock_exchange.publish.await_count == 3
+    assert emitter.confirm_stats.confirmed == 3
+
+@pytest.mark.asyncio
+async def test_close_waits_for_confirms_before_closing_channels(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+    mock_exchange = mocker.AsyncMock()
+    confirmed = asyncio.Event()
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+    mock_channel.declare_exchange.return_value = mock_exchange
+
+    async def publish(*args, **kwargs):
+        await confirmed.wait()
+
+    mock_exchange.publish.side_effect = publish
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection, confirm_window=8)
+    await emitter.emit(ProjectCreatedEvent(project_id="123"))
+
+    closing = asyncio.create_task(emitter.close())
+    await asyncio.sleep(0)
+    mock_channel.close.assert_not_awaited()
+
+    confirmed.set()
+    await closing
+
+    mock_channel.close.assert_awaited_once()
+    assert emitter.confirm_stats.confirmed == 1
+
+@pytest.mark.asyncio
+async def test_emit_sets_content_type_on_message(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+    mock_exchange = mocker.AsyncMock()
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+    mock_channel.declare_exchange.return_value = mock_exchange
+
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection, codec=JsonCodec())
+
+    await emitter.emit(ProjectCreatedEvent(project_id="123"))
+
+    message = mock_exchange.publish.await_args.args[0]
+    assert message.body == b'{"project_id":"123"}'
+    assert message.content_type == "application/json; charset=utf-8"
+    assert message.content_encoding is None
+
+@pytest.mark.asyncio
+async def test_emit_compresses_large_bodies(mocker):
+    mock_connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    mock_channel = mocker.AsyncMock()
+    mock_channel.is_closed = False
+    mock_exchange = mocker.AsyncMock()
+
+    mock_connection.channel = mocker.AsyncMock(return_value=mock_channel)
+    mock_channel.declare_exchange.return_value = mock_exchange
+
+    compressor = Compressor(threshold=64, algorithm="zlib")
+    emitter = RabbitMQFanOutEventEmitter(connection=mock_connection, codec=JsonCodec(), compressor=compressor)
+
+    await emitter.emit(ProjectCreatedEvent(project_id="x" * 1024))
+
+    message = mock_exchange.publish.await_args.args[0]
+    assert message.content_encoding == "zlib"
+    assert decode_message_body(message.body, message.content_type, message.content_encoding) == {"project_id": "x" * 1024}
+    assert compressor.stats.messages_compressed == 1
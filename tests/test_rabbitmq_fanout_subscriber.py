@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+import aio_pika
+from core_lib.events import (
+    JsonCodec,
+    ProjectCreatedEvent,
+    RabbitMQFanOutEventSubscriber,
+    RawEvent,
+)
+
+def make_message(mocker, delivery_tag, body=b'{"project_id":"123"}', exchange="project.created"):
+    message = mocker.Mock()
+    message.delivery_tag = delivery_tag
+    message.body = body
+    message.exchange = exchange
+    message.content_type = JsonCodec.content_type
+    message.content_encoding = JsonCodec.content_encoding
+    message.ack = mocker.AsyncMock()
+    message.nack = mocker.AsyncMock()
+    return message
+
+@pytest.fixture
+def mock_connection(mocker):
+    connection = mocker.Mock(spec=aio_pika.RobustConnection)
+    channel = mocker.AsyncMock()
+    channel.is_closed = False
+    queue = mocker.AsyncMock()
+    exchange = mocker.AsyncMock()
+
+    connection.channel = mocker.AsyncMock(return_value=channel)
+    channel.declare_queue.return_value = queue
+    channel.declare_exchange.return_value = exchange
+    queue.consume.return_value = "consumer-tag"
+    return connection
+
+@pytest.mark.asyncio
+async def test_start_binds_exclusive_queue_to_each_exchange(mock_connection, mocker):
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection, prefetch_count=10)
+    subscriber.subscribe("project.created", mocker.AsyncMock())
+    subscriber.subscribe("project.deleted", mocker.AsyncMock())
+
+    await subscriber.start()
+
+    channel = await mock_connection.channel()
+    channel.set_qos.assert_awaited_once_with(prefetch_count=10)
+    channel.declare_queue.assert_awaited_once_with("", exclusive=True, durable=False)
+    assert subscriber.queue.bind.await_count == 2
+    subscriber.queue.consume.assert_awaited_once()
+
+    await subscriber.stop()
+    subscriber.queue.cancel.assert_awaited_once_with("consumer-tag")
+
+@pytest.mark.asyncio
+async def test_message_is_decoded_into_typed_event(mock_connection, mocker):
+    handler = mocker.AsyncMock()
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection)
+    subscriber.subscribe("project.created", handler)
+
+    await subscriber._on_message(make_message(mocker, 1))
+
+    event = handler.await_args.args[0]
+    assert isinstance(event, ProjectCreatedEvent)
+    assert event.project_id == "123"
+
+@pytest.mark.asyncio
+async def test_unknown_event_type_is_decoded_as_raw_event(mock_connection, mocker):
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection)
+
+    event = subscriber.decode(make_message(mocker, 1, body=b'{"a":1}', exchange="other"))
+
+    assert isinstance(event, RawEvent)
+    assert await event.to_dict() == {"a": 1}
+
+@pytest.mark.asyncio
+async def test_acks_are_batched(mock_connection, mocker):
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection, ack_batch_size=3)
+    subscriber.subscribe("project.created", mocker.AsyncMock())
+    messages = [make_message(mocker, tag) for tag in range(1, 4)]
+
+    for message in messages[:2]:
+        await subscriber._on_message(message)
+
+    for message in messages:
+        message.ack.assert_not_awaited()
+
+    await subscriber._on_message(messages[2])
+
+    messages[2].ack.assert_awaited_once_with(multiple=True)
+    messages[0].ack.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_out_of_order_completion_only_acks_settled_prefix(mock_connection, mocker):
+    release = asyncio.Event()
+
+    async def handler(event):
+        if event.project_id == "slow":
+            await release.wait()
+
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection, ack_batch_size=100)
+    subscriber.subscribe("project.created", handler)
+    slow = make_message(mocker, 1, body=b'{"project_id":"slow"}')
+    fast = make_message(mocker, 2)
+
+    slow_task = asyncio.create_task(subscriber._on_message(slow))
+    await asyncio.sleep(0)
+    await subscriber._on_message(fast)
+    await subscriber._acks.flush()
+
+    fast.ack.assert_not_awaited()
+
+    release.set()
+    await slow_task
+    await subscriber._acks.flush()
+
+    fast.ack.assert_awaited_once_with(multiple=True)
+
+@pytest.mark.asyncio
+async def test_failing_handler_nacks_message(mock_connection, mocker):
+    subscriber = RabbitMQFanOutEventSubscriber(mock_connection, requeue_on_error=True)
+    subscriber.subscribe("project.created", mocker.AsyncMock(side_effect=RuntimeError("boom")))
+    message = make_message(mocker, 1)
+
+    await subscriber._on_message(message)
+    await subscriber._acks.flush()
+
+    message.nack.assert_awaited_once_with(requeue=True)
+    message.ack.assert_not_awaited()
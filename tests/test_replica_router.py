@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from core_lib.domain import ProjectCreateArgs
+from core_lib.orm.base import Base
+from core_lib.repos import ReplicaRouter, SQLAlchemyProjectRepository, SQLAlchemyUserRepository
+from factories import FakeClock, make_user_args
+
+@pytest_asyncio.fixture
+async def replica_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_reads_go_to_the_replica(session_factory, replica_engine):
+    router = ReplicaRouter(replica_engine)
+    repo = SQLAlchemyUserRepository(session_factory, replica=router)
+
+    user = await repo.create(make_user_args(1))
+
+    assert await repo.get(user.id) is None
+    assert await SQLAlchemyUserRepository(session_factory).get(user.id) == user
+    assert router.stats.replica_reads == 1
+
+@pytest.mark.asyncio
+async def test_writes_pin_reads_to_the_primary_for_a_window(session_factory, replica_engine):
+    clock = FakeClock()
+    router = ReplicaRouter(replica_engine, read_your_writes=2.0, clock=clock)
+    repo = SQLAlchemyUserRepository(session_factory, replica=router)
+
+    user = await repo.create(make_user_args(1))
+
+    assert await repo.get(user.id) == user
+    clock.now = 2.0
+    assert await repo.get(user.id) is None
+    assert (router.stats.primary_reads, router.stats.replica_reads) == (1, 1)
+
+@pytest.mark.asyncio
+async def test_read_your_writes_is_scoped_to_the_writing_context(session_factory, replica_engine):
+    router = ReplicaRouter(replica_engine, read_your_writes=60.0)
+    repo = SQLAlchemyUserRepository(session_factory, replica=router)
+
+    user = await asyncio.create_task(repo.create(make_user_args(1)))
+
+    assert await repo.get(user.id) is None
+
+@pytest.mark.asyncio
+async def test_read_your_writes_follows_the_caller_across_tasks(session_factory, replica_engine):
+    router = ReplicaRouter(replica_engine, read_your_writes=60.0)
+    repo = SQLAlchemyUserRepository(session_factory, replica=router)
+
+    async def as_caller(key, call):
+        with router.caller(key):
+            return await call
+
+    user = await asyncio.create_task(as_caller("alice", repo.create(make_user_args(1))))
+
+    assert await asyncio.create_task(as_caller("alice", repo.get(user.id))) == user
+    assert await asyncio.create_task(as_caller("bob", repo.get(user.id))) is None
+
+@pytest.mark.asyncio
+async def test_unavailable_replica_falls_back_to_the_primary(session_factory, tmp_path):
+    clock = FakeClock()
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    router = ReplicaRouter(broken, retry_after=5.0, clock=clock)
+    repo = SQLAlchemyUserRepository(session_factory, replica=router)
+    user = await SQLAlchemyUserRepository(session_factory).create(make_user_args(1))
+
+    try:
+        assert await repo.get(user.id) == user
+        assert await repo.get_many([user.id]) == {user.id: user}
+        assert (router.stats.fallbacks, router.stats.primary_reads) == (1, 2)
+
+        clock.now = 5.0
+        assert await repo.get(user.id) == user
+        assert router.stats.fallbacks == 2
+    finally:
+        await broken.dispose()
+
+@pytest.mark.asyncio
+async def test_project_create_reads_back_from_the_primary(session_factory, replica_engine):
+    router = ReplicaRouter(replica_engine)
+    repo = SQLAlchemyProjectRepository(session_factory, replica=router)
+
+    project = await repo.create("00000000-0000-0000-0000-000000000001", ProjectCreateArgs(repo_url="a", environment_variables={}))
+
+    assert project is not None
+    assert await repo.get_all("00000000-0000-0000-0000-000000000001") == []
@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from core_lib.repos.cache import MISSING, SingleFlight, TTLCache
+from factories import FakeClock
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is MISSING
+    assert cache.stats.expirations == 1
+
+def test_misses_are_cached_for_negative_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, negative_ttl=1, clock=clock)
+
+    cache.set("a", None)
+    assert cache.get("a") is None
+    assert cache.stats.negative_hits == 1
+
+    clock.now = 2
+    assert cache.get("a") is MISSING
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+def test_stale_load_is_not_stored_after_invalidation():
+    cache = TTLCache()
+    version = cache.version
+
+    cache.invalidate("a")
+    cache.set("a", "stale", version)
+
+    assert cache.get("a") is MISSING
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_loads():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "value"
+
+    results = await asyncio.gather(*(single_flight.do("key", load) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert calls == 1
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_the_first_caller_being_cancelled():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "value"
+    assert leader.cancelled()
+    assert await single_flight.do("key", load) == "value"
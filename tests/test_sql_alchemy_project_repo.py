@@ -1,8 +1,15 @@
+import asyncio
+import uuid
 from unittest.mock import MagicMock
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from core_lib.repos.project.sql_alchemy import SQLAlchemyProjectRepository
-from core_lib.domain import Project, ProjectCreateArgs, ProjectUpdateArgs
+from core_lib.domain import PartialProject, Project, ProjectCreateArgs, ProjectUpdateArgs
+
+OWNER = str(uuid.uuid4())
+OTHER = str(uuid.uuid4())
+MISSING_ID = str(uuid.uuid4())
+NEW_ID = str(uuid.uuid4())
 
 @pytest.fixture
 def mock_session(mocker):
@@ -22,11 +29,11 @@ def repo(mock_session):
 @pytest.mark.asyncio
 async def test_get_project_found(repo, mocker):
     mock_project = Project(id="1", repo_url="x", environment_variables={"key": "value"}, status="testings")
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = mock_project
-    repo.db_session.execute.return_value = MagicMock(scalars=lambda: scalars_mock)
+    result_mock = MagicMock()
+    result_mock.first.return_value = mock_project
+    repo.db_session.execute.return_value = result_mock
 
-    result = await repo.get(user_id="1", project_id="123")
+    result = await repo.get(user_id=OWNER, project_id=NEW_ID)
 
     assert isinstance(result, Project)
     assert result.id == "1"
@@ -35,22 +42,22 @@ async def test_get_project_found(repo, mocker):
 
 @pytest.mark.asyncio
 async def test_get_project_not_found(repo, mocker):
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = None
-    repo.db_session.execute.return_value = MagicMock(scalars=lambda: scalars_mock)
+    result_mock = MagicMock()
+    result_mock.first.return_value = None
+    repo.db_session.execute.return_value = result_mock
 
-    result = await repo.get(user_id="1", project_id="123")
+    result = await repo.get(user_id=OWNER, project_id=NEW_ID)
     assert result is None
 
 @pytest.mark.asyncio
 async def test_get_all_projects(repo, mocker):
     project1 = Project(id="1", repo_url="a", environment_variables={"key": "value"}, status="testings")
     project2 = Project(id="2", repo_url="b", environment_variables={"key": "value"}, status="testings")
-    scalars_mock = MagicMock()
-    scalars_mock.all.return_value = [project1, project2]
-    repo.db_session.execute.return_value = MagicMock(scalars=lambda: scalars_mock)
+    result_mock = MagicMock()
+    result_mock.all.return_value = [project1, project2]
+    repo.db_session.execute.return_value = result_mock
 
-    result = await repo.get_all(user_id="1")
+    result = await repo.get_all(user_id=OWNER)
 
     assert len(result) == 2
     assert isinstance(result[0], Project)
@@ -75,43 +82,262 @@ async def test_create_project(repo, mocker):
 
 @pytest.mark.asyncio
 async def test_update_project_success(repo, mocker):
-    mock_project = MagicMock()
-    repo._get_orm = mocker.AsyncMock(return_value=mock_project)
-    repo.db_session.commit = mocker.AsyncMock()
+    repo.db_session.execute.return_value = MagicMock(rowcount=1)
 
     args = ProjectUpdateArgs(environment_variables={"NEW": "VAR"})
-    result = await repo.update(user_id="1", project_id="42", project_update_args=args)
+    result = await repo.update(user_id=OWNER, project_id=NEW_ID, project_update_args=args)
 
     assert result is True
-    assert mock_project.environment_variables == {"NEW": "VAR"}
+    repo.db_session.execute.assert_awaited_once()
+    statement = repo.db_session.execute.await_args.args[0]
+    assert statement.is_update
+    assert {column.key for column in statement._values} == {"environment_variables"}
     repo.db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_update_project_not_found(repo, mocker):
-    repo._get_orm = mocker.AsyncMock(return_value=None)
+    repo.db_session.execute.return_value = MagicMock(rowcount=0)
 
-    result = await repo.update(user_id="1", project_id="42", project_update_args=ProjectUpdateArgs(environment_variables={"NEW": "VAR"}))
+    result = await repo.update(user_id=OWNER, project_id=NEW_ID, project_update_args=ProjectUpdateArgs(environment_variables={"NEW": "VAR"}))
 
     assert result is False
 
 
 @pytest.mark.asyncio
 async def test_delete_project_success(repo, mocker):
-    mock_project = MagicMock()
-    repo._get_orm = mocker.AsyncMock(return_value=mock_project)
+    repo.db_session.execute.return_value = MagicMock(rowcount=1)
 
-    result = await repo.delete(user_id="1", project_id="99")
+    result = await repo.delete(user_id=OWNER, project_id=NEW_ID)
 
-    repo.db_session.delete.assert_awaited_once_with(mock_project)
+    repo.db_session.execute.assert_awaited_once()
+    assert repo.db_session.execute.await_args.args[0].is_delete
+    repo.db_session.delete.assert_not_called()
     repo.db_session.commit.assert_awaited_once()
     assert result is True
 
+
 @pytest.mark.asyncio
 async def test_delete_project_not_found(repo, mocker):
-    repo._get_orm = mocker.AsyncMock(return_value=None)
+    repo.db_session.execute.return_value = MagicMock(rowcount=0)
 
-    result = await repo.delete(user_id="1", project_id="99")
+    result = await repo.delete(user_id=OWNER, project_id=NEW_ID)
 
     repo.db_session.delete.assert_not_called()
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_get_many_projects_queries_in_chunks(repo, mocker):
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    projects = [Project(id=project_id, repo_url="a", environment_variables={}, status="building") for project_id in ids]
+    results = []
+    for chunk in (projects[0:2], projects[2:3]):
+        result_mock = MagicMock()
+        result_mock.all.return_value = chunk
+        results.append(result_mock)
+    repo.db_session.execute.side_effect = results
+    repo.in_chunk_size = 2
+
+    result = await repo.get_many(user_id=OWNER, project_ids=ids)
+
+    assert repo.db_session.execute.await_count == 2
+    assert list(result) == ids
+
+@pytest.mark.asyncio
+async def test_get_many_projects_is_scoped_to_owner(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        mine = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+        theirs = await repo.create(OTHER, ProjectCreateArgs(repo_url="b", environment_variables={}))
+
+        result = await repo.get_many(OWNER, [mine.id, theirs.id, MISSING_ID])
+
+    assert list(result) == [mine.id]
+
+@pytest.mark.asyncio
+async def test_create_many_projects_returns_without_reread(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        repo.insert_chunk_size = 2
+        args = [ProjectCreateArgs(repo_url=f"https://repo/{i}", environment_variables={"i": i}) for i in range(3)]
+
+        created = await repo.create_many(OWNER, args)
+
+    assert [project.repo_url for project in created] == [f"https://repo/{i}" for i in range(3)]
+    assert all(project.status == "building" for project in created)
+
+    async with session_factory() as session:
+        assert len(await SQLAlchemyProjectRepository(session).get_all(OWNER)) == 3
+
+@pytest.mark.asyncio
+async def test_upsert_many_projects_respects_ownership(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        mine = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+        theirs = await repo.create(OTHER, ProjectCreateArgs(repo_url="b", environment_variables={}))
+
+        upserted = await repo.upsert_many(OWNER, [
+            mine.model_copy(update={"status": "running"}),
+            theirs.model_copy(update={"repo_url": "hijacked"}),
+            Project(id=NEW_ID, repo_url="c", environment_variables={}, status="building"),
+        ])
+
+    assert {project.id: project.status for project in upserted} == {mine.id: "running", NEW_ID: "building"}
+
+    async with session_factory() as session:
+        assert (await SQLAlchemyProjectRepository(session).get(OTHER, theirs.id)).repo_url == "b"
+
+@pytest.mark.asyncio
+async def test_upsert_many_projects_keeps_the_last_row_per_id(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+
+        upserted = await repo.upsert_many(OWNER, [
+            created.model_copy(update={"status": "running"}),
+            created.model_copy(update={"status": "failure"}),
+        ])
+
+    assert [(project.id, project.status) for project in upserted] == [(created.id, "failure")]
+
+@pytest.mark.asyncio
+async def test_update_and_delete_keep_ownership_scoping(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        project = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+
+        assert await repo.update(OTHER, project.id, ProjectUpdateArgs(environment_variables={"X": "1"})) is False
+        assert await repo.delete(OTHER, project.id) is False
+        assert await repo.update(OWNER, project.id, ProjectUpdateArgs(environment_variables={"X": "1"})) is True
+
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        assert (await repo.get(OWNER, project.id)).environment_variables == {"X": "1"}
+        assert await repo.delete(OWNER, project.id) is True
+        assert await repo.get(OWNER, project.id) is None
+
+@pytest.mark.asyncio
+async def test_list_page_walks_pages_with_cursor(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(5)])
+        await repo.create(OTHER, ProjectCreateArgs(repo_url="x", environment_variables={}))
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repo.list_page(OWNER, after_id=cursor, limit=2)
+            seen.extend(project.id for project in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+    assert seen == sorted(project.id for project in created)
+
+@pytest.mark.asyncio
+async def test_list_page_rejects_an_empty_limit(session_factory):
+    async with session_factory() as session:
+        with pytest.raises(ValueError):
+            await SQLAlchemyProjectRepository(session).list_page(OWNER, limit=0)
+
+@pytest.mark.asyncio
+async def test_list_page_filters_by_status(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        building = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+        await repo.upsert_many(OWNER, [building.model_copy(update={"status": "running"})])
+        await repo.create(OWNER, ProjectCreateArgs(repo_url="b", environment_variables={}))
+
+        page = await repo.list_page(OWNER, status="running")
+
+    assert [project.id for project in page.items] == [building.id]
+    assert page.next_cursor is None
+
+@pytest.mark.asyncio
+async def test_iter_all_streams_every_project(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(7)])
+
+        streamed = [project.id async for project in repo.iter_all(OWNER, batch_size=3)]
+
+    assert streamed == sorted(project.id for project in created)
+
+@pytest.mark.asyncio
+async def test_list_by_status_spans_users(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        mine = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={}))
+        theirs = await repo.create(OTHER, ProjectCreateArgs(repo_url="b", environment_variables={}))
+        await repo.upsert_many(OWNER, [mine.model_copy(update={"status": "running"})])
+
+        building = await repo.list_by_status("building")
+        running = await repo.list_by_status("running", limit=1)
+
+    assert [project.id for project in building] == [theirs.id]
+    assert [project.id for project in running] == [mine.id]
+
+@pytest.mark.asyncio
+async def test_count_by_status_groups_in_one_query(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(3)])
+        await repo.upsert_many(OWNER, [created[0].model_copy(update={"status": "failure"})])
+        await repo.create(OTHER, ProjectCreateArgs(repo_url="x", environment_variables={}))
+
+        counts = await repo.count_by_status(OWNER)
+
+    assert counts == {"building": 2, "failure": 1}
+
+def test_project_table_has_owner_and_status_indexes():
+    from core_lib.orm import ProjectORM
+
+    indexes = {index.name: [column.name for column in index.columns] for index in ProjectORM.__table__.indexes}
+
+    assert indexes["ix_projects_user_id_id"] == ["user_id", "id"]
+    assert indexes["ix_projects_status_user_id"] == ["status", "user_id"]
+
+@pytest.mark.asyncio
+async def test_read_paths_select_columns_not_entities(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={"key": "value"}))
+        session.expunge_all()
+
+        projects = await repo.get_all(OWNER)
+
+        assert projects == [created]
+        assert len(session.identity_map) == 0
+
+@pytest.mark.asyncio
+async def test_fields_limit_the_loaded_columns(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyProjectRepository(session)
+        created = await repo.create(OWNER, ProjectCreateArgs(repo_url="a", environment_variables={"key": "value"}))
+
+        [project] = await repo.get_all(OWNER, fields=["status"])
+        [streamed] = [project async for project in repo.iter_all(OWNER, fields=["status"])]
+        [building] = await repo.list_by_status("building", fields=["status"])
+
+    for partial in (project, streamed, building):
+        assert isinstance(partial, PartialProject)
+        assert partial.model_dump(exclude_unset=True) == {"id": created.id, "status": "building"}
+        assert partial.environment_variables is None
+
+@pytest.mark.asyncio
+async def test_unknown_field_is_rejected(session_factory):
+    async with session_factory() as session:
+        with pytest.raises(ValueError):
+            await SQLAlchemyProjectRepository(session).get_all(OWNER, fields=["user_id"])
+
+@pytest.mark.asyncio
+async def test_session_factory_gives_each_operation_its_own_session(session_factory):
+    repo = SQLAlchemyProjectRepository(session_factory)
+    created = await repo.create_many(OWNER, [ProjectCreateArgs(repo_url=str(i), environment_variables={}) for i in range(5)])
+
+    found = await asyncio.gather(*(repo.get(OWNER, project.id) for project in created))
+
+    assert found == created
+    assert await repo.delete(OWNER, created[0].id) is True
+    assert await repo.get(OWNER, created[0].id) is None
@@ -1,8 +1,12 @@
+import asyncio
+import uuid
 from unittest.mock import MagicMock
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
+from core_lib.repos.project.sql_alchemy import SQLAlchemyProjectRepository
 from core_lib.repos.user.sql_alchemy import SQLAlchemyUserRepository
 from core_lib.domain import User, UserUpdateArgs, UserCreateArgs
+from factories import make_project_args, make_user_args
 
 @pytest.fixture
 def mock_session(mocker):
@@ -30,11 +34,11 @@ async def test_get_user_found(repo, mocker):
         encrypted_refresh_token="encrypted_refresh_token",
         oauth_token_expires_at=None,
     )
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = mock_user
-    repo.db_session.execute.return_value = MagicMock(scalars=lambda: scalars_mock)
+    result_mock = MagicMock()
+    result_mock.first.return_value = mock_user
+    repo.db_session.execute.return_value = result_mock
 
-    result = await repo.get(user_id="123")
+    result = await repo.get(user_id=str(uuid.uuid4()))
 
     assert isinstance(result, User)
     assert result.id == "1"
@@ -48,11 +52,11 @@ async def test_get_user_found(repo, mocker):
 
 @pytest.mark.asyncio
 async def test_get_user_not_found(repo, mocker):
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = None
-    repo.db_session.execute.return_value = MagicMock(scalars=lambda: scalars_mock)
+    result_mock = MagicMock()
+    result_mock.first.return_value = None
+    repo.db_session.execute.return_value = result_mock
 
-    result = await repo.get(user_id="1")
+    result = await repo.get(user_id=str(uuid.uuid4()))
     assert result is None
 
 @pytest.mark.asyncio
@@ -101,9 +105,7 @@ async def test_create_user(repo, mocker):
 
 @pytest.mark.asyncio
 async def test_update_user_success(repo, mocker):
-    mock_user = MagicMock()
-    repo._get_orm = mocker.AsyncMock(return_value=mock_user)
-    repo.db_session.commit = mocker.AsyncMock()
+    repo.db_session.execute.return_value = MagicMock(rowcount=1)
 
     args = UserUpdateArgs(
         username="test_user",
@@ -113,20 +115,25 @@ async def test_update_user_success(repo, mocker):
         encrypted_refresh_token="encrypted_refresh_token",
     )
 
-    result = await repo.update(user_id="42", user_update_args=args)
+    result = await repo.update(user_id=str(uuid.uuid4()), user_update_args=args)
 
     assert result is True
-    assert mock_user.username == "test_user"
-    assert mock_user.email == "test@example.com"
-    assert mock_user.oauth_provider == "test_provider"
-    assert mock_user.encrypted_oauth_token == "encrypted_token"
-    assert mock_user.encrypted_refresh_token == "encrypted_refresh_token"
+    repo.db_session.execute.assert_awaited_once()
+    statement = repo.db_session.execute.await_args.args[0]
+    assert statement.is_update
+    assert {column.key: value.value for column, value in statement._values.items()} == {
+        "username": "test_user",
+        "email": "test@example.com",
+        "oauth_provider": "test_provider",
+        "encrypted_oauth_token": "encrypted_token",
+        "encrypted_refresh_token": "encrypted_refresh_token",
+    }
     repo.db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_update_user_not_found(repo, mocker):
-    repo._get_orm = mocker.AsyncMock(return_value=None)
+    repo.db_session.execute.return_value = MagicMock(rowcount=0)
 
     args = UserUpdateArgs(
         username="test_user",
@@ -137,27 +144,168 @@ async def test_update_user_not_found(repo, mocker):
         oauth_token_expires_at="2023-10-01T00:00:00Z",
     )
 
-    result = await repo.update(user_id="42", user_update_args=args)
+    result = await repo.update(user_id=str(uuid.uuid4()), user_update_args=args)
 
     assert result is False
 
 
 @pytest.mark.asyncio
 async def test_delete_user_success(repo, mocker):
-    mock_user = MagicMock()
-    repo._get_orm = mocker.AsyncMock(return_value=mock_user)
+    repo.db_session.execute.return_value = MagicMock(rowcount=1)
 
-    result = await repo.delete(user_id="99")
+    result = await repo.delete(user_id=str(uuid.uuid4()))
 
-    repo.db_session.delete.assert_awaited_once_with(mock_user)
+    statements = [call.args[0] for call in repo.db_session.execute.await_args_list]
+    assert [statement.table.name for statement in statements] == ["projects", "users"]
+    repo.db_session.delete.assert_not_called()
     repo.db_session.commit.assert_awaited_once()
     assert result is True
 
+
 @pytest.mark.asyncio
 async def test_delete_user_not_found(repo, mocker):
-    repo._get_orm = mocker.AsyncMock(return_value=None)
+    repo.db_session.execute.return_value = MagicMock(rowcount=0)
 
-    result = await repo.delete(user_id="99")
+    result = await repo.delete(user_id=str(uuid.uuid4()))
 
     repo.db_session.delete.assert_not_called()
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_get_many_users_queries_in_chunks(repo, mocker):
+    ids = [str(uuid.uuid4()) for _ in range(5)]
+    users = [
+        User(
+            id=user_id,
+            username=f"user_{i}",
+            email=None,
+            oauth_provider="test_provider",
+            encrypted_oauth_token="encrypted_token",
+            encrypted_refresh_token=None,
+            oauth_token_expires_at=None,
+        )
+        for i, user_id in enumerate(ids)
+    ]
+    results = []
+    for chunk in (users[0:2], users[2:4], users[4:5]):
+        result_mock = MagicMock()
+        result_mock.all.return_value = chunk
+        results.append(result_mock)
+    repo.db_session.execute.side_effect = results
+    repo.in_chunk_size = 2
+
+    result = await repo.get_many([*ids, ids[0], "malformed"])
+
+    assert repo.db_session.execute.await_count == 3
+    assert list(result) == ids
+
+@pytest.mark.asyncio
+async def test_get_many_users_omits_missing_ids(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+        created = await repo.create(UserCreateArgs(
+            username="test_user",
+            email="test@example.com",
+            oauth_provider="test_provider",
+            encrypted_oauth_token="encrypted_token",
+        ))
+
+        result = await repo.get_many([created.id, str(uuid.uuid4())])
+
+    assert list(result) == [created.id]
+    assert result[created.id].username == "test_user"
+
+@pytest.mark.asyncio
+async def test_create_many_users_in_one_transaction(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+        repo.insert_chunk_size = 2
+
+        created = await repo.create_many([make_user_args(i) for i in range(5)])
+
+    assert [user.username for user in created] == [f"user_{i}" for i in range(5)]
+
+    async with session_factory() as session:
+        found = await SQLAlchemyUserRepository(session).get_many(user.id for user in created)
+
+    assert len(found) == 5
+
+@pytest.mark.asyncio
+async def test_create_many_users_rolls_back_on_conflict(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+
+        with pytest.raises(Exception):
+            await repo.create_many([make_user_args(1), make_user_args(1)])
+
+    async with session_factory() as session:
+        assert await SQLAlchemyUserRepository(session).upsert_many([]) == []
+        created = await SQLAlchemyUserRepository(session).create_many([make_user_args(1)])
+
+    assert len(created) == 1
+
+@pytest.mark.asyncio
+async def test_upsert_many_users_updates_existing_username(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+        existing = await repo.create(make_user_args(1))
+
+        upserted = await repo.upsert_many([make_user_args(1, email="new@example.com"), make_user_args(2)])
+
+    by_name = {user.username: user for user in upserted}
+    assert by_name["user_1"].id == existing.id
+    assert by_name["user_1"].email == "new@example.com"
+    assert "user_2" in by_name
+
+@pytest.mark.asyncio
+async def test_upsert_many_users_keeps_the_last_row_per_username(session_factory):
+    async with session_factory() as session:
+        upserted = await SQLAlchemyUserRepository(session).upsert_many([
+            make_user_args(1, email="first@example.com"),
+            make_user_args(1, email="last@example.com"),
+        ])
+
+    assert [(user.username, user.email) for user in upserted] == [("user_1", "last@example.com")]
+
+@pytest.mark.asyncio
+async def test_get_with_projects_loads_user_and_projects_in_one_query(session_factory, mocker):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+        user = await repo.create(make_user_args(1))
+        projects = await SQLAlchemyProjectRepository(session).create_many(
+            user.id, [make_project_args(i) for i in range(3)]
+        )
+        execute = mocker.spy(session, "execute")
+
+        everything = await repo.get_with_projects(user.id)
+        limited = await repo.get_with_projects(user.id, project_limit=2)
+
+    assert execute.await_count == 2
+    assert everything.user == user
+    assert everything.projects == sorted(projects, key=lambda project: project.id)
+    assert limited.projects == everything.projects[:2]
+
+@pytest.mark.asyncio
+async def test_get_with_projects_for_user_without_projects(session_factory):
+    async with session_factory() as session:
+        repo = SQLAlchemyUserRepository(session)
+        user = await repo.create(make_user_args(1))
+
+        found = await repo.get_with_projects(user.id)
+        missing = await repo.get_with_projects(str(uuid.uuid4()))
+
+    assert found.user == user
+    assert found.projects == []
+    assert missing is None
+
+@pytest.mark.asyncio
+async def test_session_factory_gives_each_operation_its_own_session(session_factory):
+    repo = SQLAlchemyUserRepository(session_factory)
+    created = await asyncio.gather(*(repo.create(make_user_args(i)) for i in range(5)))
+
+    found = await repo.get_many(user.id for user in created)
+
+    assert set(found) == {user.id for user in created}
+    assert await repo.update(created[0].id, UserUpdateArgs(**make_user_args(9).model_dump())) is True
+    assert (await repo.get(created[0].id)).username == "user_9"
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import func, select
+from core_lib.orm import OutboxORM
+from core_lib.repos import SQLAlchemyProjectRepository, SQLAlchemyUserRepository, UnitOfWork
+from factories import make_project_args, make_user_args
+
+@pytest.mark.asyncio
+async def test_writes_commit_once_on_exit(session_factory, mocker):
+    async with UnitOfWork(session_factory, use_outbox=True) as uow:
+        commit = mocker.spy(uow.session, "commit")
+
+        user = await uow.users.create(make_user_args(1))
+        for i in range(3):
+            await uow.projects.create(user.id, make_project_args(i))
+
+        assert commit.await_count == 0
+
+    assert commit.await_count == 1
+
+    async with session_factory() as session:
+        found = await SQLAlchemyUserRepository(session).get_with_projects(user.id)
+        outbox = await session.scalar(select(func.count()).select_from(OutboxORM))
+
+    assert len(found.projects) == 3
+    assert outbox == 3
+
+@pytest.mark.asyncio
+async def test_error_rolls_back_every_write(session_factory):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session_factory) as uow:
+            user = await uow.users.create(make_user_args(1))
+            await uow.projects.create(user.id, make_project_args(1))
+            raise RuntimeError("boom")
+
+    async with session_factory() as session:
+        assert await SQLAlchemyUserRepository(session).get(user.id) is None
+
+@pytest.mark.asyncio
+async def test_repositories_outside_a_unit_of_work_still_auto_commit(session_factory):
+    user = await SQLAlchemyUserRepository(session_factory).create(make_user_args(1))
+
+    async with session_factory() as session:
+        assert await SQLAlchemyUserRepository(session).get(user.id) == user
+
+@pytest.mark.asyncio
+async def test_unit_of_work_cannot_be_entered_twice(session_factory):
+    uow = UnitOfWork(session_factory)
+
+    async with uow:
+        with pytest.raises(RuntimeError):
+            async with uow:
+                pass
+
+def test_session_factory_cannot_be_used_without_auto_commit(session_factory):
+    with pytest.raises(ValueError):
+        SQLAlchemyUserRepository(session_factory, auto_commit=False)
+
+    with pytest.raises(ValueError):
+        SQLAlchemyProjectRepository(session_factory, auto_commit=False)